@@ -0,0 +1,163 @@
+# api/batcher.py
+"""
+Asyncio micro-batcher for /predict.
+
+Concurrent requests are queued for at most `max_wait_ms` or until `max_batch_size`
+requests are waiting, whichever comes first, then run as ONE vectorized
+predict_many call (one transform, one predict_proba, one SHAP pass) on a worker
+thread. Each request awaits its own future, so callers still get one result each.
+
+Settings (env vars, read at startup):
+    MICROBATCH_MAX_SIZE      max requests per batch; <= 1 disables batching   (default: 32)
+    MICROBATCH_MAX_WAIT_MS   how long the first request waits for company     (default: 0)
+
+max_in_flight batches run at the same time (1 in-process; one per worker process
+when an InferencePool is used, see src/workers.py).
+
+With a 0 ms wait a batch is whatever queued up while the previous batch was running:
+an idle server answers a lone request immediately, a busy one batches naturally.
+
+stop() lets batches already running finish; requests still queued (or being collected)
+fail with RuntimeError("batcher stopped") instead of waiting forever.
+"""
+
+import asyncio
+import os
+from typing import Callable, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.metrics import BATCH_SIZE
+
+
+class MicroBatcher:
+    """
+    Collects submitted items into batches and resolves one future per item.
+
+    process_batch(items) runs on the thread pool and must return one result per
+    item, in order. If it raises, every item in the batch gets that exception.
+    """
+
+    def __init__(self, process_batch: Callable[[list], list], max_batch_size: int = 32,
+                 max_wait_ms: float = 0.0, max_in_flight: int = 1):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._running = set()
+        self.batches = 0
+        self.items = 0
+
+    @classmethod
+    def from_env(cls, process_batch: Callable[[list], list], max_in_flight: int = 1) -> "MicroBatcher":
+        return cls(
+            process_batch,
+            max_batch_size=int(os.getenv("MICROBATCH_MAX_SIZE", "32")),
+            max_wait_ms=float(os.getenv("MICROBATCH_MAX_WAIT_MS", "0")),
+            max_in_flight=max_in_flight
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_batch_size > 1
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._fail_queued(RuntimeError("batcher stopped"))
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+
+    @staticmethod
+    def _fail(batch: list, exc: Exception) -> None:
+        for _, fut in batch:
+            if not fut.done():
+                fut.set_exception(exc)
+
+    def _fail_queued(self, exc: Exception) -> None:
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._fail([entry], exc)
+
+    async def submit(self, item):
+        """Queue one item and wait for its result."""
+        if self._worker is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> list:
+        # block for the first item, then gather more until the deadline or the size cap
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        try:
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # stopped mid-collection: these items are already off the queue
+            self._fail(batch, RuntimeError("batcher stopped"))
+            raise
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._collect()
+            except asyncio.CancelledError:
+                self._slots.release()
+                raise
+            task = asyncio.get_running_loop().create_task(self._process(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _process(self, batch: list) -> None:
+        try:
+            # requests whose client went away are skipped
+            batch = [(item, fut) for item, fut in batch if not fut.done()]
+            if not batch:
+                return
+            items: List = [item for item, _ in batch]
+            try:
+                results = await run_in_threadpool(self.process_batch, items)
+            except Exception as e:
+                self._fail(batch, e)
+                return
+            self.batches += 1
+            self.items += len(batch)
+            BATCH_SIZE.observe(len(batch), source="microbatch")
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+        finally:
+            self._slots.release()
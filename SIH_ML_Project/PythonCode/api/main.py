@@ -1,18 +1,48 @@
 # api/main.py
 """
 FastAPI server for the AI-Enhanced Career Guidance System.
-Serves ML predictions and SHAP explanations through /predict endpoint.
+Serves ML predictions and SHAP explanations through /predict and /predict/batch endpoints.
+Model versions can be hot-swapped through /admin/reload or the models/CURRENT watcher.
+Concurrent /predict calls are micro-batched into one vectorized pass (api/batcher.py)
+and, with INFERENCE_WORKERS > 0, run on a pool of forked worker processes (src/workers.py).
+Prometheus-style metrics are served on /metrics (src/metrics.py).
+Validated request models are decoded straight into normalized rows (predict.decode_student),
+and prediction responses are serialized with orjson when it is installed.
 """
 
-from fastapi import FastAPI, HTTPException
+from typing import Optional
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
+import os
+import time
 import uvicorn
 
 # Import Pydantic schemas
-from api.schemas import StudentInput, PredictionResponse, HealthResponse
+from api.schemas import (
+    StudentInput, PredictionResponse, HealthResponse,
+    BatchStudentInput, BatchPredictionResponse,
+    ModelInfoResponse, ReloadResponse, CacheStatsResponse
+)
+
+# Prediction functions
+from src.predict import predict_single, predict_many, decode_student, decode_students
+from src.artifacts import get_store
+from src.registry import reload_model, list_versions, ModelWatcher
+from src.cache import get_prediction_cache
+from src.workers import InferencePool
+from src import metrics
+from api.batcher import MicroBatcher
+
+try:
+    import orjson  # noqa: F401  (optional: faster response serialization)
+    from fastapi.responses import ORJSONResponse as APIResponse
+except ImportError:
+    APIResponse = JSONResponse
 
-# Prediction function
-from src.predict import predict_single
+# PROFILE_REQUESTS=1: /predict returns a per-stage Server-Timing header for "X-Profile: 1" requests
+PROFILE_REQUESTS = os.getenv("PROFILE_REQUESTS", "0") == "1"
 
 
 # ============================================================
@@ -21,7 +51,8 @@ from src.predict import predict_single
 app = FastAPI(
     title="AI Career Guidance System",
     description="Predicts recommended career paths for B.Tech students using ML + SHAP explainability.",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=APIResponse
 )
 
 # CORS for MERN frontend
@@ -31,9 +62,133 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
 
+class MetricsMiddleware:
+    """Counts requests per route + status and times them (plain ASGI, no per-request task)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+        t0 = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # label by route template, never by raw path (unbounded label values)
+            route = scope.get("route")
+            endpoint = getattr(route, "path", None) or (scope["path"] if scope["path"] in _ROUTE_PATHS else "other")
+            metrics.REQUESTS.inc(endpoint=endpoint, status=str(status))
+            metrics.REQUEST_SECONDS.observe(time.perf_counter() - t0, endpoint=endpoint)
+
+
+# METRICS_ENABLED=0 leaves the middleware out entirely
+if metrics.ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+# Micro-batching for /predict: one predict_many call per batch, grouped by ?aggregate.
+# Items are (normalized row, aggregate); rows come from decode_student.
+def _predict_batch(items: list) -> list:
+    results = [None] * len(items)
+    for aggregate in (False, True):
+        idx = [i for i, (_, agg) in enumerate(items) if agg == aggregate]
+        if not idx:
+            continue
+        try:
+            if len(idx) == 1:
+                batch = [predict_single(items[idx[0]][0], aggregate=aggregate, normalized=True)]
+            else:
+                batch = predict_many([items[i][0] for i in idx], aggregate=aggregate, normalized=True)
+        except Exception:
+            # one bad row must not fail its neighbours: redo them one by one
+            batch = []
+            for i in idx:
+                try:
+                    batch.append(predict_single(items[i][0], aggregate=aggregate, normalized=True))
+                except Exception as e:
+                    batch.append(e)
+        for i, result in zip(idx, batch):
+            results[i] = result
+    return results
+
+
+# INFERENCE_WORKERS > 0: batches run on forked worker processes sharing one loaded model
+pool = InferencePool.from_env()
+
+
+def _dispatch_batch(items: list) -> list:
+    if pool is not None:
+        return pool.run(_predict_batch, items)
+    return _predict_batch(items)
+
+
+batcher = MicroBatcher.from_env(_dispatch_batch, max_in_flight=pool.n_workers if pool else 1)
+
+
+def _collect_runtime_metrics() -> list:
+    store = get_store()
+    cache = get_prediction_cache().stats()
+    return [
+        ("career_model_info", "gauge", "Model version currently served.", [({"version": store.version}, 1)]),
+        ("career_cache_hits_total", "counter", "Response cache hits.", [({}, cache["hits"])]),
+        ("career_cache_misses_total", "counter", "Response cache misses.", [({}, cache["misses"])]),
+        ("career_cache_hit_ratio", "gauge", "Response cache hit rate since start.", [({}, cache["hit_rate"])]),
+        ("career_cache_entries", "gauge", "Entries in the response cache.", [({}, cache["size"])]),
+        ("career_microbatches_total", "counter", "Micro-batches run for /predict.", [({}, batcher.batches)]),
+        ("career_microbatch_items_total", "counter", "Requests served through micro-batches.",
+         [({}, batcher.items)]),
+        ("career_inference_workers", "gauge", "Inference worker processes.",
+         [({}, len(pool.pids()) if pool is not None else 0)]),
+    ]
+
+
+metrics.add_collector(_collect_runtime_metrics)
+
+
+# Load the model when the server starts (not at import time); PRELOAD_MODEL=0 defers it
+# to the first request. MODEL_WATCH_SECONDS > 0 polls models/CURRENT for new versions.
+_watcher = None
+
+
+@app.on_event("startup")
+async def preload_model():
+    global _watcher
+    if pool is not None:
+        await run_in_threadpool(pool.start)   # loads the model, then forks the workers
+    elif os.getenv("PRELOAD_MODEL", "1") != "0":
+        await run_in_threadpool(get_store().warm_up)
+    if batcher.enabled:
+        batcher.start()
+
+    interval = float(os.getenv("MODEL_WATCH_SECONDS", "0"))
+    if interval > 0:
+        _watcher = ModelWatcher(interval=interval)
+        _watcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    if _watcher is not None:
+        _watcher.stop()
+    await batcher.stop()
+    if pool is not None:
+        await run_in_threadpool(pool.shutdown)   # lets in-flight batches finish
+
+
 # ============================================================
 # 2. HEALTH CHECK ENDPOINT
 # ============================================================
@@ -49,7 +204,7 @@ def health_check():
 # 3. MAIN PREDICTION ENDPOINT
 # ============================================================
 @app.post("/predict", response_model=PredictionResponse)
-def predict_student(data: StudentInput):
+async def predict_student(data: StudentInput, request: Request, response: Response, aggregate: bool = False):
     """
     Accepts student attributes (academics + skills + coding + GitHub + aptitude)
     Runs ML model inference
@@ -57,22 +212,35 @@ def predict_student(data: StudentInput):
         - Recommended Career Path
         - Confidence Score
         - Probability Distribution
-        - Top SHAP explanations
+        - Top SHAP explanations (per raw field when ?aggregate=true)
+    Concurrent requests are batched together (MICROBATCH_MAX_SIZE / MICROBATCH_MAX_WAIT_MS).
+    With PROFILE_REQUESTS=1, a request sent with "X-Profile: 1" runs on its own
+    (no batching / worker pool) and gets a per-stage Server-Timing header.
     """
     try:
-        user_input = data.dict()  # convert to Python dict
+        user_input = decode_student(data)  # validated model -> normalized row (no .dict() round trip)
 
         # ML prediction
-        result = predict_single(user_input)
+        headers = None
+        if PROFILE_REQUESTS and request.headers.get("x-profile") == "1":
+            result, breakdown = await run_in_threadpool(_profiled_predict, user_input, aggregate)
+            headers = {"Server-Timing": metrics.server_timing(breakdown)}
+        elif batcher.enabled:
+            result = await batcher.submit((user_input, aggregate))
+        else:
+            result = (await run_in_threadpool(_dispatch_batch, [(user_input, aggregate)]))[0]
+        if isinstance(result, Exception):
+            raise result
 
-        # Build API structured response
-        return {
+        # Build API structured response; returned as a ready Response, so FastAPI does not
+        # re-validate / re-encode it against PredictionResponse (which stays the documented schema)
+        return APIResponse({
             "status": "success",
             "prediction": result["prediction"],
             "confidence": result["confidence"],
             "probabilities": result["probabilities"],
             "explanations": result["top_explanations"]
-        }
+        }, headers=headers)
 
     except Exception as e:
         raise HTTPException(
@@ -81,8 +249,123 @@ def predict_student(data: StudentInput):
         )
 
 
+
+def _profiled_predict(user_input: dict, aggregate: bool):
+    with metrics.profile() as breakdown:
+        t0 = time.perf_counter()
+        result = predict_single(user_input, aggregate=aggregate, normalized=True)
+        breakdown["total"] = time.perf_counter() - t0
+    return result, breakdown
+
+
+# ============================================================
+# 4. BATCH PREDICTION ENDPOINT
+# ============================================================
+@app.post("/predict/batch", response_model=BatchPredictionResponse)
+def predict_students_batch(data: BatchStudentInput, aggregate: bool = False):
+    """
+    Accepts a whole cohort of students in one request.
+    Preprocessing, predict_proba and SHAP run once over the whole batch.
+    Results are returned in the same order as the input list.
+    Batches are limited to 1..MAX_BATCH_SIZE students (api/schemas.py); larger ones get a 422.
+    """
+    try:
+        user_inputs = decode_students(data.students)
+
+        metrics.BATCH_SIZE.observe(len(user_inputs), source="batch_endpoint")
+        if pool is not None:
+            results = pool.map_batches(predict_many, user_inputs, aggregate=aggregate, normalized=True)
+        else:
+            results = predict_many(user_inputs, aggregate=aggregate, normalized=True)
+
+        return APIResponse({
+            "status": "success",
+            "count": len(results),
+            "results": [
+                {
+                    "prediction": r["prediction"],
+                    "confidence": r["confidence"],
+                    "probabilities": r["probabilities"],
+                    "explanations": r["top_explanations"]
+                }
+                for r in results
+            ]
+        })
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"🔥 Batch Prediction Failed: {str(e)}"
+        )
+
+
+# ============================================================
+# 5. ADMIN: MODEL VERSION + HOT RELOAD
+# ============================================================
+def _check_admin(token: Optional[str]) -> None:
+    expected = os.getenv("ADMIN_TOKEN")
+    if expected and token != expected:
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+
+
+def _reload_in_background(version: Optional[str]) -> None:
+    try:
+        reload_model(version)
+    except Exception as e:  # old model keeps serving
+        print(f"⚠️ Model reload failed: {e}")
+
+
+@app.get("/admin/model", response_model=ModelInfoResponse)
+def model_info(x_admin_token: Optional[str] = Header(default=None)):
+    _check_admin(x_admin_token)
+    store = get_store()
+    manifest = store.manifest or {}
+    return {
+        "status": "ok",
+        "version": store.version,
+        "created_at": manifest.get("created_at"),
+        "metrics": {k: v for k, v in manifest.get("metrics", {}).items() if isinstance(v, (int, float))},
+        "available_versions": list_versions()
+    }
+
+
+@app.post("/admin/reload", response_model=ReloadResponse, status_code=202)
+def reload_model_version(background_tasks: BackgroundTasks, version: Optional[str] = None,
+                         x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Load `version` (default: models/CURRENT) in the background, verify its hashes and
+    swap it in atomically. In-flight requests finish on the model they started with.
+    """
+    _check_admin(x_admin_token)
+    background_tasks.add_task(_reload_in_background, version)
+    return {
+        "status": "accepted",
+        "active_version": get_store().version,
+        "target_version": version or "CURRENT"
+    }
+
+
+@app.get("/admin/cache", response_model=CacheStatsResponse)
+def cache_stats(x_admin_token: Optional[str] = Header(default=None)):
+    """Response cache size + hit/miss counters (PREDICT_CACHE_SIZE / PREDICT_CACHE_TTL)."""
+    _check_admin(x_admin_token)
+    return {"status": "ok", **get_prediction_cache().stats()}
+
+
+# ============================================================
+# 6. METRICS
+# ============================================================
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Prometheus text exposition format (scrape target)."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+_ROUTE_PATHS = {route.path for route in app.routes}
+
+
 # ============================================================
-# 4. RUN SERVER (DEV MODE)
+# 7. RUN SERVER (DEV MODE)
 # ============================================================
 if __name__ == "__main__":
     uvicorn.run(
@@ -4,8 +4,13 @@ Pydantic request + response schemas for AI Career Guidance (B.Tech Version)
 Updated to match NEW dataset fields.
 """
 
-from pydantic import BaseModel
-from typing import Dict, List
+import os
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+# Upper bound on students per /predict/batch request (every row is encoded and explained)
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
 
 
 # -------------------------------------------------------------
@@ -55,9 +60,59 @@ class PredictionResponse(BaseModel):
     explanations: List[ExplanationItem]
 
 
+# -------------------------------------------------------------
+# BATCH REQUEST / RESPONSE MODELS
+# -------------------------------------------------------------
+class BatchStudentInput(BaseModel):
+    students: List[StudentInput] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class PredictionItem(BaseModel):
+    prediction: str
+    confidence: float
+    probabilities: Dict[str, float]
+    explanations: List[ExplanationItem]
+
+
+class BatchPredictionResponse(BaseModel):
+    status: str
+    count: int
+    results: List[PredictionItem]
+
+
 # -------------------------------------------------------------
 # HEALTH CHECK MODEL
 # -------------------------------------------------------------
 class HealthResponse(BaseModel):
     status: str
     message: str
+
+
+# -------------------------------------------------------------
+# ADMIN MODELS
+# -------------------------------------------------------------
+class ModelInfoResponse(BaseModel):
+    status: str
+    version: str
+    created_at: Optional[str] = None
+    metrics: Dict[str, float]
+    available_versions: List[str]
+
+
+class ReloadResponse(BaseModel):
+    status: str
+    active_version: str
+    target_version: str
+
+
+class CacheStatsResponse(BaseModel):
+    status: str
+    enabled: bool
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    invalidations: int
@@ -0,0 +1,65 @@
+# benchmarks/bench_api.py
+"""
+End-to-end request time for /predict and /predict/batch through an in-process ASGI client
+(httpx.ASGITransport: routing, request validation, model, response serialization; no sockets).
+
+Requests are sent one after another (no concurrency), so each number is the full cost of one
+request. The response cache is disabled; payloads are labeled-CSV rows in the StudentInput
+layout (benchmarks/bench_microbatch.load_payloads).
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_api [batch sizes, default 32,256]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+os.environ["PREDICT_CACHE_SIZE"] = "0"
+
+import httpx
+
+from benchmarks.bench_microbatch import load_payloads
+
+MIN_SECONDS = 3.0
+
+
+async def measure(client, path: str, bodies: list, min_seconds: float = MIN_SECONDS) -> list:
+    r = await client.post(path, json=bodies[0])   # warm-up
+    r.raise_for_status()
+    times, i, t_end = [], 0, time.perf_counter() + min_seconds
+    while time.perf_counter() < t_end or len(times) < 5:
+        body = bodies[i % len(bodies)]
+        t0 = time.perf_counter()
+        r = await client.post(path, json=body)
+        times.append(time.perf_counter() - t0)
+        r.raise_for_status()
+        i += 1
+    return times
+
+
+def report(name: str, times: list, rows: int) -> None:
+    ms = sorted(t * 1e3 for t in times)
+    p50 = statistics.median(ms)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    print(f"{name:<22} {len(ms):>6} {p50:>9.2f}ms {p99:>9.2f}ms {p50 * 1e3 / rows:>11.0f}us")
+
+
+async def main(batch_sizes: list) -> None:
+    from api.main import app
+
+    payloads = load_payloads(max(batch_sizes + [500]))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'endpoint':<22} {'calls':>6} {'p50':>11} {'p99':>11} {'p50 per row':>13}")
+        report("/predict", await measure(client, "/predict", payloads), 1)
+        for n in batch_sizes:
+            bodies = [{"students": payloads[i:i + n]} for i in range(0, len(payloads) - n + 1, n)]
+            report(f"/predict/batch x{n}", await measure(client, "/predict/batch", bodies), n)
+
+
+if __name__ == "__main__":
+    sizes = [int(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "32,256").split(",")]
+    asyncio.run(main(sizes))
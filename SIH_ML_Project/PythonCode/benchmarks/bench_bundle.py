@@ -0,0 +1,115 @@
+# benchmarks/bench_bundle.py
+"""
+joblib Pipeline vs pickle-free inference bundle (src/bundle.py), each in a fresh interpreter:
+
+    cold start   imports + loading the artifacts until the first row can be scored
+    first call   the first predict_proba (one row)
+    peak RSS     ru_maxrss after the timing loops
+    1 row        encode + predict_proba, one cleaned-key dict
+    1000 rows    encode + predict_proba, one batch
+
+joblib path: ArtifactStore.pipeline + label_encoder + RowEncoder -> XGBClassifier.predict_proba
+bundle path: load_bundle (bundle.json + model.ubj) -> Booster.inplace_predict
+
+A model is trained on the real workbook and published to a temp registry (nothing in
+models/ is touched), unless a version directory holding both formats is given.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_bundle [version dir]
+"""
+
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUNS = 3
+
+
+def per_call_ms(fn, n: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e3
+
+
+def child(mode: str, version_dir: str, rows_path: str) -> None:
+    t0 = time.perf_counter()
+    if mode == "joblib":
+        from src.artifacts import ArtifactStore
+        store = ArtifactStore(version_dir)
+        encoder, clf = store.row_encoder, store.classifier
+        store.label_encoder
+
+        def score(rows):
+            return clf.predict_proba(encoder.encode_many(rows))
+    else:
+        from src.bundle import load_bundle
+        model = load_bundle(version_dir)
+        score = model.predict_proba
+    cold = time.perf_counter() - t0
+
+    with open(rows_path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    t0 = time.perf_counter()
+    score(rows[:1])
+    first = time.perf_counter() - t0
+
+    one, batch = rows[:1], rows[:1000]
+    result = {
+        "cold_s": cold,
+        "first_ms": first * 1e3,
+        "row_ms": per_call_ms(lambda: score(one), 500),
+        "batch_ms": per_call_ms(lambda: score(batch), 20),
+        "modules": [m for m in ("sklearn", "pandas") if m in sys.modules],
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    print(json.dumps(result))
+
+
+def train_version(tmp: str) -> str:
+    from src.train_model import TrainConfig, train
+
+    result = train(TrainConfig(models_dir=str(Path(tmp) / "models"), cache_dir=str(Path(tmp) / "cache"),
+                               shap_explainer=False, export_csv=None, verbose=False))
+    return str(Path(tmp) / "models" / "versions" / result.version)
+
+
+def write_rows(path: Path, n: int = 1000) -> None:
+    from benchmarks.synthetic import synthetic_students
+    from src.predict import normalize_input_any
+    from src.preprocess import RAW_TO_CLEAN
+
+    records = synthetic_students(n, seed=0).to_dict("records")
+    rows = [normalize_input_any({RAW_TO_CLEAN.get(k, k): v for k, v in r.items()}) for r in records]
+    path.write_text(json.dumps(rows, default=float), encoding="utf-8")
+
+
+def run_child(mode: str, version_dir: str, rows_path: str) -> dict:
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bench_bundle", "--child", mode, version_dir, rows_path],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:5])
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        version_dir = sys.argv[1] if len(sys.argv) > 1 else train_version(tmp)
+        rows_path = str(Path(tmp) / "rows.json")
+        write_rows(Path(rows_path))
+        print(f"model: {version_dir}  (median of {RUNS} fresh interpreters)")
+        print(f"{'path':<8} {'cold start':>11} {'first call':>11} {'peak RSS':>9} {'1 row':>9} {'1000 rows':>10}  imported")
+        for mode in ("joblib", "bundle"):
+            runs = [run_child(mode, version_dir, rows_path) for _ in range(RUNS)]
+            med = {k: statistics.median(r[k] for r in runs) for k in ("cold_s", "first_ms", "peak_rss_mb",
+                                                                        "row_ms", "batch_ms")}
+            print(f"{mode:<8} {med['cold_s'] * 1e3:>9.0f}ms {med['first_ms']:>9.2f}ms {med['peak_rss_mb']:>7.0f}MB "
+                  f"{med['row_ms']:>7.3f}ms {med['batch_ms']:>8.2f}ms  {', '.join(runs[0]['modules']) or '-'}")
@@ -0,0 +1,103 @@
+# benchmarks/bench_encoders.py
+"""
+Encoding variants for the training ColumnTransformer: transformed width, fit time,
+pickled artifact size, per-request inference latency and SHAP cost. Trained on the
+labeled CSV with the train_model.py XGBoost settings.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_encoders
+"""
+
+import io
+import time
+import joblib
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+
+from src.encoders import build_preprocessor, FRAMEWORKS_COL, HIGH_CARDINALITY_COLS
+from src.explain import compute_contributions
+from src.predict import normalize_input_any
+from src.preprocess import build_row_encoder
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+
+FW = dict(frameworks_encoding="multihot", frameworks_max_tokens=32, frameworks_min_count=5)
+VARIANTS = {
+    "legacy one-hot everywhere": dict(frameworks_encoding="onehot", text_encoding="onehot"),
+    "frameworks multi-hot (uncapped)": dict(frameworks_encoding="multihot", text_encoding="onehot"),
+    "frameworks multi-hot (32 tokens, min 5)": dict(FW, text_encoding="onehot"),
+    "+ history capped one-hot (min 5)": dict(FW, text_encoding="capped", text_min_frequency=5),
+    "+ history hashed (64 buckets)": dict(FW, text_encoding="hash", text_n_buckets=64),
+}
+
+
+def block_widths(pre) -> dict:
+    """Output columns per raw field (FeatureIndex-style grouping of the fitted transformer)."""
+    widths = {}
+    for _, t, cols in pre.transformers_:
+        if t == "drop" or not len(cols):
+            continue
+        for out in t.get_feature_names_out(cols):
+            field = max((c for c in cols if out == c or out.startswith(f"{c}_")), key=len)
+            widths[field] = widths.get(field, 0) + 1
+    return widths
+
+
+def run(name: str, options: dict, X: pd.DataFrame, y: np.ndarray) -> None:
+    numeric_cols = [c for c in X.columns if pd.api.types.is_numeric_dtype(X[c])]
+    categorical_cols = [c for c in X.columns if c not in numeric_cols]
+
+    pre = build_preprocessor(numeric_cols, categorical_cols, **options)
+    t0 = time.perf_counter()
+    Xt = pre.fit_transform(X)
+    t_pre = time.perf_counter() - t0
+
+    pipeline = Pipeline([
+        ("pre", build_preprocessor(numeric_cols, categorical_cols, **options)),
+        ("clf", xgb.XGBClassifier(n_estimators=250, max_depth=6, learning_rate=0.05, subsample=0.9,
+                                  colsample_bytree=0.9, eval_metric="mlogloss", random_state=42)),
+    ])
+    t0 = time.perf_counter()
+    pipeline.fit(X, y)
+    t_fit = time.perf_counter() - t0
+
+    buffer = io.BytesIO()
+    joblib.dump(pipeline, buffer)
+
+    # per-request inference: RowEncoder (or pandas fallback) + predict_proba + SHAP
+    fitted_pre, clf = pipeline.named_steps["pre"], pipeline.named_steps["clf"]
+    encoder = build_row_encoder(fitted_pre)
+    sample = normalize_input_any(X.iloc[0].to_dict())
+
+    def encode():
+        if encoder is not None:
+            return encoder.encode(sample)
+        return fitted_pre.transform(X.iloc[:1])
+
+    t_infer, t_shap = [], []
+    for _ in range(50):
+        t0 = time.perf_counter()
+        row = encode()
+        clf.predict_proba(row)
+        t1 = time.perf_counter()
+        compute_contributions(pipeline, row)
+        t_infer.append(t1 - t0)
+        t_shap.append(time.perf_counter() - t1)
+
+    widths = block_widths(pre)
+    print(f"{name}")
+    print(f"   width={Xt.shape[1]:5d}  '{FRAMEWORKS_COL}'={widths[FRAMEWORKS_COL]}  "
+          f"'{HIGH_CARDINALITY_COLS[0]}'={widths[HIGH_CARDINALITY_COLS[0]]}  "
+          f"artifact={buffer.tell() / 1024:7.1f} KiB")
+    print(f"   pre.fit_transform={t_pre * 1e3:7.1f} ms  pipeline.fit={t_fit:6.2f} s  "
+          f"predict/request={np.median(t_infer) * 1e3:6.2f} ms  SHAP/request={np.median(t_shap) * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(DATA_PATH)
+    y = LabelEncoder().fit_transform(df.pop("Recommended Career"))
+    for name, options in VARIANTS.items():
+        run(name, options, df, y)
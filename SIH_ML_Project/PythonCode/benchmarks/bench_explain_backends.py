@@ -0,0 +1,63 @@
+# benchmarks/bench_explain_backends.py
+"""
+Parity + latency check for the SHAP backends in src/explain.py:
+    native -> Booster.predict(DMatrix, pred_contribs=True)
+    shap   -> shap.TreeExplainer (models/shap_explainer.pkl if shipped, else built from the pipeline)
+
+Parity is checked over the whole labeled CSV; exits non-zero on mismatch
+(tests/test_explain.py checks the same on a freshly fitted tiny model).
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_explain_backends
+"""
+
+import subprocess
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from src.artifacts import get_store
+from src.explain import compute_contributions
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+ATOL = 1e-4  # both backends work in float32 margin space
+
+
+def best_of(fn, repeats: int = 50) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times) * 1e3
+
+
+if __name__ == "__main__":
+    pipeline = get_store().pipeline
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"])
+    X = pipeline.named_steps["pre"].transform(df)
+
+    native = compute_contributions(pipeline, X, backend="native")
+    reference = compute_contributions(pipeline, X, backend="shap")
+
+    max_diff = float(np.max(np.abs(native - reference)))
+    print(f"parity over {X.shape[0]} rows x {X.shape[1]} features x {native.shape[0]} classes: "
+          f"max |native - shap| = {max_diff:.2e}")
+
+    row = X[:1]
+    for name in ("native", "shap"):
+        single = best_of(lambda: compute_contributions(pipeline, row, backend=name))
+        full = best_of(lambda: compute_contributions(pipeline, X, backend=name), repeats=3)
+        print(f"{name:<7} 1 row: {single:8.3f} ms   {X.shape[0]} rows: {full:9.1f} ms")
+
+    # fresh interpreter: the shap backend above has already imported shap in this process
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import shap"], check=True)
+    t_shap = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    t_bare = time.perf_counter() - t0
+    print(f"'import shap' cost avoided at API startup: {(t_shap - t_bare) * 1e3:.0f} ms")
+
+    sys.exit(0 if max_diff <= ATOL else 1)
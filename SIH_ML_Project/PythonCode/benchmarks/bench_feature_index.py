@@ -0,0 +1,56 @@
+# benchmarks/bench_feature_index.py
+"""
+Explanation post-processing cost: per-request pipeline introspection + full argsort (old)
+vs the cached FeatureIndex + argpartition (new), on SHAP values for the labeled CSV.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_feature_index
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from src.artifacts import get_store
+from src.explain import compute_contributions, extract_feature_names_from_pipeline, _top_k_indices
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TOP_K = 7
+
+pipeline = get_store().pipeline
+feature_index = get_store().feature_index
+
+
+def old_top_k(row_values: np.ndarray) -> list:
+    names = extract_feature_names_from_pipeline(pipeline)
+    idx = np.argsort(np.abs(row_values))[::-1][:TOP_K]
+    return [names[i] for i in idx]
+
+
+def new_top_k(row_values: np.ndarray) -> list:
+    idx = _top_k_indices(row_values[None], TOP_K)[0]
+    return [feature_index.names[i] for i in idx]
+
+
+def per_call_us(fn, rows: np.ndarray) -> float:
+    t0 = time.perf_counter()
+    for r in rows:
+        fn(r)
+    return (time.perf_counter() - t0) / len(rows) * 1e6
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).head(500)
+    X = pipeline.named_steps["pre"].transform(df)
+    values = compute_contributions(pipeline, X)[0]
+
+    same = sum(old_top_k(r) == new_top_k(r) for r in values)
+    print(f"identical top-{TOP_K} on {same}/{len(values)} rows")
+
+    print(f"old (introspect + argsort):     {per_call_us(old_top_k, values):8.1f} us/request")
+    print(f"new (FeatureIndex + partition): {per_call_us(new_top_k, values):8.1f} us/request")
+
+    t0 = time.perf_counter()
+    agg = feature_index.aggregate(values)
+    print(f"aggregate {values.shape} -> {agg.shape} in {(time.perf_counter() - t0) * 1e3:.2f} ms; "
+          f"sums preserved: {np.allclose(agg.sum(axis=1), values.sum(axis=1), atol=1e-4)}")
@@ -0,0 +1,67 @@
+# benchmarks/bench_forest.py
+"""
+FlatForest (pure-NumPy, src/forest.py) parity + latency against XGBoost.
+
+Parity: FlatForest.predict_proba must match XGBClassifier.predict_proba within 1e-6 on
+every row of the labeled CSV (same argmax too). Exits non-zero otherwise.
+
+Latency per call on already-encoded rows, at several batch sizes:
+    XGBClassifier.predict_proba    what predict.py calls with PREDICT_SCORER=xgboost
+    Booster.inplace_predict        PREDICT_SCORER=auto (no sklearn wrapper, no DMatrix)
+    FlatForest.predict_proba       PREDICT_SCORER=numpy
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_forest [batch sizes, default 1,4,8,32,1024]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import get_store
+from src.forest import FlatForest
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TOLERANCE = 1e-6
+
+
+def per_call_ms(fn, budget_s: float = 1.0, max_calls: int = 2000) -> float:
+    fn()
+    calls, t0 = 0, time.perf_counter()
+    while calls < max_calls and time.perf_counter() - t0 < budget_s:
+        fn()
+        calls += 1
+    return (time.perf_counter() - t0) / calls * 1e3
+
+
+if __name__ == "__main__":
+    sizes = [int(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "1,4,8,32,1024").split(",")]
+    store = get_store()
+    clf = store.classifier
+    booster = clf.get_booster()
+
+    t0 = time.perf_counter()
+    forest = FlatForest.from_booster(booster)
+    build_ms = (time.perf_counter() - t0) * 1e3
+    print(f"🌲 {len(forest.roots)} trees, {len(forest.feature)} nodes, depth {forest.max_depth}, "
+          f"flattened in {build_ms:.0f} ms")
+
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career", "Name"], errors="ignore")
+    X = store.preprocessor.transform(df).tocsr()
+    reference, ours = clf.predict_proba(X), forest.predict_proba(X)
+    diff = float(np.abs(reference - ours).max())
+    same_argmax = bool((reference.argmax(1) == ours.argmax(1)).all())
+    if diff > TOLERANCE or not same_argmax:
+        print(f"❌ max |Δp| = {diff:.2e}, same argmax: {same_argmax}")
+        sys.exit(1)
+    print(f"✅ max |Δp| = {diff:.2e} over {X.shape[0]} rows (tolerance {TOLERANCE:g}), same argmax")
+
+    print(f"\n{'batch':>6} {'predict_proba':>14} {'inplace':>10} {'FlatForest':>11} {'vs predict_proba':>17}")
+    for n in sizes:
+        Xb = X[np.arange(n) % X.shape[0]]
+        t_clf = per_call_ms(lambda: clf.predict_proba(Xb))
+        t_inplace = per_call_ms(lambda: booster.inplace_predict(Xb))
+        t_forest = per_call_ms(lambda: forest.predict_proba(Xb))
+        print(f"{n:>6} {t_clf:>12.3f}ms {t_inplace:>8.3f}ms {t_forest:>9.3f}ms {t_clf / t_forest:>16.2f}x")
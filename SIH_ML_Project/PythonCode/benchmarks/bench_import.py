@@ -0,0 +1,26 @@
+# benchmarks/bench_import.py
+"""
+Cost of `import api.main` in a fresh interpreter (what every uvicorn worker pays at startup).
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_import
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 5
+
+
+def fresh(code: str) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    bare = statistics.median(fresh("pass") for _ in range(RUNS))
+    api = statistics.median(fresh("import api.main") for _ in range(RUNS))
+    print(f"import api.main: {(api - bare) * 1e3:8.0f} ms (median of {RUNS}, interpreter start subtracted)")
@@ -0,0 +1,85 @@
+# benchmarks/bench_labeling.py
+"""
+Vectorized labeling (generate_careers) vs row-wise df.apply(generate_career, axis=1).
+
+Parity: identical labels on the shipped Excel workbook, the labeled CSV and a
+synthetic sample. Throughput: 1M synthetic rows (the row-wise path is timed on a
+100k slice and reported as rows/sec). Exits non-zero on any label mismatch.
+tests/test_labeling.py runs the same parity check (plus edge rows) under pytest.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_labeling
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from src.labeling import to_num, generate_career, generate_careers
+
+XLSX_PATH = "data/BTech_Student_DatasetFinalOk.xlsx"
+CSV_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+N_SYNTHETIC = 1_000_000
+N_ROWWISE = 100_000
+
+JITTER_COLS = {
+    "CGPA": 0.5, "Data Structures And Algorithm Marks": 8, "DBMS Marks": 8,
+    "GitHub total repositories": 2, "GitHub commits/month": 3,
+    "Coding practice hours/week": 3, "Aptitude score": 8, "Attandance": 8,
+    "Number of backlogs": 1, "Number of Reappears": 1,
+}
+
+
+def synthetic(base: pd.DataFrame, n: int) -> pd.DataFrame:
+    """Resample real rows and jitter the numeric fields so every threshold gets exercised."""
+    rng = np.random.default_rng(0)
+    df = base.sample(n=n, replace=True, random_state=0).reset_index(drop=True)
+    for col, sd in JITTER_COLS.items():
+        df[col] = np.round(df[col].to_numpy() + rng.normal(0, sd, n), 1)
+    return df
+
+
+def check(name: str, df: pd.DataFrame) -> bool:
+    rowwise = df.apply(generate_career, axis=1)
+    vectorized = generate_careers(df)
+    ok = rowwise.equals(vectorized)
+    print(f"{'✅' if ok else '❌'} {name}: {len(df)} rows, "
+          f"{int((rowwise != vectorized).sum())} mismatches")
+    return ok
+
+
+if __name__ == "__main__":
+    xlsx = pd.read_excel(XLSX_PATH)
+    xlsx.columns = [c.strip() for c in xlsx.columns]
+    xlsx = xlsx.drop(columns=["Name"], errors="ignore")
+    for col in JITTER_COLS:
+        xlsx[col] = xlsx[col].apply(to_num)
+
+    csv = pd.read_csv(CSV_PATH)
+    stored = csv.pop("Recommended Career")
+
+    ok = check("Excel workbook", xlsx)
+    ok &= check("labeled CSV", csv)
+    same_as_stored = generate_careers(csv).equals(stored.rename("Recommended Career"))
+    print(f"{'✅' if same_as_stored else '❌'} labeled CSV: matches the stored 'Recommended Career' column")
+    ok &= same_as_stored
+    ok &= check("synthetic", synthetic(csv, 20_000))
+
+    big = synthetic(csv, N_SYNTHETIC)
+
+    t0 = time.perf_counter()
+    generate_careers(big)
+    t_vec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    big.head(N_ROWWISE).apply(generate_career, axis=1)
+    t_row = time.perf_counter() - t0
+
+    vec_rps = N_SYNTHETIC / t_vec
+    row_rps = N_ROWWISE / t_row
+    print(f"generate_careers: {N_SYNTHETIC} rows in {t_vec:6.2f} s ({vec_rps:12,.0f} rows/s)")
+    print(f"df.apply:         {N_ROWWISE} rows in {t_row:6.2f} s ({row_rps:12,.0f} rows/s)  "
+          f"-> ~{N_SYNTHETIC / row_rps:.0f} s for {N_SYNTHETIC} rows, {vec_rps / row_rps:.0f}x slower")
+
+    sys.exit(0 if ok else 1)
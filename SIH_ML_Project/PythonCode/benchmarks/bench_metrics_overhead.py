@@ -0,0 +1,57 @@
+# benchmarks/bench_metrics_overhead.py
+"""
+Cost of the stage timers: predict_single (cache off) with METRICS_ENABLED=1 vs 0,
+plus the raw cost of one stage() block in each mode. Each mode runs in its own
+interpreter because the flag is read at import time.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_metrics_overhead
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+N = 2000
+
+
+def measure() -> dict:
+    from src.metrics import stage
+    from src.predict import predict_single
+    from benchmarks.bench_predict_single import SAMPLE
+
+    for _ in range(50):
+        predict_single(SAMPLE, use_cache=False)
+    times = np.empty(N)
+    for i in range(N):
+        t0 = time.perf_counter()
+        predict_single(SAMPLE, use_cache=False)
+        times[i] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(100_000):
+        with stage("bench"):
+            pass
+    stage_ns = (time.perf_counter() - t0) / 100_000 * 1e9
+
+    return {"p50_ms": float(np.percentile(times, 50) * 1e3), "mean_ms": float(times.mean() * 1e3),
+            "stage_ns": stage_ns}
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        print(json.dumps(measure()))
+        sys.exit(0)
+
+    for flag in ("0", "1"):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_metrics_overhead", "--child"],
+            env={**os.environ, "METRICS_ENABLED": flag}, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        r = json.loads(out)
+        print(f"METRICS_ENABLED={flag}: predict_single p50={r['p50_ms']:.3f} ms  mean={r['mean_ms']:.3f} ms  "
+              f"one stage() block={r['stage_ns']:.0f} ns")
@@ -0,0 +1,166 @@
+# benchmarks/bench_microbatch.py
+"""
+Load test for /predict micro-batching (response cache disabled throughout).
+
+Default (in-process): closed-loop asyncio users call the same code path as the
+/predict handler, run_in_threadpool(predict_single) vs MicroBatcher.submit(), so the
+numbers show the model-side effect without HTTP client overhead.
+
+--http: starts the API with uvicorn (one worker) per config and drives it with an
+httpx load generator. On a small box the Python client itself saturates the CPU
+before the server does, so use a separate machine for meaningful HTTP numbers.
+
+Reports throughput and p50/p99 latency at several concurrency levels.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_microbatch [--http]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+PORT = 8765
+URL = f"http://127.0.0.1:{PORT}"
+CONCURRENCY = [1, 8, 32, 64]
+DURATION = 5.0          # seconds per concurrency level
+CONFIGS = [
+    ("no batching", {"MICROBATCH_MAX_SIZE": "1"}),
+    ("batch<=32, 0ms", {"MICROBATCH_MAX_SIZE": "32", "MICROBATCH_MAX_WAIT_MS": "0"}),
+    ("batch<=32, 2ms", {"MICROBATCH_MAX_SIZE": "32", "MICROBATCH_MAX_WAIT_MS": "2"}),
+    ("batch<=64, 5ms", {"MICROBATCH_MAX_SIZE": "64", "MICROBATCH_MAX_WAIT_MS": "5"}),
+]
+os.environ["PREDICT_CACHE_SIZE"] = "0"
+
+# CSV column -> API field (StudentInput)
+API_FIELDS = {
+    "Gender": "Gender", "Age": "Age", "CGPA": "CGPA",
+    "Matriculation Percentage": "Matriculation_Percentage",
+    "Intermediate Percentage": "Intermediate_Percentage",
+    "Data Structures And Algorithm Marks": "Data_Structures_And_Algorithm_Marks",
+    "DBMS Marks": "DBMS_Marks", "Number of backlogs": "Number_of_backlogs",
+    "Number of Reappears": "Number_of_Reappears",
+    "History of Reappear/Backlogs": "History_of_Reappears_Backlogs",
+    "Programming proficiency": "Programming_proficiency",
+    "GitHub total repositories": "GitHub_total_repositories",
+    "GitHub commits/month": "GitHub_commits_per_month",
+    "Experience with frameworks": "Experience_with_frameworks",
+    "English proficiency": "English_proficiency",
+    "Coding practice hours/week": "Coding_practice_hours_per_week",
+    "Aptitude score": "Aptitude_score", "Attandance": "Attandance",
+}
+INT_FIELDS = {"Age", "Number_of_backlogs", "Number_of_Reappears",
+              "GitHub_total_repositories", "GitHub_commits_per_month"}
+
+
+def load_payloads(n: int = 500) -> list:
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).fillna("").head(n)
+    payloads = []
+    for row in df.to_dict(orient="records"):
+        p = {API_FIELDS[k]: v for k, v in row.items() if k in API_FIELDS}
+        for k in INT_FIELDS:
+            p[k] = int(p[k])
+        payloads.append(p)
+    return payloads
+
+
+def start_server(env: dict) -> subprocess.Popen:
+    full_env = {**os.environ, **env}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=full_env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    for _ in range(300):
+        try:
+            if httpx.get(f"{URL}/health", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+async def closed_loop(call, payloads: list, concurrency: int, duration: float) -> tuple:
+    """`concurrency` users each awaiting call(payload) back to back for `duration` seconds."""
+    latencies, errors = [], 0
+    stop_at = time.perf_counter() + duration
+
+    async def user(u: int):
+        nonlocal errors
+        i = u
+        while time.perf_counter() < stop_at:
+            t0 = time.perf_counter()
+            if not await call(payloads[i % len(payloads)]):
+                errors += 1
+            latencies.append(time.perf_counter() - t0)
+            i += concurrency
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(user(u) for u in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    ms = np.array(latencies) * 1e3
+    return len(ms) / elapsed, np.percentile(ms, 50), np.percentile(ms, 99), errors
+
+
+async def run_http_level(payloads: list, concurrency: int, duration: float) -> tuple:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=URL, limits=limits, timeout=30) as client:
+        async def call(payload):
+            return (await client.post("/predict", json=payload)).status_code == 200
+        return await closed_loop(call, payloads, concurrency, duration)
+
+
+async def run_inprocess(payloads: list, env: dict) -> list:
+    from starlette.concurrency import run_in_threadpool
+    from api.batcher import MicroBatcher
+    from api.main import _predict_batch
+    from src.predict import predict_single, normalize_input_any
+
+    batcher = MicroBatcher(_predict_batch, int(env["MICROBATCH_MAX_SIZE"]),
+                           float(env.get("MICROBATCH_MAX_WAIT_MS", 0)))
+    if batcher.enabled:
+        batcher.start()
+
+        async def call(payload):
+            # the /predict handler hands the batcher decoded (normalized) rows
+            return not isinstance(await batcher.submit((normalize_input_any(payload), False)), Exception)
+    else:
+        async def call(payload):
+            return bool(await run_in_threadpool(predict_single, payload))
+
+    await closed_loop(call, payloads, 4, 1.0)   # warm-up
+    rows = [await closed_loop(call, payloads, c, DURATION) for c in CONCURRENCY]
+    await batcher.stop()
+    return rows
+
+
+def report(rows: list) -> None:
+    for c, (rps, p50, p99, errors) in zip(CONCURRENCY, rows):
+        print(f"concurrency={c:<3d} {rps:8.1f} req/s   p50={p50:7.1f} ms   p99={p99:7.1f} ms"
+              + (f"   errors={errors}" if errors else ""))
+
+
+if __name__ == "__main__":
+    payloads = load_payloads()
+    http = "--http" in sys.argv
+    for name, env in CONFIGS:
+        print(f"\n== {name} ==")
+        if not http:
+            report(asyncio.run(run_inprocess(payloads, env)))
+            continue
+        proc = start_server(env)
+        try:
+            asyncio.run(run_http_level(payloads, 4, 1.0))   # warm-up
+            report([asyncio.run(run_http_level(payloads, c, DURATION)) for c in CONCURRENCY])
+        finally:
+            proc.terminate()
+            proc.wait()
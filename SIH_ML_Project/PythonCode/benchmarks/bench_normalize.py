@@ -0,0 +1,106 @@
+# benchmarks/bench_normalize.py
+"""
+normalize_input_any: precompiled alias table vs the previous per-field probing.
+
+Parity: over the labeled CSV with raw, cleaned, lower-cased and padded keys, shuffled key order
+and duplicated spellings, the alias table returns exactly what the per-field probing did
+(except the History_of_Reappears_Backlogs spelling from api/schemas.py, which the old code
+dropped to the default and is now read). Absent text fields default to None (missing) in both.
+normalize_columns must equal the row-wise results.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_normalize
+"""
+
+import random
+import sys
+import time
+
+import pandas as pd
+
+from src.predict import COLUMN_MAP, normalize_columns, normalize_input_any
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+
+_NUMERIC = {
+    "Age", "CGPA", "Matriculation_Percentage", "Intermediate_Percentage",
+    "Data_Structures_And_Algorithm_Marks", "DBMS_Marks",
+    "Number_of_backlogs", "Number_of_Reappears",
+    "GitHub_total_repositories", "GitHub_commits_per_month",
+    "Coding_practice_hours_per_week", "Aptitude_score", "Attandance"
+}
+
+
+def reference(input_dict: dict) -> dict:
+    """The per-field probing normalize_input_any used before the alias table."""
+    out = {}
+    lowered = {str(k).strip().lower(): v for k, v in input_dict.items()}
+    for clean_key, raw_key in COLUMN_MAP.items():
+        if clean_key in input_dict:
+            out[clean_key] = input_dict[clean_key]
+        elif raw_key in input_dict:
+            out[clean_key] = input_dict[raw_key]
+        elif raw_key.lower() in lowered:
+            out[clean_key] = lowered[raw_key.lower()]
+        elif clean_key.lower() in lowered:
+            out[clean_key] = lowered[clean_key.lower()]
+        else:
+            out[clean_key] = 0 if clean_key in _NUMERIC else None
+    return out
+
+
+def variants(raw_rows: list, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    out = []
+    for row in raw_rows:
+        items = []
+        for clean, raw in COLUMN_MAP.items():
+            if clean not in row and raw not in row:
+                continue
+            value = row.get(raw, row.get(clean))
+            r = rng.random()
+            if r < 0.1:
+                continue                                  # field left out
+            name = rng.choice([clean, raw, raw.lower(), f" {clean.upper()} ", clean.lower()])
+            items.append((name, value))
+            if r > 0.9:
+                items.append((rng.choice([clean, raw, raw.upper()]), f"dup-{value}"))   # two spellings
+        items.append(("Name", "x"))
+        rng.shuffle(items)
+        out.append(dict(items))
+    return out
+
+
+def per_row_us(fn, rows: list) -> float:
+    t0 = time.perf_counter()
+    fn(rows)
+    return (time.perf_counter() - t0) / len(rows) * 1e6
+
+
+if __name__ == "__main__":
+    raw_rows = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).to_dict(orient="records")
+    mixed = variants(raw_rows)
+    clean_rows = [{c: r[raw] for c, raw in COLUMN_MAP.items()} for r in raw_rows]
+
+    for name, rows in (("raw keys", raw_rows), ("cleaned keys", clean_rows), ("mixed spellings", mixed)):
+        for i, row in enumerate(rows):
+            if normalize_input_any(row) != reference(row):
+                print(f"❌ {name}: mismatch at row {i}")
+                sys.exit(1)
+    columns = normalize_columns(mixed)
+    if [dict(zip(columns, vals)) for vals in zip(*columns.values())] != [normalize_input_any(r) for r in mixed]:
+        print("❌ normalize_columns differs from normalize_input_any")
+        sys.exit(1)
+    schema_row = {("History_of_Reappears_Backlogs" if c == "History_of_Reappear_Backlogs" else c): v
+                  for c, v in clean_rows[0].items()}
+    assert normalize_input_any(schema_row)["History_of_Reappear_Backlogs"] == clean_rows[0]["History_of_Reappear_Backlogs"]
+    print(f"✅ identical to the per-field probing on {3 * len(raw_rows)} rows; schema spelling resolved")
+
+    rows = (raw_rows * 8)[:20_000]
+    print(f"\n{'input':<16} {'probing':>10} {'alias table':>12} {'columns':>9}")
+    for name, data in (("raw keys", rows), ("cleaned keys", (clean_rows * 8)[:20_000]),
+                       ("mixed spellings", (mixed * 8)[:20_000])):
+        t_ref = per_row_us(lambda rs: [reference(r) for r in rs], data)
+        t_new = per_row_us(lambda rs: [normalize_input_any(r) for r in rs], data)
+        t_col = per_row_us(normalize_columns, data)
+        print(f"{name:<16} {t_ref:>8.2f}us {t_new:>10.2f}us {t_col:>7.2f}us")
@@ -0,0 +1,50 @@
+# benchmarks/bench_predict_batch.py
+"""
+Throughput benchmark: predict_many (one vectorized pass) vs looping predict_single.
+Rows are resampled from the labeled CSV to 1k and 10k students.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_predict_batch
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from src.predict import predict_single, predict_many
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+SIZES = [1_000, 10_000]
+LOOP_CAP = 1_000  # looping predict_single is slow: time at most this many rows, report rows/sec
+
+
+def load_rows(n: int) -> list:
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).fillna("")
+    return df.sample(n=n, replace=True, random_state=0).to_dict(orient="records")
+
+
+if __name__ == "__main__":
+    check = load_rows(50)
+    batch = predict_many(check)
+    for row, res in zip(check, batch):
+        single = predict_single(row)
+        assert single["prediction"] == res["prediction"]
+        assert np.isclose(single["confidence"], res["confidence"])
+
+    for n in SIZES:
+        rows = load_rows(n)
+
+        t0 = time.perf_counter()
+        predict_many(rows)
+        t_batch = time.perf_counter() - t0
+
+        loop_rows = rows[:LOOP_CAP]
+        t0 = time.perf_counter()
+        for r in loop_rows:
+            predict_single(r)
+        t_loop = time.perf_counter() - t0
+
+        batch_rps = n / t_batch
+        loop_rps = len(loop_rows) / t_loop
+        print(f"n={n:>6}  predict_many: {t_batch:7.2f} s ({batch_rps:9.0f} rows/s)   "
+              f"loop predict_single: {loop_rps:7.0f} rows/s   speedup {batch_rps / loop_rps:6.1f}x")
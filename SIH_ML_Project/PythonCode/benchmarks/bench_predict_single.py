@@ -0,0 +1,75 @@
+# benchmarks/bench_predict_single.py
+"""
+Micro-benchmark: per-request latency of predict_single on the bundled career_model.pkl.
+Compares the old three-pass path (predict + predict_proba + pre.transform)
+against the fused single-transform / single-forest-pass path.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_predict_single
+"""
+
+import time
+import numpy as np
+
+from src.artifacts import get_store
+from src.predict import predict_single, normalize_input_any
+from src.preprocess import preprocess_input
+from src.explain import get_shap_explanations
+
+SAMPLE = {
+    "Gender": "Female",
+    "Age": 20,
+    "CGPA": 7.9,
+    "Matriculation_Percentage": 82,
+    "Intermediate_Percentage": 80,
+    "Data_Structures_And_Algorithm_Marks": 70,
+    "DBMS_Marks": 65,
+    "Number_of_backlogs": 1,
+    "Number_of_Reappears": 0,
+    "History_of_Reappear_Backlogs": "Yes",
+    "Programming_proficiency": "Intermediate",
+    "GitHub_total_repositories": 1,
+    "GitHub_commits_per_month": 1,
+    "Experience_with_frameworks": "Django",
+    "English_proficiency": "Average",
+    "Coding_practice_hours_per_week": 4,
+    "Aptitude_score": 60,
+    "Attandance": 85
+}
+
+
+def three_pass(input_dict: dict) -> dict:
+    """The pre-fusion inference path, kept here only as a baseline."""
+    pipeline, reverse_label_map = get_store().pipeline, get_store().reverse_label_map
+    df = preprocess_input(normalize_input_any(input_dict))
+    pred_encoded = int(pipeline.predict(df)[0])
+    probs = pipeline.predict_proba(df)[0]
+    df_preprocessed = pipeline.named_steps["pre"].transform(df)
+    explanations = get_shap_explanations(pipeline, df_preprocessed, pred_encoded, top_k=7)
+    return {"prediction": reverse_label_map[pred_encoded], "probs": probs, "top_explanations": explanations}
+
+
+def timeit(fn, n: int = 300, warmup: int = 20) -> np.ndarray:
+    for _ in range(warmup):
+        fn(SAMPLE)
+    times = np.empty(n)
+    for i in range(n):
+        t0 = time.perf_counter()
+        fn(SAMPLE)
+        times[i] = time.perf_counter() - t0
+    return times * 1e3
+
+
+def report(name: str, ms: np.ndarray) -> None:
+    print(f"{name:<12} p50={np.percentile(ms, 50):7.3f} ms  "
+          f"p99={np.percentile(ms, 99):7.3f} ms  mean={ms.mean():7.3f} ms")
+
+
+if __name__ == "__main__":
+    assert three_pass(SAMPLE)["prediction"] == predict_single(SAMPLE)["prediction"]
+
+    old = timeit(three_pass)
+    new = timeit(predict_single)
+    report("three-pass", old)
+    report("fused", new)
+    print(f"speedup (p50): {np.percentile(old, 50) / np.percentile(new, 50):.2f}x")
@@ -0,0 +1,95 @@
+# benchmarks/bench_prediction_cache.py
+"""
+Response cache: replay a synthetic /predict request log with a realistic resubmit pattern
+through predict_single with and without the PredictionCache, plus a batch re-score
+that contains duplicate rows through predict_many.
+
+Request log (seeded):
+    60% a student seen for the first time (row from the labeled CSV)
+    30% an exact resubmit of one of the last 50 requests
+    10% a resubmit of a recent request with one numeric field nudged (cache miss)
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_prediction_cache
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from src.artifacts import get_store
+from src.cache import PredictionCache, set_prediction_cache
+from src.predict import predict_single, predict_many
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+N_REQUESTS = 3000
+RECENT_WINDOW = 50
+NUDGE_FIELDS = ["CGPA", "Aptitude score", "Coding practice hours/week", "Attandance"]
+
+
+def build_request_log(rows: list, n: int, seed: int = 7) -> list:
+    rng = np.random.default_rng(seed)
+    log, next_new = [], 0
+    for _ in range(n):
+        r = rng.random()
+        if not log or r < 0.6:
+            log.append(rows[next_new % len(rows)])
+            next_new += 1
+            continue
+        recent = log[-RECENT_WINDOW:]
+        base = recent[rng.integers(len(recent))]
+        if r < 0.9:
+            log.append(base)
+        else:
+            edited = dict(base)
+            field = NUDGE_FIELDS[rng.integers(len(NUDGE_FIELDS))]
+            edited[field] = float(edited[field]) + 1
+            log.append(edited)
+    return log
+
+
+def replay(log: list, use_cache: bool) -> tuple:
+    times, results = np.empty(len(log)), []
+    for i, request in enumerate(log):
+        t0 = time.perf_counter()
+        results.append(predict_single(request, use_cache=use_cache))
+        times[i] = time.perf_counter() - t0
+    return times * 1e3, results
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"])
+    df["Experience with frameworks"] = df["Experience with frameworks"].fillna("")
+    rows = df.to_dict(orient="records")
+    log = build_request_log(rows, N_REQUESTS)
+    distinct = len({tuple(sorted(r.items())) for r in log})
+    print(f"replay log: {len(log)} requests, {distinct} distinct "
+          f"({1 - distinct / len(log):.0%} duplicates)")
+
+    get_store().warm_up()
+    cache = PredictionCache(max_size=1024, ttl=600)
+    set_prediction_cache(cache)
+
+    base_ms, base_results = replay(log, use_cache=False)
+    cached_ms, cached_results = replay(log, use_cache=True)
+    assert cached_results == base_results, "cached responses differ from uncached ones"
+
+    for name, ms in (("uncached", base_ms), ("cached", cached_ms)):
+        print(f"{name:<9} total={ms.sum():8.0f} ms  p50={np.percentile(ms, 50):6.3f} ms  "
+              f"p90={np.percentile(ms, 90):6.3f} ms  mean={ms.mean():6.3f} ms")
+    stats = cache.stats()
+    print(f"hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits / {stats['misses']} misses, "
+          f"{stats['evictions']} evictions); speedup (total): {base_ms.sum() / cached_ms.sum():.2f}x")
+
+    # batch re-score: 1000 rows, 250 of them repeated within the batch
+    batch = rows[:750] + rows[:250]
+    cache.invalidate()
+    t0 = time.perf_counter()
+    cold = predict_many(batch)             # duplicates scored once, results cached
+    t_cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    warm = predict_many(batch)             # every row answered from the cache
+    t_warm = time.perf_counter() - t0
+    assert cold == warm
+    print(f"predict_many 1000 rows (750 distinct): cold {t_cold * 1e3:.0f} ms, "
+          f"re-score from cache {t_warm * 1e3:.0f} ms")
@@ -0,0 +1,42 @@
+# benchmarks/bench_row_encoder.py
+"""
+RowEncoder latency against the pandas path (preprocess_input + pre.transform).
+
+Bit-for-bit parity with pipeline.named_steps["pre"].transform over the whole labeled CSV
+is checked by tests/test_row_encoder.py.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_row_encoder
+"""
+
+import time
+
+import pandas as pd
+
+from src.artifacts import get_store
+from src.predict import normalize_input_any
+from src.preprocess import preprocess_input, RowEncoder
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+
+
+if __name__ == "__main__":
+    preprocessor = get_store().preprocessor
+    encoder = RowEncoder(preprocessor)
+
+    rows = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).to_dict(orient="records")
+    normalized = [normalize_input_any(r) for r in rows]
+
+    sample = normalized[0]
+    n = 2000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        preprocessor.transform(preprocess_input(sample))
+    t_pandas = (time.perf_counter() - t0) / n * 1e6
+    t0 = time.perf_counter()
+    for _ in range(n):
+        encoder.encode(sample)
+    t_encoder = (time.perf_counter() - t0) / n * 1e6
+
+    print(f"preprocess_input + pre.transform: {t_pandas:8.1f} us/row")
+    print(f"RowEncoder.encode:                {t_encoder:8.1f} us/row   ({t_pandas / t_encoder:.0f}x)")
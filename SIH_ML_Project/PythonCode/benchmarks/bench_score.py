@@ -0,0 +1,53 @@
+# benchmarks/bench_score.py
+"""
+Bulk scoring (src/score.py): throughput and peak RSS against cohort size.
+Each run is its own interpreter so ru_maxrss (parent + children) is per run; peak memory
+should stay flat as the file grows, since only chunk_rows x (chunks in flight) rows are held.
+
+Synthetic CSVs (benchmarks/synthetic.py) are written to a temp dir and scored with the
+active model into Parquet.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_score [sizes, default 5000,20000] [chunk rows, default 5000] [workers, default 0]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_stream_train import write_csv
+from benchmarks.synthetic import parse_size
+
+
+def child(path: str, chunk_rows: int, workers: int) -> None:
+    from src.score import score_file
+
+    stats = score_file(path, str(Path(path).with_suffix(".scored.parquet")), chunk_rows=chunk_rows,
+                       workers=workers, verbose=False)
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    print(json.dumps({**stats, "peak_rss_mb": rss / 1024}))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        sys.exit(0)
+
+    sizes = [parse_size(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "5000,20000").split(",")]
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    print(f"chunk rows {chunk_rows}, workers {workers}")
+    print(f"{'rows':>9} {'csv MB':>8} {'seconds':>8} {'rows/s':>8} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = Path(tmp) / f"cohort_{n}.csv"
+            write_csv(n, path)
+            out = subprocess.run([sys.executable, "-m", "benchmarks.bench_score", "--child", str(path),
+                                  str(chunk_rows), str(workers)], capture_output=True, text=True, check=True)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{n:>9} {path.stat().st_size / 2**20:>8.1f} {r['seconds']:>8.1f} {r['rows_per_second']:>8.0f} "
+                  f"{r['peak_rss_mb']:>12.0f}")
@@ -0,0 +1,63 @@
+# benchmarks/bench_stream_train.py
+"""
+Peak RSS and wall time of in-memory train() vs out-of-core streaming (chunk_rows)
+against dataset size. Every run is its own interpreter so ru_maxrss is per run.
+Synthetic CSVs (benchmarks/synthetic.py) are written to a temp dir; nothing is published.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_stream_train [sizes, default 20000,100000,300000] [chunk rows, default 20000]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import parse_size, synthetic_students
+
+ROUNDS = 20   # training time grows linearly with rounds; peak memory does not
+
+
+def child(path: str, chunk_rows: int) -> None:
+    from src.train_model import TrainConfig, train
+
+    config = TrainConfig(data_path=path, cache_dir=str(Path(path).parent), chunk_rows=chunk_rows or None,
+                         tree_method="hist", xgb_params={"n_estimators": ROUNDS},
+                         publish=False, export_csv=None, verbose=False)
+    t0 = time.perf_counter()
+    result = train(config)
+    print(json.dumps({"seconds": time.perf_counter() - t0,
+                      "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                      "accuracy": result.metrics["accuracy"]}))
+
+
+def write_csv(n: int, path: Path, block: int = 100_000) -> None:
+    # written in blocks so the parent's own footprint stays small
+    for i, start in enumerate(range(0, n, block)):
+        synthetic_students(min(block, n - start), seed=i).to_csv(path, mode="w" if i == 0 else "a",
+                                                                  header=i == 0, index=False)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]))
+        sys.exit(0)
+
+    sizes = [parse_size(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "20000,100000,300000").split(",")]
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    print(f"{'rows':>9} {'csv MB':>8} {'mode':<18} {'seconds':>8} {'peak RSS MB':>12} {'accuracy':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = Path(tmp) / f"synthetic_{n}.csv"
+            write_csv(n, path)
+            size_mb = path.stat().st_size / 2**20
+            for mode, rows in (("in-memory", 0), (f"stream {chunk_rows}", chunk_rows)):
+                out = subprocess.run([sys.executable, "-m", "benchmarks.bench_stream_train", "--child",
+                                      str(path), str(rows)], capture_output=True, text=True, check=True)
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                print(f"{n:>9} {size_mb:>8.1f} {mode:<18} {r['seconds']:>8.1f} {r['peak_rss_mb']:>12.0f} "
+                      f"{r['accuracy']:>9.4f}")
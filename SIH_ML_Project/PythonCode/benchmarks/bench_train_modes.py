@@ -0,0 +1,69 @@
+# benchmarks/bench_train_modes.py
+"""
+Current training settings vs TrainConfig.fast() (hist + all cores + early stopping):
+fit time, boosting rounds kept, test accuracy and model-call latency
+(predict_proba and native SHAP, one row and a 1000-row batch).
+
+Runs on the real workbook and on a synthetic table (benchmarks/synthetic.py).
+Nothing is published; stage caches go to a temp dir.
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_train_modes [synthetic rows: 10k, 100k, 20000 ...; default 20000]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import xgboost as xgb
+
+from benchmarks.synthetic import synthetic_students, parse_size
+from src.train_model import TrainConfig, train, ingest, label, split
+
+REAL_DATA = "data/BTech_Student_DatasetFinalOk.xlsx"
+
+
+def per_call_ms(fn, n: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e3
+
+
+def inference(result, config) -> dict:
+    X_train, X_test, *_ = split(label(ingest(config), config), config)
+    Xt = result.pipeline.named_steps["pre"].transform(X_test.head(1000))
+    clf = result.pipeline.named_steps["clf"]
+    booster = clf.get_booster()
+    row = Xt[:1]
+    return {
+        "proba_1_ms": per_call_ms(lambda: clf.predict_proba(row), 300),
+        "proba_1000_ms": per_call_ms(lambda: clf.predict_proba(Xt), 10),
+        "shap_1_ms": per_call_ms(lambda: booster.predict(xgb.DMatrix(row), pred_contribs=True), 100),
+    }
+
+
+def run(label_: str, data_path: str, cache_dir: str) -> None:
+    common = dict(data_path=data_path, cache_dir=cache_dir, publish=False, export_csv=None, verbose=False)
+    print(f"\n📊 {label_}")
+    print(f"{'mode':<10} {'fit s':>8} {'rounds':>7} {'accuracy':>9} {'proba 1':>9} {'proba 1000':>11} {'shap 1':>8}")
+    for name, config in (("current", TrainConfig(**common)), ("fast", TrainConfig.fast(**common))):
+        result = train(config)
+        lat = inference(result, config)
+        m = result.metrics
+        print(f"{name:<10} {m['fit_seconds']:>8.2f} {m['n_rounds']:>7} {m['accuracy']:>9.4f} "
+              f"{lat['proba_1_ms']:>7.3f}ms {lat['proba_1000_ms']:>9.2f}ms {lat['shap_1_ms']:>6.3f}ms")
+        if "best_iteration" in m:
+            print(f"{'':<10} best round {m['best_iteration']} of {m['rounds_trained']} trained "
+                  f"(validation rows: {m['n_validation']})")
+
+
+if __name__ == "__main__":
+    n = parse_size(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"real workbook ({REAL_DATA})", REAL_DATA, tmp)
+        synthetic_path = str(Path(tmp) / f"synthetic_{n}.csv")
+        synthetic_students(n, seed=0).to_csv(synthetic_path, index=False)
+        run(f"synthetic, {n} rows", synthetic_path, tmp)
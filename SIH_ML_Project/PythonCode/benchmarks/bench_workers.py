@@ -0,0 +1,82 @@
+# benchmarks/bench_workers.py
+"""
+Scaling of the fork-after-load InferencePool: throughput and memory for 1..8 workers.
+
+Throughput: micro-batches of BATCH rows are kept queued on every worker for DURATION
+seconds (predict_many, response cache off).
+Memory: RSS double-counts pages shared by fork, so PSS (proportional set size from
+/proc/<pid>/smaps_rollup, Linux) is summed over the parent + workers and compared with
+N independent processes that each unpickle the model (N x one loaded process).
+
+Run from the PythonCode directory:
+    python -m benchmarks.bench_workers
+"""
+
+import os
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+
+import pandas as pd
+
+os.environ["PREDICT_CACHE_SIZE"] = "0"
+
+from src.artifacts import get_store  # noqa: E402
+from src.predict import predict_many  # noqa: E402
+from src.workers import InferencePool  # noqa: E402
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+WORKERS = [1, 2, 4, 8]
+BATCH = 16
+DURATION = 5.0
+
+
+def memory_kb(pid: int) -> dict:
+    out = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                out[parts[0][:-1].lower()] = int(parts[1])
+    return out
+
+
+def throughput(pool: InferencePool, rows: list) -> float:
+    executor = pool._current_executor()
+    chunks = [rows[i:i + BATCH] for i in range(0, len(rows) - BATCH, BATCH)]
+    done_rows, i = 0, 0
+    pending = set()
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < DURATION:
+        while len(pending) < 2 * pool.n_workers:
+            pending.add(executor.submit(predict_many, chunks[i % len(chunks)]))
+            i += 1
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        done_rows += sum(len(f.result()) for f in finished)
+    wait(pending)
+    return done_rows / (time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    rows = pd.read_csv(DATA_PATH).drop(columns=["Recommended Career"]).fillna("").to_dict(orient="records")
+
+    get_store().warm_up()
+    predict_many(rows[:BATCH])
+    one_process = memory_kb(os.getpid())
+    print(f"cores: {os.cpu_count()}   one loaded process: RSS {one_process['rss'] / 1024:.0f} MB")
+    print(f"{'workers':>7}  {'rows/s':>8}  {'sum RSS':>9}  {'sum PSS':>9}  {'N copies':>9}")
+
+    done_rows, t0 = 0, time.perf_counter()
+    while time.perf_counter() - t0 < DURATION:
+        done_rows += len(predict_many(rows[done_rows % 2000:done_rows % 2000 + BATCH]))
+    print(f"{'in-proc':>7}  {done_rows / (time.perf_counter() - t0):8.0f}  "
+          f"{one_process['rss'] / 1024:7.0f} MB  {one_process['pss'] / 1024:7.0f} MB  {'-':>9}")
+
+    for n in WORKERS:
+        pool = InferencePool(n).start()
+        rate = throughput(pool, rows)
+        pids = [os.getpid()] + pool.pids()
+        mem = [memory_kb(p) for p in pids]
+        rss = sum(m["rss"] for m in mem) / 1024
+        pss = sum(m["pss"] for m in mem) / 1024
+        print(f"{n:>7}  {rate:8.0f}  {rss:7.0f} MB  {pss:7.0f} MB  {n * one_process['rss'] / 1024:7.0f} MB")
+        pool.shutdown()
@@ -0,0 +1,334 @@
+# benchmarks/suite.py
+"""
+Offline benchmark suite for training and serving, with JSON results and regression checks.
+
+All inputs are synthetic (benchmarks/synthetic.py); serving benchmarks use the model the
+API would serve (src/artifacts.get_store). Every case is timed several times and the
+median is kept.
+
+    python -m benchmarks.suite run [--sizes 1k,100k,1m] [--only predict,shap] [--out results.json]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.10]
+
+compare exits with status 1 if any case got slower than baseline by more than the
+threshold (default 10%), so it can gate CI.
+
+Cases (size = rows in the synthetic table):
+    normalize_input_any     per-row cost over `size` rows (capped at 20k)
+    preprocess_input        per-row DataFrame path (capped at 2k: ~7 ms/row)
+    row_encoder             per-row compiled encoder (capped at 20k)
+    predict_proba_single    one-row predict_proba, repeated
+    predict_proba_batch     one predict_proba over the whole table
+    shap_single / shap_batch   native TreeSHAP, one row / whole table (batch capped at 10k: ~2.5 ms/row)
+    api_predict             POST /predict end-to-end through the in-process ASGI client (capped at 1k)
+    labeling                generate_careers over the whole table
+    train                   full src.train_model.train() run from a CSV of the table: ingest, label,
+                            split, encode, fit, evaluate (no publish, no SHAP explainer, no bundle).
+                            Above TRAIN_STREAM_ROWS rows it trains out-of-core (TrainConfig.chunk_rows),
+                            the way train_model --chunk-rows would be run on a file that size.
+                            Per-stage seconds are stored with the result.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+os.environ.setdefault("PREDICT_CACHE_SIZE", "0")     # measure the model, not the response cache
+os.environ.setdefault("MICROBATCH_MAX_SIZE", "1")
+os.environ.setdefault("PRELOAD_MODEL", "1")
+
+from benchmarks.synthetic import synthetic_students, parse_size  # noqa: E402
+
+DEFAULT_SIZES = "1k,100k"
+TRAIN_STREAM_ROWS = 100_000
+DEFAULT_THRESHOLD = 0.10
+MIN_REPEATS = 3
+MIN_SECONDS = 1.0
+
+
+# -------------------------------------------------------------
+# TIMING
+# -------------------------------------------------------------
+def timed(fn, min_repeats: int = MIN_REPEATS, min_seconds: float = MIN_SECONDS, warmup: bool = True) -> dict:
+    """Run fn() at least `min_repeats` times and at least `min_seconds`; median + spread."""
+    if warmup:
+        fn()
+    runs = []
+    started = time.perf_counter()
+    while len(runs) < min_repeats or (time.perf_counter() - started < min_seconds and len(runs) < 1000):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    runs = np.array(runs)
+    return {"seconds": float(np.median(runs)), "min": float(runs.min()), "max": float(runs.max()),
+            "repeats": len(runs)}
+
+
+def per_row(result: dict, rows: int) -> dict:
+    result["rows"] = rows
+    result["us_per_row"] = result["seconds"] / rows * 1e6
+    result["rows_per_second"] = rows / result["seconds"] if result["seconds"] else None
+    return result
+
+
+# -------------------------------------------------------------
+# CASES
+# -------------------------------------------------------------
+def _raw_records(df, cap: int) -> list:
+    return df.head(cap).fillna("").to_dict(orient="records")
+
+
+def case_normalize_input_any(df, n):
+    from src.predict import normalize_input_any
+    rows = _raw_records(df, min(n, 20_000))
+    return per_row(timed(lambda: [normalize_input_any(r) for r in rows], min_repeats=1), len(rows))
+
+
+def case_preprocess_input(df, n):
+    from src.predict import normalize_input_any
+    from src.preprocess import preprocess_input
+    rows = [normalize_input_any(r) for r in _raw_records(df, min(n, 2_000))]
+    return per_row(timed(lambda: [preprocess_input(r) for r in rows], min_repeats=1), len(rows))
+
+
+def case_row_encoder(df, n):
+    from src.artifacts import get_store
+    from src.predict import normalize_input_any
+    encoder = get_store().row_encoder
+    if encoder is None:
+        return None
+    rows = [normalize_input_any(r) for r in _raw_records(df, min(n, 20_000))]
+    return per_row(timed(lambda: [encoder.encode(r) for r in rows], min_repeats=1), len(rows))
+
+
+def _matrix(df):
+    from src.artifacts import get_store
+    return get_store().preprocessor.transform(df)
+
+
+def case_predict_proba_single(df, n):
+    from src.artifacts import get_store
+    X = _matrix(df.head(200))
+    classifier = get_store().classifier
+    rows = [X[i] for i in range(X.shape[0])]
+    return per_row(timed(lambda: [classifier.predict_proba(r) for r in rows]), len(rows))
+
+
+def case_predict_proba_batch(df, n):
+    from src.artifacts import get_store
+    X = _matrix(df)
+    classifier = get_store().classifier
+    return per_row(timed(lambda: classifier.predict_proba(X)), X.shape[0])
+
+
+def case_shap_single(df, n):
+    from src.artifacts import get_store
+    from src.explain import compute_contributions
+    X = _matrix(df.head(100))
+    pipeline = get_store().pipeline
+    rows = [X[i] for i in range(X.shape[0])]
+    return per_row(timed(lambda: [compute_contributions(pipeline, r) for r in rows]), len(rows))
+
+
+def case_shap_batch(df, n):
+    from src.artifacts import get_store
+    from src.explain import compute_contributions
+    X = _matrix(df.head(min(n, 10_000)))
+    pipeline = get_store().pipeline
+    return per_row(timed(lambda: compute_contributions(pipeline, X), min_repeats=1), X.shape[0])
+
+
+# CSV column -> StudentInput field
+API_FIELDS = {
+    "Matriculation Percentage": "Matriculation_Percentage",
+    "Intermediate Percentage": "Intermediate_Percentage",
+    "Data Structures And Algorithm Marks": "Data_Structures_And_Algorithm_Marks",
+    "DBMS Marks": "DBMS_Marks", "Number of backlogs": "Number_of_backlogs",
+    "Number of Reappears": "Number_of_Reappears",
+    "History of Reappear/Backlogs": "History_of_Reappears_Backlogs",
+    "Programming proficiency": "Programming_proficiency",
+    "GitHub total repositories": "GitHub_total_repositories",
+    "GitHub commits/month": "GitHub_commits_per_month",
+    "Experience with frameworks": "Experience_with_frameworks",
+    "English proficiency": "English_proficiency",
+    "Coding practice hours/week": "Coding_practice_hours_per_week",
+    "Aptitude score": "Aptitude_score",
+}
+INT_FIELDS = ("Age", "Number_of_backlogs", "Number_of_Reappears",
+              "GitHub_total_repositories", "GitHub_commits_per_month")
+
+
+def case_api_predict(df, n):
+    from fastapi.testclient import TestClient
+    import api.main
+
+    payloads = []
+    for r in _raw_records(df, min(n, 1_000)):
+        p = {API_FIELDS.get(k, k): v for k, v in r.items()}
+        for k in INT_FIELDS:
+            p[k] = int(p[k])
+        payloads.append(p)
+
+    with TestClient(api.main.app) as client:
+        def run():
+            for p in payloads:
+                if client.post("/predict", json=p).status_code != 200:
+                    raise RuntimeError("/predict failed during benchmark")
+        return per_row(timed(run, min_repeats=1), len(payloads))
+
+
+def case_labeling(df, n):
+    from src.labeling import generate_careers
+    return per_row(timed(lambda: generate_careers(df)), len(df))
+
+
+def case_train(df, n):
+    import tempfile
+    from pathlib import Path
+    from src.train_model import TrainConfig, train
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"students_{len(df)}.csv"
+        df.to_csv(path, index=False)
+        # default model + encoding settings; nothing is written outside the temp dir
+        config = TrainConfig(data_path=str(path), cache_dir=None, export_csv=None, publish=False,
+                             shap_explainer=False, inference_bundle=False, verbose=False,
+                             chunk_rows=TRAIN_STREAM_ROWS if len(df) > TRAIN_STREAM_ROWS else None)
+        result = per_row(timed(lambda: runs.append(train(config)), min_repeats=1, min_seconds=0, warmup=False),
+                         len(df))
+    result["mode"] = "streaming" if config.chunk_rows else "in-memory"
+    result["stage_seconds"] = {k: round(v, 3) for k, v in runs[-1].timings.items()}
+    return result
+
+
+CASES = {
+    "normalize_input_any": case_normalize_input_any,
+    "preprocess_input": case_preprocess_input,
+    "row_encoder": case_row_encoder,
+    "predict_proba_single": case_predict_proba_single,
+    "predict_proba_batch": case_predict_proba_batch,
+    "shap_single": case_shap_single,
+    "shap_batch": case_shap_batch,
+    "api_predict": case_api_predict,
+    "labeling": case_labeling,
+    "train": case_train,
+}
+
+# cases whose work does not depend on the table size run only once (at the smallest size)
+SIZE_INDEPENDENT = {"predict_proba_single", "shap_single"}
+# effective caps, so the same capped workload is not timed twice under different keys
+CAPS = {"normalize_input_any": 20_000, "preprocess_input": 2_000, "row_encoder": 20_000,
+        "shap_batch": 10_000, "api_predict": 1_000}
+
+
+# -------------------------------------------------------------
+# RUN / COMPARE
+# -------------------------------------------------------------
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(sizes: list, only: list = None, seed: int = 0) -> dict:
+    results = {}
+    names = [c for c in CASES if not only or c in only]
+    sizes = sorted({parse_size(s) for s in sizes})
+    done = set()
+    for n in sizes:
+        df = synthetic_students(n, seed=seed)
+        for name in names:
+            if name in SIZE_INDEPENDENT and n != sizes[0]:
+                continue
+            effective = min(n, CAPS.get(name, n))
+            if (name, effective) in done:
+                continue
+            done.add((name, effective))
+            key = name if name in SIZE_INDEPENDENT else f"{name}[{effective}]"
+            print(f"⏱  {key} ...", flush=True)
+            result = CASES[name](df, n)
+            if result is None:
+                print("   skipped")
+                continue
+            results[key] = result
+            print(f"   {result['seconds'] * 1e3:10.2f} ms   {result['us_per_row']:10.2f} us/row")
+    return {"meta": _meta(), "results": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Print a table of median-time ratios; returns the number of regressions."""
+    base, cur = baseline["results"], current["results"]
+    regressions = 0
+    print(f"{'case':<32} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key in sorted(set(base) | set(cur)):
+        if key not in base or key not in cur:
+            print(f"{key:<32} {'-' if key not in base else 'present':>12} "
+                  f"{'-' if key not in cur else 'present':>12}")
+            continue
+        b, c = base[key]["seconds"], cur[key]["seconds"]
+        ratio = c / b if b else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ❌ REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  ✅ faster"
+        print(f"{key:<32} {b * 1e3:10.2f}ms {c * 1e3:10.2f}ms {ratio:7.2f}{flag}")
+    print(f"\n{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Career model benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="run benchmarks and write JSON results")
+    p_run.add_argument("--sizes", default=DEFAULT_SIZES, help="comma list: 1k,100k,1m or row counts")
+    p_run.add_argument("--only", default="", help=f"comma list of cases: {','.join(CASES)}")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--out", default="benchmarks/results.json")
+
+    p_cmp = sub.add_parser("compare", help="compare two result files")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help="relative slowdown that counts as a regression (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        only = [c for c in args.only.split(",") if c]
+        unknown = set(only) - set(CASES)
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+        report = run(args.sizes.split(","), only=only, seed=args.seed)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 results → {args.out}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    return 1 if compare(baseline, current, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# benchmarks/synthetic.py
+"""
+Synthetic student tables for benchmarks, drawn from the column distributions of
+data/BTech_Student_Dataset_with_labels.csv (no network, fully seeded).
+
+    numeric columns      inverse empirical CDF (linear interpolation between quantiles),
+                         rounded like the source column (ints stay ints)
+    categorical / text   sampled with the observed value frequencies, missing rate included
+
+Columns are sampled independently, so joint structure is not preserved; the rows are
+meant for timing, not for model quality. Labels come from generate_careers when asked.
+
+    python -m benchmarks.synthetic 100000 out.csv
+"""
+
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+SOURCE_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def parse_size(size) -> int:
+    """'1k' / '100k' / '1m' / '2500' -> number of rows."""
+    if isinstance(size, int):
+        return size
+    size = str(size).lower()
+    return SIZES[size] if size in SIZES else int(size)
+
+
+@lru_cache(maxsize=1)
+def _source() -> pd.DataFrame:
+    return pd.read_csv(SOURCE_PATH).drop(columns=[TARGET])
+
+
+def _decimals(values: np.ndarray) -> int:
+    for d in range(4):
+        if np.allclose(values, np.round(values, d)):
+            return d
+    return 4
+
+
+def synthetic_students(n: int, seed: int = 0, with_labels: bool = False) -> pd.DataFrame:
+    """n synthetic rows with the raw (Excel) column names and dtypes of the source CSV."""
+    n = parse_size(n)
+    src = _source()
+    rng = np.random.default_rng(seed)
+    out = {}
+
+    for col in src.columns:
+        values = src[col]
+        if pd.api.types.is_numeric_dtype(values):
+            observed = values.dropna().to_numpy(dtype=np.float64)
+            sample = np.quantile(observed, rng.random(n))
+            sample = np.round(sample, _decimals(observed))
+            out[col] = sample.astype(values.dtype) if pd.api.types.is_integer_dtype(values) else sample
+        else:
+            freq = values.value_counts(dropna=False, normalize=True)
+            picks = rng.choice(len(freq), size=n, p=freq.to_numpy())
+            out[col] = pd.Series(freq.index.to_numpy(dtype=object)[picks], dtype=object)
+
+    df = pd.DataFrame(out)
+    if with_labels:
+        from src.labeling import generate_careers
+        df[TARGET] = generate_careers(df)
+    return df
+
+
+if __name__ == "__main__":
+    n = parse_size(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    path = sys.argv[2] if len(sys.argv) > 2 else None
+    df = synthetic_students(n, with_labels=True)
+    if path:
+        df.to_csv(path, index=False)
+        print(f"✅ wrote {len(df)} rows → {path}")
+    else:
+        print(df.head())
+        print(df[TARGET].value_counts())
@@ -0,0 +1,225 @@
+# src/artifacts.py
+"""
+Process-wide, lazily loaded model artifacts.
+
+Nothing is loaded at import time. Each artifact is loaded once, on first use, from a
+configurable model directory and then cached for the life of the process:
+    CAREER_MODEL_DIR env var  (default: <PythonCode>/models, independent of the CWD)
+
+Model directory layouts:
+    versioned (src/registry.py):  models/CURRENT -> "<version>"
+                                  models/versions/<version>/{manifest.json, career_model.pkl, ...}
+    legacy:                       models/{career_model.pkl, label_mapping.pkl, ...}
+Versions trained since the inference bundle was added also carry bundle.json + model.ubj
+(src/bundle.py), the pickle-free form of the same model (store.lean_model).
+
+The active store can be swapped atomically (swap_store) for zero-downtime reloads;
+request code grabs get_store() ONCE and keeps using that snapshot.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import joblib
+
+# -------------------------------------------------------------
+# PATHS
+# -------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MODEL_DIR = PROJECT_ROOT / "models"
+
+MODEL_FILE = "career_model.pkl"
+LABEL_FILE = "label_mapping.pkl"
+SHAP_FILE = "shap_explainer.pkl"
+FEATURE_INDEX_FILE = "feature_index.json"
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+VERSIONS_DIR = "versions"
+LEGACY_VERSION = "legacy"
+
+
+def resolve_model_dir(model_dir=None) -> Path:
+    return Path(model_dir or os.getenv("CAREER_MODEL_DIR") or DEFAULT_MODEL_DIR).resolve()
+
+
+class ArtifactStore:
+    """
+    Loads each artifact once, lazily, and caches it.
+
+    Attributes (all lazy):
+        pipeline, label_encoder, preprocessor, classifier, reverse_label_map,
+        feature_index, row_encoder, forest, shap_explainer, lean_model
+    """
+
+    def __init__(self, model_dir=None, version: str = LEGACY_VERSION, manifest: dict = None):
+        self.model_dir = resolve_model_dir(model_dir)
+        self.version = version
+        self.manifest = manifest
+        self._cache = {}
+        self._lock = threading.RLock()
+
+    def path(self, filename: str) -> Path:
+        return self.model_dir / filename
+
+    def _get(self, key: str, loader):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = loader()
+            return self._cache[key]
+
+    def _load_pickle(self, filename: str, what: str):
+        path = self.path(filename)
+        if not path.exists():
+            raise FileNotFoundError(f"❌ {filename} not found in {self.model_dir}. Run train_model.py first.")
+        print(f"🔄 Loading {what} from {path}")
+        return joblib.load(path)
+
+    # ---------------- raw artifacts ----------------
+    @property
+    def pipeline(self):
+        return self._get("pipeline", lambda: self._load_pickle(MODEL_FILE, "ML model"))
+
+    @property
+    def label_encoder(self):
+        return self._get("label_encoder", lambda: self._load_pickle(LABEL_FILE, "label mapping"))
+
+    @property
+    def shap_explainer(self):
+        return self._get("shap_explainer", lambda: self._load_pickle(SHAP_FILE, "SHAP explainer"))
+
+    # ---------------- derived views ----------------
+    @property
+    def preprocessor(self):
+        return self.pipeline.named_steps["pre"]
+
+    @property
+    def classifier(self):
+        return self.pipeline.named_steps["clf"]
+
+    @property
+    def reverse_label_map(self) -> dict:
+        return self._get("reverse_label_map",
+                         lambda: {i: label for i, label in enumerate(self.label_encoder.classes_)})
+
+    @property
+    def feature_index(self):
+        from src.explain import FeatureIndex, get_feature_index
+
+        def load():
+            if self.manifest and "feature_index" in self.manifest:
+                fi = self.manifest["feature_index"]
+                return FeatureIndex(fi["names"], fi["sources"])
+            return get_feature_index(self.pipeline, self.path(FEATURE_INDEX_FILE))
+
+        return self._get("feature_index", load)
+
+    @property
+    def row_encoder(self):
+        from src.preprocess import build_row_encoder
+        return self._get("row_encoder", lambda: build_row_encoder(self.preprocessor))
+
+    @property
+    def forest(self):
+        """Pure-NumPy FlatForest of the classifier's booster (src/forest.py), or None if unsupported."""
+        from src.forest import build_forest
+        return self._get("forest", lambda: build_forest(self.classifier.get_booster()))
+
+    @property
+    def lean_model(self):
+        """Pickle-free LeanModel from the version's inference bundle (src/bundle.py)."""
+        from src.bundle import load_bundle
+
+        def load():
+            print(f"🔄 Loading inference bundle from {self.model_dir}")
+            return load_bundle(self.model_dir)
+
+        return self._get("lean_model", load)
+
+    def warm_up(self) -> "ArtifactStore":
+        """Load everything the prediction path needs (e.g. before forking workers)."""
+        names = ["pipeline", "reverse_label_map", "feature_index", "row_encoder"]
+        if os.getenv("PREDICT_SCORER", "xgboost") == "numpy":   # see predict.PREDICT_SCORER
+            names.append("forest")
+        for name in names:
+            getattr(self, name)
+        return self
+
+
+# -------------------------------------------------------------
+# VERSION RESOLUTION
+# -------------------------------------------------------------
+def read_current_version(root=None):
+    """Version named in <root>/CURRENT, or None for the legacy (unversioned) layout."""
+    current = resolve_model_dir(root) / CURRENT_FILE
+    if not current.exists():
+        return None
+    return current.read_text(encoding="utf-8").strip() or None
+
+
+def open_store(root=None, version: str = None) -> ArtifactStore:
+    """
+    ArtifactStore for `version` (default: the one named in CURRENT) under the model root.
+    Falls back to the legacy loose-file layout when the root has no CURRENT file.
+    """
+    root = resolve_model_dir(root)
+    version = version or read_current_version(root)
+    if version is None:
+        return ArtifactStore(root)
+
+    version_dir = root / VERSIONS_DIR / version
+    manifest_path = version_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"❌ Model version '{version}' has no {MANIFEST_FILE} in {version_dir}.")
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return ArtifactStore(version_dir, version=version, manifest=manifest)
+
+
+# -------------------------------------------------------------
+# PROCESS-WIDE STORE
+# -------------------------------------------------------------
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ArtifactStore:
+    """The process-wide ArtifactStore (created on first call)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = open_store()
+    return _store
+
+
+def swap_store(store: ArtifactStore) -> ArtifactStore:
+    """Atomically replace the process-wide store; returns the previous one."""
+    global _store
+    with _store_lock:
+        previous, _store = _store, store
+    return previous
+
+
+def _reset_locks_after_fork() -> None:
+    # a worker forked while another thread held a lock would otherwise deadlock on it
+    global _store_lock
+    _store_lock = threading.Lock()
+    if _store is not None:
+        _store._lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+def set_model_dir(model_dir) -> ArtifactStore:
+    """Point the process-wide store at another model directory (drops cached artifacts)."""
+    store = open_store(model_dir)
+    swap_store(store)
+    return store
@@ -0,0 +1,313 @@
+# src/bundle.py
+"""
+Pickle-free inference bundle for the career model.
+
+The joblib artifact is a whole sklearn Pipeline (ColumnTransformer + XGBClassifier): loading
+it unpickles sklearn / custom encoder objects just to score ~20 fields. The bundle is the
+same model compiled down to plain data, written next to the pickles in every registry version:
+
+    bundle.json   encoder spec (scaler mean/scale, one-hot / token / text vocabularies with
+                  their output columns, feature count) + the label classes
+    model.ubj     the booster in XGBoost's native UBJSON format (Booster.save_model)
+
+    export_bundle(pipeline, label_encoder, out_dir)   # train_model.export does this
+    model = load_bundle(version_dir)                  # -> LeanModel
+    model.predict_proba([normalized_row, ...])        # cleaned-key dicts, see predict.py
+
+LeanModel encodes rows exactly like preprocess.RowEncoder (same CSR, bit for bit) and scores
+through Booster.inplace_predict: no Pipeline, no ColumnTransformer, no XGBClassifier wrapper
+and nothing is unpickled. Loading needs only numpy, scipy and xgboost (which itself still
+imports sklearn / pandas when they are installed).
+"""
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+BUNDLE_SPEC_FILE = "bundle.json"
+BUNDLE_MODEL_FILE = "model.ubj"
+BUNDLE_FORMAT = 1
+
+
+# ================================================================
+# 1. EXPORT (fitted Pipeline -> plain arrays)
+# ================================================================
+def _clean_key(col: str) -> str:
+    # export time only: loading a bundle reads the clean keys from the spec and never
+    # imports pandas through src.preprocess
+    from src.preprocess import RAW_TO_CLEAN
+    return RAW_TO_CLEAN.get(col, col)
+
+
+def _json_value(value):
+    """numpy scalars -> plain Python so categories survive json.dump."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def compile_spec(pre, classes) -> dict:
+    """
+    Plain-data description of a fitted ColumnTransformer, in output-column order.
+    Supports the same transformers as preprocess.RowEncoder; anything else raises ValueError.
+    """
+    numeric = {"keys": [], "columns": [], "mean": [], "scale": []}
+    fields = []
+    offset = 0
+
+    for _, transformer, cols in pre.transformers_:
+        cols = [cols] if isinstance(cols, str) else list(cols)
+        if transformer == "drop" or not cols:
+            continue
+        kind = "passthrough" if transformer == "passthrough" else type(transformer).__name__
+
+        if kind in ("passthrough", "StandardScaler"):
+            n = len(cols)
+            scaler = transformer if kind == "StandardScaler" else None
+            mean = scaler.mean_ if scaler is not None and scaler.with_mean else np.zeros(n)
+            scale = scaler.scale_ if scaler is not None and scaler.with_std else np.ones(n)
+            numeric["keys"].extend(_clean_key(c) for c in cols)
+            numeric["columns"].extend(range(offset, offset + n))
+            numeric["mean"].extend(float(m) for m in mean)
+            numeric["scale"].extend(float(s) for s in scale)
+            offset += n
+
+        elif kind == "OneHotEncoder":
+            if getattr(transformer, "drop_idx_", None) is not None or \
+                    getattr(transformer, "_infrequent_enabled", False) or transformer.handle_unknown != "ignore":
+                raise ValueError("bundle: OneHotEncoder must use handle_unknown='ignore' without drop/infrequent.")
+            for col, cats in zip(cols, transformer.categories_):
+                # NaN is never looked up (missing -> 0), so it only takes up its column
+                lookup = [[_json_value(cat), offset + j] for j, cat in enumerate(cats)
+                          if not (isinstance(cat, float) and math.isnan(cat)) and cat is not None]
+                fields.append({"key": _clean_key(col), "kind": "onehot", "lookup": lookup})
+                offset += len(cats)
+
+        elif kind == "FrameworkMultiHot":
+            for j, col in enumerate(cols):
+                base = offset + int(transformer._offsets[j])
+                vocab = transformer.states_[j]
+                fields.append({
+                    "key": _clean_key(col), "kind": "multihot",
+                    "vocab": {t: base + i for t, i in vocab.items()},
+                    "other": base + len(vocab) if transformer.other_bucket else None,
+                })
+            offset += len(transformer.get_feature_names_out(cols))
+
+        elif kind == "TextBucketEncoder":
+            for j, col in enumerate(cols):
+                base = offset + int(transformer._offsets[j])
+                vocab = transformer.states_[j]
+                if vocab is None:
+                    fields.append({"key": _clean_key(col), "kind": "text_hash",
+                                   "base": base, "n_buckets": int(transformer.n_buckets)})
+                else:
+                    fields.append({"key": _clean_key(col), "kind": "text",
+                                   "vocab": {t: base + i for t, i in vocab.items()},
+                                   "infrequent": base + len(vocab)})
+            offset += len(transformer.get_feature_names_out(cols))
+
+        else:
+            raise ValueError(f"bundle: unsupported transformer {kind}.")
+
+    return {
+        "format": BUNDLE_FORMAT,
+        "n_features": offset,
+        "sparse_output": bool(getattr(pre, "sparse_output_", False)),
+        "numeric": numeric,
+        "fields": fields,
+        "classes": [_json_value(c) for c in classes],
+    }
+
+
+def export_bundle(pipeline, label_encoder, out_dir) -> list:
+    """Write bundle.json + model.ubj for a fitted Pipeline('pre', 'clf') into out_dir; returns the paths."""
+    out_dir = Path(out_dir)
+    spec = compile_spec(pipeline.named_steps["pre"], label_encoder.classes_)
+    spec_path, model_path = out_dir / BUNDLE_SPEC_FILE, out_dir / BUNDLE_MODEL_FILE
+    with open(spec_path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, ensure_ascii=False)
+    pipeline.named_steps["clf"].get_booster().save_model(str(model_path))
+    return [spec_path, model_path]
+
+
+# ================================================================
+# 2. ROW ENCODING (same semantics as preprocess.RowEncoder)
+# ================================================================
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _frameworks_tokens(value) -> list:
+    # labeling.tokenize_frameworks for text, nothing for missing / non-text values
+    if not isinstance(value, str):
+        return []
+    return [f.strip() for f in value.lower().replace(",", ";").split(";") if f.strip()]
+
+
+def _normalize_text(value: str) -> str:
+    # encoders.normalize_text
+    return value.strip().lower().rstrip(".").strip()
+
+
+def murmurhash3_32(text: str, seed: int = 0) -> int:
+    """Unsigned MurmurHash3 (x86, 32-bit) of the UTF-8 text; == sklearn murmurhash3_32(positive=True)."""
+    data = text.encode("utf-8")
+    c1, c2, mask = 0xCC9E2D51, 0x1B873593, 0xFFFFFFFF
+    h = seed & mask
+    n_blocks = len(data) // 4
+    for i in range(n_blocks):
+        k = int.from_bytes(data[4 * i:4 * i + 4], "little")
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+        h = ((h << 13) | (h >> 19)) & mask
+        h = (h * 5 + 0xE6546B64) & mask
+
+    tail = data[4 * n_blocks:]
+    if tail:
+        k = int.from_bytes(tail, "little")
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & mask
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & mask
+    return h ^ (h >> 16)
+
+
+def _field_hits(field: dict):
+    """value -> output columns set to 1.0 for one spec field."""
+    kind = field["kind"]
+
+    if kind == "onehot":
+        lookup = {cat: col for cat, col in field["lookup"]}
+
+        def hits(value):
+            col = lookup.get(value)
+            return () if col is None else (col,)
+
+    elif kind == "multihot":
+        vocab, other = field["vocab"], field["other"]
+
+        def hits(value):
+            out, unseen = set(), False
+            for t in _frameworks_tokens(value):
+                col = vocab.get(t)
+                if col is None:
+                    unseen = True
+                else:
+                    out.add(col)
+            if unseen and other is not None:
+                out.add(other)
+            return out
+
+    elif kind == "text":
+        vocab, infrequent = field["vocab"], field["infrequent"]
+
+        def hits(value):
+            return (vocab.get(_normalize_text(value), infrequent),) if isinstance(value, str) else ()
+
+    elif kind == "text_hash":
+        base, n_buckets = field["base"], field["n_buckets"]
+
+        def hits(value):
+            return (base + murmurhash3_32(_normalize_text(value)) % n_buckets,) if isinstance(value, str) else ()
+
+    else:
+        raise ValueError(f"bundle: unknown field kind '{kind}'.")
+    return hits
+
+
+# ================================================================
+# 3. LEAN MODEL
+# ================================================================
+class LeanModel:
+    """
+    Scores cleaned-key dicts (output of predict.normalize_input_any) from a loaded bundle.
+
+    Attributes:
+        booster: xgboost.Booster
+        classes: label names, index = class id
+        n_features, sparse_output: encoded matrix layout (same as the pipeline's 'pre' step)
+    """
+
+    def __init__(self, spec: dict, booster):
+        if spec.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"bundle: unsupported format {spec.get('format')!r}.")
+        numeric = spec["numeric"]
+        self.booster = booster
+        self.classes = list(spec["classes"])
+        self.n_features = int(spec["n_features"])
+        self.sparse_output = bool(spec["sparse_output"])
+        self.num_keys = tuple(numeric["keys"])
+        self.num_cols = np.asarray(numeric["columns"], dtype=np.int32)
+        self.mean = np.asarray(numeric["mean"], dtype=np.float64)
+        self.scale = np.asarray(numeric["scale"], dtype=np.float64)
+        self.cat_fields = tuple((f["key"], _field_hits(f)) for f in spec["fields"])
+
+    def _entries(self, row: dict):
+        x = np.empty(len(self.num_keys), dtype=np.float64)
+        for i, key in enumerate(self.num_keys):
+            value = row.get(key, 0)
+            x[i] = 0.0 if _is_missing(value) else float(value)
+        x -= self.mean
+        x /= self.scale
+
+        hits = []
+        for key, field_hits in self.cat_fields:
+            value = row.get(key, 0)
+            hits.extend(field_hits(0 if _is_missing(value) else value))
+
+        nz = x != 0
+        indices = np.concatenate([self.num_cols[nz], np.asarray(hits, dtype=np.int32)])
+        data = np.concatenate([x[nz], np.ones(len(hits))])
+        order = np.argsort(indices, kind="stable")
+        return indices[order], data[order]
+
+    def encode_many(self, rows: list):
+        """List of cleaned-key dicts -> len(rows) x n_features (CSR or ndarray, like the pipeline)."""
+        entries = [self._entries(row) for row in rows]
+
+        if not self.sparse_output:
+            out = np.zeros((len(rows), self.n_features), dtype=np.float64)
+            for i, (indices, data) in enumerate(entries):
+                out[i, indices] = data
+            return out
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in entries])
+        indices = np.concatenate([e[0] for e in entries]) if entries else np.zeros(0, dtype=np.int32)
+        data = np.concatenate([e[1] for e in entries]) if entries else np.zeros(0)
+        return sparse.csr_matrix((data, indices.astype(np.int32), indptr), shape=(len(rows), self.n_features))
+
+    def predict_proba(self, rows: list) -> np.ndarray:
+        """len(rows) x n_classes class probabilities."""
+        if not rows:
+            return np.zeros((0, len(self.classes)))
+        # same trees as XGBClassifier.predict_proba: stop at best_iteration (early stopping)
+        best_iteration = self.booster.attr("best_iteration")
+        iteration_range = (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+        probs = self.booster.inplace_predict(self.encode_many(rows), iteration_range=iteration_range)
+        if probs.ndim == 1:   # binary:logistic returns P(class 1)
+            probs = np.column_stack([1.0 - probs, probs])
+        return probs.reshape(len(rows), -1)
+
+
+def load_bundle(model_dir) -> LeanModel:
+    """LeanModel from <model_dir>/bundle.json + model.ubj."""
+    import xgboost as xgb  # deferred: keeps 'import src.bundle' cheap
+
+    model_dir = Path(model_dir)
+    spec_path, model_path = model_dir / BUNDLE_SPEC_FILE, model_dir / BUNDLE_MODEL_FILE
+    if not spec_path.exists() or not model_path.exists():
+        raise FileNotFoundError(f"❌ No inference bundle in {model_dir}. Re-run train_model.py to export one.")
+    with open(spec_path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    booster = xgb.Booster()
+    booster.load_model(str(model_path))
+    return LeanModel(spec, booster)
@@ -0,0 +1,179 @@
+# src/cache.py
+"""
+In-process LRU + TTL cache for prediction responses.
+
+Students resubmit the form with the same values and batch re-scores repeat rows, so
+identical requests are answered from memory instead of re-running encode + forest + SHAP.
+
+Key   = BLAKE2b of the canonical JSON of the normalize_input_any() dict
+        + the explanation options (aggregate, top_k) + the active model version.
+Scope = one ArtifactStore: when the registry swaps stores (src/registry.py) the cache
+        notices the new store on the next lookup and drops every entry.
+
+Configuration (env vars, read once per process):
+    PREDICT_CACHE_SIZE   max entries, 0 disables the cache   (default: 4096)
+    PREDICT_CACHE_TTL    seconds an entry stays valid, 0 = no expiry   (default: 600)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+# -------------------------------------------------------------
+# KEYING
+# -------------------------------------------------------------
+def _canonical(value):
+    # 8 and 8.0 reach the model as the same float, so they share a key
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def cache_key(normalized: dict, version: str, aggregate: bool = False, top_k: int = 7) -> str:
+    """Stable hash of a normalized request for one model version."""
+    payload = json.dumps(
+        [version, bool(aggregate), int(top_k), {k: _canonical(v) for k, v in normalized.items()}],
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# -------------------------------------------------------------
+# CACHE
+# -------------------------------------------------------------
+class PredictionCache:
+    """
+    Thread-safe LRU cache with per-entry TTL, bound to one ArtifactStore at a time.
+
+    get()/put() hand out deep copies so callers can mutate results freely.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl: float = 600.0):
+        self.max_size = int(max_size)
+        self.ttl = float(ttl)
+        self._entries = OrderedDict()   # key -> (expires_at, result)
+        self._lock = threading.Lock()
+        self._store = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> "PredictionCache":
+        return cls(
+            max_size=int(os.getenv("PREDICT_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("PREDICT_CACHE_TTL", "600"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _bind(self, store) -> None:
+        # caller holds the lock; a different store object means a model swap
+        if store is not self._store:
+            self._invalidate()
+            self._store = store
+
+    def _invalidate(self) -> None:
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def get(self, store, key: str):
+        """Cached result for `key` under `store`, or None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._bind(store)
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(result)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, store, key: str, result: dict) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        result = copy.deepcopy(result)
+        with self._lock:
+            # a request that started on the previous model must not repopulate the cache
+            if store is not self._store:
+                return
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry (called by the registry after a model swap)."""
+        with self._lock:
+            self._invalidate()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# -------------------------------------------------------------
+# PROCESS-WIDE CACHE
+# -------------------------------------------------------------
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_prediction_cache() -> PredictionCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PredictionCache.from_env()
+    return _cache
+
+
+def set_prediction_cache(cache: PredictionCache) -> PredictionCache:
+    """Replace the process-wide cache (e.g. to resize it); returns the previous one."""
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, cache
+    return previous
+
+
+def _reset_locks_after_fork() -> None:
+    # forked inference workers (src/workers.py) get fresh locks
+    global _cache_lock
+    _cache_lock = threading.Lock()
+    if _cache is not None:
+        _cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
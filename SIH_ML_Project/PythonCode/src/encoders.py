@@ -0,0 +1,287 @@
+# src/encoders.py
+"""
+Custom sklearn transformers used inside the training ColumnTransformer.
+
+ - FrameworkMultiHot: splits "Experience with frameworks" on comma/semicolon (same
+   tokenization as the labeling rules) and emits a fixed sparse multi-hot vocabulary,
+   with an optional size cap and an "other" bucket for out-of-vocabulary tokens.
+ - TextBucketEncoder: bounded-width encoding for high-cardinality free text
+   ("History of Reappear/Backlogs"): frequency-capped one-hot or feature hashing.
+ - build_preprocessor(): the training ColumnTransformer, assembled from the options above.
+
+Each transformer also exposes row_hits(column_position, value) so the compiled
+RowEncoder (src/preprocess.py) can encode one request without pandas.
+
+NOTE: pipelines pickle these classes by module path, so always import them as
+src.encoders (train_model.py takes care of this when run as a script).
+"""
+
+from collections import Counter
+from typing import List
+
+import numpy as np
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.utils import murmurhash3_32
+
+from src.labeling import tokenize_frameworks
+
+FRAMEWORKS_COL = "Experience with frameworks"
+HIGH_CARDINALITY_COLS = ["History of Reappear/Backlogs"]
+
+
+def _frameworks_tokens(value) -> List[str]:
+    """Missing / non-text values carry no frameworks."""
+    if not isinstance(value, str):
+        return []
+    return tokenize_frameworks(value)
+
+
+class _RowHitsEncoder(BaseEstimator, TransformerMixin):
+    """
+    Shared machinery for binary sparse encoders defined by row_hits(column_position, value).
+    Subclasses implement _count_column(values) -> Counter, _state_from_counts(counts) -> state,
+    _column_width(state) and row_hits(). fit() == one partial_fit() over all rows.
+    """
+
+    @staticmethod
+    def _as_columns(X):
+        if hasattr(X, "iloc"):
+            return X
+        X = np.asarray(X, dtype=object)
+        return X.reshape(-1, 1) if X.ndim == 1 else X
+
+    @staticmethod
+    def _column(X, j):
+        return X.iloc[:, j].tolist() if hasattr(X, "iloc") else list(X[:, j])
+
+    def fit(self, X, y=None):
+        X = self._as_columns(X)
+        self.n_features_in_ = X.shape[1]
+        if hasattr(X, "columns"):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+
+        self.states_ = [self._state_from_counts(self._count_column(self._column(X, j)))
+                        for j in range(X.shape[1])]
+        self._offsets = np.cumsum([0] + [self._column_width(st) for st in self.states_])
+        return self
+
+    def partial_fit(self, X, y=None):
+        """Accumulate counts chunk by chunk (out-of-core training); the vocabulary is rebuilt each call."""
+        X = self._as_columns(X)
+        if not hasattr(self, "_partial_counts"):
+            self.n_features_in_ = X.shape[1]
+            if hasattr(X, "columns"):
+                self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+            self._partial_counts = [Counter() for _ in range(X.shape[1])]
+
+        for j, counts in enumerate(self._partial_counts):
+            counts.update(self._count_column(self._column(X, j)))
+        self.states_ = [self._state_from_counts(counts) for counts in self._partial_counts]
+        self._offsets = np.cumsum([0] + [self._column_width(st) for st in self.states_])
+        return self
+
+    def __getstate__(self):
+        # streamed counts are only needed while fitting; keep them out of career_model.pkl
+        state = super().__getstate__()
+        state.pop("_partial_counts", None)
+        return state
+
+    def transform(self, X):
+        X = self._as_columns(X)
+        indptr, indices = [0], []
+        columns = [self._column(X, j) for j in range(len(self.states_))]
+        # few distinct strings per column: encode each one once
+        caches = [{} for _ in columns]
+        for i in range(X.shape[0]):
+            for j, col in enumerate(columns):
+                value = col[i]
+                hits = caches[j].get(value) if isinstance(value, str) else None
+                if hits is None:
+                    hits = self.row_hits(j, value)
+                    if isinstance(value, str):
+                        caches[j][value] = hits
+                indices.extend(hits)
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.ones(len(indices)), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+            shape=(X.shape[0], int(self._offsets[-1]))
+        )
+
+    def get_feature_names_out(self, input_features=None):
+        if input_features is None:
+            input_features = getattr(self, "feature_names_in_",
+                                     [f"x{j}" for j in range(len(self.states_))])
+        names = []
+        for col, st in zip(input_features, self.states_):
+            names.extend(f"{col}_{suffix}" for suffix in self._column_suffixes(st))
+        return np.asarray(names, dtype=object)
+
+
+class FrameworkMultiHot(_RowHitsEncoder):
+    """
+    Multi-hot encoder for comma/semicolon separated token lists.
+
+    Args:
+        max_tokens: keep at most this many tokens per column (most frequent first); None = no cap
+        min_count: drop tokens seen fewer than this many times during fit
+        other_bucket: add a "<col>_other" column set when a row has an out-of-vocabulary token
+    """
+
+    def __init__(self, max_tokens=None, min_count: int = 1, other_bucket: bool = True):
+        self.max_tokens = max_tokens
+        self.min_count = min_count
+        self.other_bucket = other_bucket
+
+    @property
+    def vocabularies_(self):
+        return self.states_
+
+    def _count_column(self, values) -> Counter:
+        # document frequency: a token counts once per row
+        return Counter(t for v in values for t in set(_frameworks_tokens(v)))
+
+    def _state_from_counts(self, counts) -> dict:
+        # most frequent first, alphabetical tie-break -> deterministic vocab
+        tokens = sorted((t for t, c in counts.items() if c >= self.min_count),
+                        key=lambda t: (-counts[t], t))
+        if self.max_tokens is not None:
+            tokens = tokens[:self.max_tokens]
+        return {t: i for i, t in enumerate(tokens)}
+
+    def _column_width(self, vocab) -> int:
+        return len(vocab) + (1 if self.other_bucket else 0)
+
+    def _column_suffixes(self, vocab) -> List[str]:
+        return list(vocab) + (["other"] if self.other_bucket else [])
+
+    def row_hits(self, j: int, value) -> List[int]:
+        """Output columns (relative to this transformer's block) set to 1 for `value` in column j."""
+        vocab = self.states_[j]
+        base = int(self._offsets[j])
+        hits, other = set(), False
+        for t in _frameworks_tokens(value):
+            idx = vocab.get(t)
+            if idx is None:
+                other = True
+            else:
+                hits.add(base + idx)
+        if other and self.other_bucket:
+            hits.add(base + len(vocab))
+        return sorted(hits)
+
+
+def normalize_text(value: str) -> str:
+    """'  Interested in Cloud Computing. ' -> 'interested in cloud computing'"""
+    return value.strip().lower().rstrip(".").strip()
+
+
+class TextBucketEncoder(_RowHitsEncoder):
+    """
+    Bounded-width encoder for high-cardinality free-text columns
+    (e.g. "History of Reappear/Backlogs"). Text is normalized with normalize_text().
+
+    strategy:
+        "capped" -> one-hot over values seen >= min_frequency times, at most max_categories
+                    columns including the trailing "<col>_infrequent" column that every
+                    other (rare or unseen) text maps to
+        "hash"   -> murmurhash3 of the text into n_buckets columns (no vocabulary to store)
+    Non-text values (missing) set no column.
+    """
+
+    def __init__(self, strategy: str = "capped", min_frequency: int = 5, max_categories=None,
+                 n_buckets: int = 64):
+        self.strategy = strategy
+        self.min_frequency = min_frequency
+        self.max_categories = max_categories
+        self.n_buckets = n_buckets
+
+    def _count_column(self, values) -> Counter:
+        if self.strategy == "hash":
+            return Counter()   # no vocabulary
+        return Counter(normalize_text(v) for v in values if isinstance(v, str))
+
+    def _state_from_counts(self, counts):
+        if self.strategy == "hash":
+            return None
+        if self.strategy != "capped":
+            raise ValueError(f"Unknown TextBucketEncoder strategy '{self.strategy}'.")
+
+        cats = sorted((c for c, n in counts.items() if n >= self.min_frequency),
+                      key=lambda c: (-counts[c], c))
+        if self.max_categories is not None:
+            cats = cats[:max(self.max_categories - 1, 0)]
+        return {c: i for i, c in enumerate(cats)}
+
+    def _column_width(self, vocab) -> int:
+        return self.n_buckets if vocab is None else len(vocab) + 1
+
+    def _column_suffixes(self, vocab) -> List[str]:
+        if vocab is None:
+            return [f"hash{k}" for k in range(self.n_buckets)]
+        return list(vocab) + ["infrequent"]
+
+    def row_hits(self, j: int, value) -> List[int]:
+        """Output column (relative to this transformer's block) set to 1 for `value` in column j."""
+        if not isinstance(value, str):
+            return []
+        base = int(self._offsets[j])
+        text = normalize_text(value)
+        vocab = self.states_[j]
+        if vocab is None:
+            return [base + murmurhash3_32(text, seed=0, positive=True) % self.n_buckets]
+        return [base + vocab.get(text, len(vocab))]
+
+
+def build_preprocessor(numeric_cols, categorical_cols, frameworks_encoding: str = "multihot",
+                       frameworks_max_tokens=None, frameworks_min_count: int = 1,
+                       text_encoding: str = "capped", text_min_frequency: int = 5,
+                       text_max_categories=None, text_n_buckets: int = 64,
+                       text_cols=None) -> ColumnTransformer:
+    """
+    Training ColumnTransformer.
+
+    frameworks_encoding:
+        "multihot" -> FrameworkMultiHot over the frameworks column (token vocabulary)
+        "onehot"   -> legacy: one-hot over the raw frameworks string
+    text_encoding (for text_cols, default HIGH_CARDINALITY_COLS):
+        "capped"   -> TextBucketEncoder(strategy="capped", min_frequency, max_categories)
+        "hash"     -> TextBucketEncoder(strategy="hash", n_buckets)
+        "onehot"   -> legacy: plain one-hot (about one column per distinct sentence)
+    The fitted encoders (and therefore these choices) are pickled inside the pipeline,
+    so predict.py applies exactly the same encoding.
+    """
+    if frameworks_encoding not in ("multihot", "onehot"):
+        raise ValueError(f"Unknown frameworks_encoding '{frameworks_encoding}'.")
+    if text_encoding not in ("capped", "hash", "onehot"):
+        raise ValueError(f"Unknown text_encoding '{text_encoding}'.")
+
+    if text_cols is None:
+        text_cols = HIGH_CARDINALITY_COLS
+
+    special = set()
+    fw_cols = []
+    if frameworks_encoding == "multihot" and FRAMEWORKS_COL in categorical_cols:
+        fw_cols = [FRAMEWORKS_COL]
+        special.add(FRAMEWORKS_COL)
+    txt_cols = []
+    if text_encoding != "onehot":
+        txt_cols = [c for c in text_cols if c in categorical_cols and c not in special]
+        special.update(txt_cols)
+
+    transformers = [
+        ("num", StandardScaler(), list(numeric_cols)),
+        ("cat", OneHotEncoder(handle_unknown="ignore"), [c for c in categorical_cols if c not in special]),
+    ]
+    if fw_cols:
+        transformers.append(("fw", FrameworkMultiHot(max_tokens=frameworks_max_tokens,
+                                                     min_count=frameworks_min_count), fw_cols))
+    if txt_cols:
+        transformers.append(("txt", TextBucketEncoder(strategy=text_encoding,
+                                                      min_frequency=text_min_frequency,
+                                                      max_categories=text_max_categories,
+                                                      n_buckets=text_n_buckets), txt_cols))
+
+    return ColumnTransformer(transformers)
@@ -5,20 +5,89 @@ SHAP explanation utilities for the AI Career Guidance System.
 This version:
  - extracts numeric + categorical (one-hot) feature names from the trained pipeline robustly,
  - supports cases where categorical transformer or OHE is absent,
- - returns top-k SHAP feature impacts for the predicted class.
+ - returns top-k SHAP feature impacts for the predicted class,
+ - computes attributions with XGBoost's native TreeSHAP (pred_contribs=True) by default;
+   a shap.TreeExplainer over the same pipeline is still available as the "shap" backend,
+ - resolves feature names / one-hot groups ONCE per model into an immutable FeatureIndex
+   (saved next to the model as feature_index.json) so per-request work is pure NumPy.
 """
 
+import os
+import json
+import weakref
 import numpy as np
-import joblib
 from pathlib import Path
 from typing import List, Dict
 
-SHAP_PATH = "models/shap_explainer.pkl"
+# "native" -> Booster.predict(..., pred_contribs=True)   (default, no shap import)
+# "shap"   -> shap.TreeExplainer of the pipeline's classifier (the pickled one from train_model.py
+#             when the pipeline is the active model and it was shipped)
+SHAP_BACKENDS = ("native", "shap")
+DEFAULT_SHAP_BACKEND = os.getenv("SHAP_BACKEND", "native")
 
-if not Path(SHAP_PATH).exists():
-    raise FileNotFoundError("❌ SHAP explainer not found. Run train_model.py first.")
+_shap_explainer_cache = weakref.WeakKeyDictionary()
 
-explainer = joblib.load(SHAP_PATH)
+
+def _get_shap_explainer(pipeline):
+    """shap.TreeExplainer for `pipeline` (only needed by the 'shap' backend), cached per pipeline."""
+    explainer = _shap_explainer_cache.get(pipeline)
+    if explainer is not None:
+        return explainer
+
+    from src.artifacts import SHAP_FILE, get_store
+    store = get_store()
+    if store.path(SHAP_FILE).exists() and store.pipeline is pipeline:
+        explainer = store.shap_explainer
+    else:
+        import shap  # deferred: optional dependency, only for this backend
+        explainer = shap.TreeExplainer(pipeline.named_steps["clf"])
+
+    _shap_explainer_cache[pipeline] = explainer
+    return explainer
+
+
+def _native_contributions(pipeline, df_preprocessed) -> np.ndarray:
+    """
+    Exact TreeSHAP attributions straight from the booster.
+    Returns (n_classes, n_samples, n_features); the bias column is dropped.
+    """
+    import xgboost as xgb  # deferred: keeps 'import src.explain' cheap
+
+    booster = pipeline.named_steps["clf"].get_booster()
+    contribs = booster.predict(xgb.DMatrix(df_preprocessed), pred_contribs=True)
+
+    if contribs.ndim == 3:
+        # multi-class: (n_samples, n_classes, n_features + 1)
+        return np.transpose(contribs[:, :, :-1], (1, 0, 2))
+    # binary/regression: (n_samples, n_features + 1)
+    return contribs[None, :, :-1]
+
+
+def _shap_contributions(pipeline, df_preprocessed) -> np.ndarray:
+    """Same layout as _native_contributions, computed by shap.TreeExplainer."""
+    shap_values = _get_shap_explainer(pipeline).shap_values(df_preprocessed)
+
+    # shap_values may be list (multi-class) or array (binary/regression)
+    if isinstance(shap_values, (list, tuple)):
+        return np.stack([np.asarray(v) for v in shap_values])
+    return np.asarray(shap_values)[None]
+
+
+def compute_contributions(pipeline, df_preprocessed, backend: str = None) -> np.ndarray:
+    """
+    SHAP values for every class: array of shape (n_classes, n_samples, n_features).
+
+    Args:
+        pipeline: trained sklearn Pipeline ('clf' step must be an XGBoost model)
+        df_preprocessed: matrix produced by pipeline.named_steps['pre'].transform(df)
+        backend: "native" (default) or "shap"
+    """
+    backend = backend or DEFAULT_SHAP_BACKEND
+    if backend == "native":
+        return _native_contributions(pipeline, df_preprocessed)
+    if backend == "shap":
+        return _shap_contributions(pipeline, df_preprocessed)
+    raise ValueError(f"Unknown SHAP backend '{backend}'. Expected one of {SHAP_BACKENDS}.")
 
 
 def _get_column_transformer(pre):
@@ -96,11 +165,8 @@ def _categorical_feature_names(pre) -> List[str]:
     return []
 
 
-def extract_feature_names_from_pipeline(pipeline) -> List[str]:
-    """
-    Extracts the list of transformed feature names (numeric + categorical one-hot)
-    from the pipeline's ColumnTransformer ('pre' step).
-    """
+def _find_column_transformer(pipeline):
+    """Return the pipeline's ColumnTransformer (step 'pre', or the first step that looks like one)."""
     if "pre" not in pipeline.named_steps:
         # If there's no preprocessor step named 'pre', attempt to find the ColumnTransformer
         # in the pipeline steps
@@ -113,6 +179,15 @@ def extract_feature_names_from_pipeline(pipeline) -> List[str]:
             raise RuntimeError("Cannot find ColumnTransformer in pipeline (expected step 'pre').")
     else:
         pre = pipeline.named_steps["pre"]
+    return pre
+
+
+def extract_feature_names_from_pipeline(pipeline) -> List[str]:
+    """
+    Extracts the list of transformed feature names (numeric + categorical one-hot)
+    from the pipeline's ColumnTransformer ('pre' step).
+    """
+    pre = _find_column_transformer(pipeline)
 
     numeric = _numeric_feature_names(pre)
     categorical = _categorical_feature_names(pre)
@@ -120,7 +195,132 @@ def extract_feature_names_from_pipeline(pipeline) -> List[str]:
     return numeric + categorical
 
 
-def get_shap_explanations(pipeline, df_preprocessed, predicted_class_index: int, top_k: int = 7) -> List[Dict]:
+# -------------------------------------------------------------
+# FEATURE INDEX (resolved once per model)
+# -------------------------------------------------------------
+def _source_field(feature_name: str, cols: List[str]) -> str:
+    """Raw input field a transformed column came from (longest matching column prefix)."""
+    if len(cols) == 1:
+        return cols[0]
+    matches = [c for c in cols if feature_name == c or feature_name.startswith(f"{c}_")]
+    return max(matches, key=len) if matches else feature_name
+
+
+class FeatureIndex:
+    """
+    Immutable lookup of the transformed feature space:
+     - names:        transformed column names (what explanations report)
+     - sources:      raw input field each column came from (e.g. "Experience with frameworks")
+     - group_starts: offsets of contiguous same-source segments (for segment sums)
+     - group_names:  raw field name of each segment
+    """
+
+    __slots__ = ("names", "sources", "group_starts", "group_names")
+
+    def __init__(self, names, sources):
+        names = np.asarray(names, dtype=object)
+        sources = np.asarray(sources, dtype=object)
+        if len(names) != len(sources):
+            raise ValueError("FeatureIndex: names and sources must have the same length.")
+
+        change = np.ones(len(sources), dtype=bool)
+        change[1:] = sources[1:] != sources[:-1]
+        group_starts = np.flatnonzero(change)
+        group_names = sources[group_starts]
+
+        for arr in (names, sources, group_starts, group_names):
+            arr.setflags(write=False)
+
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "sources", sources)
+        object.__setattr__(self, "group_starts", group_starts)
+        object.__setattr__(self, "group_names", group_names)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("FeatureIndex is immutable.")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "FeatureIndex":
+        """Walk the fitted ColumnTransformer once and record every output column + its source field."""
+        pre = _find_column_transformer(pipeline)
+
+        if not hasattr(pre, "transformers_"):
+            names = extract_feature_names_from_pipeline(pipeline)
+            return cls(names, names)
+
+        names, sources = [], []
+        for _, transformer, cols in pre.transformers_:
+            cols = list(cols) if not isinstance(cols, str) else [cols]
+            if transformer == "drop" or not cols:
+                continue
+            if transformer == "passthrough":
+                out = cols
+            else:
+                out = list(transformer.get_feature_names_out(cols))
+            names.extend(out)
+            sources.extend(_source_field(n, cols) for n in out)
+
+        return cls(names, sources)
+
+    def aggregate(self, values: np.ndarray) -> np.ndarray:
+        """Segment-sum per-column values (n_samples x n_features) back to raw fields."""
+        return np.add.reduceat(values, self.group_starts, axis=1)
+
+    def save(self, path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"names": list(self.names), "sources": list(self.sources)}, f)
+
+    @classmethod
+    def load(cls, path) -> "FeatureIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["names"], data["sources"])
+
+
+_feature_index_cache = weakref.WeakKeyDictionary()
+
+
+def get_feature_index(pipeline, path=None) -> FeatureIndex:
+    """
+    FeatureIndex for a fitted pipeline, resolved once and cached per pipeline object.
+    If `path` (feature_index.json next to the model) exists and matches the model width,
+    it is used instead of introspecting the pipeline.
+    """
+    index = _feature_index_cache.get(pipeline)
+    if index is not None:
+        return index
+
+    if path is not None and Path(path).exists():
+        index = FeatureIndex.load(path)
+        n_expected = getattr(pipeline.named_steps.get("clf"), "n_features_in_", len(index))
+        if len(index) != n_expected:
+            index = None
+
+    if index is None:
+        index = FeatureIndex.from_pipeline(pipeline)
+
+    _feature_index_cache[pipeline] = index
+    return index
+
+
+def _top_k_indices(values: np.ndarray, top_k: int) -> np.ndarray:
+    """Row-wise indices of the top_k largest |values|, largest first (argpartition + small sort)."""
+    k = min(top_k, values.shape[1])
+    magnitude = np.abs(values)
+    if k < values.shape[1]:
+        part = np.argpartition(-magnitude, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(k), (values.shape[0], k))
+    order = np.argsort(-np.take_along_axis(magnitude, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def get_shap_explanations(pipeline, df_preprocessed, predicted_class_index: int, top_k: int = 7,
+                          backend: str = None, feature_index: FeatureIndex = None,
+                          aggregate: bool = False) -> List[Dict]:
     """
     Produce top-k SHAP explanations for the predicted class.
 
@@ -129,38 +329,72 @@ def get_shap_explanations(pipeline, df_preprocessed, predicted_class_index: int,
         df_preprocessed: preprocessed array (1 x n_features) produced by pipeline.named_steps['pre'].transform(df)
         predicted_class_index: int index of predicted class
         top_k: number of top features to return
+        backend: "native" (default) or "shap"
+        feature_index: precomputed FeatureIndex (resolved from the pipeline once if omitted)
+        aggregate: sum one-hot columns back to their raw field (e.g. "Experience with frameworks")
 
     Returns:
         List of dicts: {"feature": <name>, "impact": <float>}
     """
-    # shap_values may be list (multi-class) or array (binary/regression)
-    shap_values = explainer.shap_values(df_preprocessed)
+    return get_shap_explanations_batch(
+        pipeline, df_preprocessed, [predicted_class_index], top_k=top_k, backend=backend,
+        feature_index=feature_index, aggregate=aggregate
+    )[0]
+
+
+def get_shap_explanations_batch(pipeline, df_preprocessed, predicted_class_indices, top_k: int = 7,
+                                backend: str = None, feature_index: FeatureIndex = None,
+                                aggregate: bool = False) -> List[List[Dict]]:
+    """
+    Batch version of get_shap_explanations: ONE attribution call for the whole matrix.
+
+    Args:
+        pipeline: trained sklearn Pipeline (must have 'pre' ColumnTransformer)
+        df_preprocessed: preprocessed matrix (n_samples x n_features)
+        predicted_class_indices: sequence of predicted class indices, one per row
+        top_k: number of top features to return per row
+        backend: "native" (default) or "shap"
+        feature_index: precomputed FeatureIndex (resolved from the pipeline once if omitted)
+        aggregate: sum one-hot columns back to their raw field
+
+    Returns:
+        List (one per row, input order) of lists of {"feature": <name>, "impact": <float>}
+    """
+    n_rows = df_preprocessed.shape[0]
+    class_idx = np.asarray(predicted_class_indices, dtype=int)
+
+    contributions = compute_contributions(pipeline, df_preprocessed, backend=backend)
 
-    # Handle several shap output shapes robustly
     try:
-        # If multi-class, shap_values is list-like where each element is (n_samples, n_features)
-        if isinstance(shap_values, (list, tuple)):
-            shap_for_pred = shap_values[predicted_class_index][0]
+        if contributions.shape[0] > 1:
+            # pick the predicted class per row
+            shap_for_pred = contributions[class_idx, np.arange(n_rows)]
         else:
-            # binary/regression: shap_values is (n_samples, n_features)
-            shap_for_pred = shap_values[0]
+            shap_for_pred = contributions[0]
     except Exception:
-        return [{"feature": "SHAP_unavailable", "impact": 0.0}]
+        return [[{"feature": "SHAP_unavailable", "impact": 0.0}] for _ in range(n_rows)]
 
-    feature_names = extract_feature_names_from_pipeline(pipeline)
+    if feature_index is None:
+        feature_index = get_feature_index(pipeline)
 
-    if len(feature_names) != len(shap_for_pred):
-        # return an informative message rather than crashing
-        return [{
-            "feature": f"FEATURE_MISMATCH (expected {len(feature_names)} names, got {len(shap_for_pred)})",
+    if len(feature_index) != shap_for_pred.shape[1]:
+        mismatch = [{
+            "feature": f"FEATURE_MISMATCH (expected {len(feature_index)} names, got {shap_for_pred.shape[1]})",
             "impact": 0.0
         }]
+        return [mismatch for _ in range(n_rows)]
+
+    if aggregate:
+        shap_for_pred = feature_index.aggregate(shap_for_pred)
+        feature_names = feature_index.group_names
+    else:
+        feature_names = feature_index.names
 
-    sorted_idx = np.argsort(np.abs(shap_for_pred))[::-1][:top_k]
+    sorted_idx = _top_k_indices(shap_for_pred, top_k)
 
     return [
-        {"feature": feature_names[i], "impact": float(shap_for_pred[i])}
-        for i in sorted_idx
+        [{"feature": feature_names[j], "impact": float(shap_for_pred[i, j])} for j in row_idx]
+        for i, row_idx in enumerate(sorted_idx)
     ]
 
 
@@ -0,0 +1,164 @@
+# src/forest.py
+"""
+Pure-NumPy evaluator for the trained XGBoost forest (a dependency-free reference scorer).
+
+For one row, Booster.predict spends most of its time building a DMatrix and crossing the
+C API, not walking 250 rounds x 5 classes of depth-6 trees. FlatForest flattens the booster
+(its native JSON model) into contiguous node arrays shared by all trees:
+
+    feature[i], threshold[i]      split of node i (float32, as XGBoost compares)
+    left[i], right[i]             global child indices; a leaf points at itself
+    default_left[i]               direction for a missing value
+    value[i]                      leaf value (learning rate already applied)
+
+and evaluates a whole batch level by level: one (n_rows, n_trees) array of current nodes is
+advanced max_depth times with vectorized gathers, then leaf values are summed per class
+(tree_info) on top of base_score and passed through softmax.
+
+Missing values follow XGBoost's sparse semantics: a CSR entry that is not stored (or NaN)
+is missing and takes the default branch; everything else compares `x < threshold`.
+
+    forest = FlatForest.from_booster(booster)
+    probs = forest.predict_proba(X)       # == XGBClassifier.predict_proba (to best_iteration)
+
+predict.py selects it with PREDICT_SCORER=numpy (see ArtifactStore.forest). Measured against
+Booster.inplace_predict it is slower at every batch size (benchmarks/bench_forest.py), so it
+is kept as a dependency-free reference evaluator, not as the low-latency path.
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+
+class FlatForest:
+    """Flattened multi-class gbtree model (multi:softprob / multi:softmax)."""
+
+    def __init__(self, feature, threshold, left, right, default_left, value, roots, tree_class,
+                 n_classes: int, n_features: int, base_score: float, max_depth: int):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.n_classes = n_classes
+        self.n_features = n_features
+        self.base_score = base_score
+        self.max_depth = max_depth
+        # (n_trees, n_classes) 0/1 matrix: leaf values @ class_map -> per-class margins
+        self.class_map = np.zeros((len(roots), n_classes), dtype=np.float64)
+        self.class_map[np.arange(len(roots)), tree_class] = 1.0
+
+    @classmethod
+    def from_booster(cls, booster) -> "FlatForest":
+        model = json.loads(booster.save_raw(raw_format="json"))
+        learner = model["learner"]
+        objective = learner["objective"]["name"]
+        if objective not in ("multi:softprob", "multi:softmax"):
+            raise ValueError(f"FlatForest: unsupported objective '{objective}'.")
+        gbtree = learner["gradient_booster"]
+        if gbtree.get("name") != "gbtree":
+            raise ValueError(f"FlatForest: unsupported booster '{gbtree.get('name')}'.")
+        trees = gbtree["model"]["trees"]
+        tree_info = gbtree["model"]["tree_info"]
+        params = learner["learner_model_param"]
+
+        # XGBClassifier.predict_proba stops at best_iteration (early stopping): same trees here
+        best_iteration = booster.attr("best_iteration")
+        if best_iteration is not None:
+            per_round = int(params["num_class"]) * int(gbtree["model"]["gbtree_model_param"]["num_parallel_tree"])
+            n_trees = (int(best_iteration) + 1) * per_round
+            trees, tree_info = trees[:n_trees], tree_info[:n_trees]
+
+        feature, threshold, left, right, default_left, value, roots = [], [], [], [], [], [], []
+        max_depth, offset = 0, 0
+        for tree in trees:
+            if tree["categories_nodes"]:
+                raise ValueError("FlatForest: categorical splits are not supported.")
+            lc = np.asarray(tree["left_children"], dtype=np.int64)
+            rc = np.asarray(tree["right_children"], dtype=np.int64)
+            cond = np.asarray(tree["split_conditions"], dtype=np.float32)
+            is_leaf = lc == -1
+            own = np.arange(len(lc))
+
+            feature.append(np.where(is_leaf, 0, tree["split_indices"]))
+            threshold.append(cond)
+            left.append(np.where(is_leaf, own, lc) + offset)
+            right.append(np.where(is_leaf, own, rc) + offset)
+            default_left.append(np.asarray(tree["default_left"], dtype=bool))
+            value.append(np.where(is_leaf, cond, 0.0))
+            roots.append(offset)
+            max_depth = max(max_depth, _depth(lc, rc))
+            offset += len(lc)
+
+        return cls(
+            feature=np.concatenate(feature).astype(np.int64),
+            threshold=np.concatenate(threshold),
+            left=np.concatenate(left),
+            right=np.concatenate(right),
+            default_left=np.concatenate(default_left),
+            value=np.concatenate(value).astype(np.float32),
+            roots=np.asarray(roots, dtype=np.int64),
+            tree_class=np.asarray(tree_info, dtype=np.int64),
+            n_classes=int(params["num_class"]),
+            n_features=int(params["num_feature"]),
+            base_score=float(params["base_score"]),
+            max_depth=max_depth,
+        )
+
+    def _dense(self, X) -> np.ndarray:
+        """float32 matrix with NaN wherever XGBoost sees a missing value."""
+        if sparse.issparse(X):
+            X = X.tocsr()
+            out = np.full(X.shape, np.nan, dtype=np.float32)
+            rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+            out[rows, X.indices] = X.data
+            return out
+        return np.asarray(X, dtype=np.float32)
+
+    def margins(self, X) -> np.ndarray:
+        """(n_rows, n_classes) raw scores."""
+        X = self._dense(X)
+        n = X.shape[0]
+        rows = np.arange(n)[:, None]
+        node = np.broadcast_to(self.roots, (n, len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[node]]
+            go_left = np.where(np.isnan(x), self.default_left[node], x < self.threshold[node])
+            node = np.where(go_left, self.left[node], self.right[node])
+        leaves = self.value[node].astype(np.float64)
+        return leaves @ self.class_map + self.base_score
+
+    def predict_proba(self, X) -> np.ndarray:
+        """(n_rows, n_classes) softmax probabilities."""
+        m = self.margins(X)
+        m -= m.max(axis=1, keepdims=True)
+        np.exp(m, out=m)
+        m /= m.sum(axis=1, keepdims=True)
+        return m
+
+
+def build_forest(booster):
+    """
+    FlatForest for a booster, or None if the model uses anything FlatForest cannot evaluate.
+    The reason is logged: callers fall back to XGBoost (ArtifactStore caches the result, so
+    this prints once per loaded model).
+    """
+    try:
+        return FlatForest.from_booster(booster)
+    except ValueError as e:
+        print(f"⚠️ {e} PREDICT_SCORER=numpy falls back to XGBClassifier.predict_proba.")
+        return None
+
+
+def _depth(left: np.ndarray, right: np.ndarray) -> int:
+    """Number of edges on the longest root-to-leaf path of one tree."""
+    depth, frontier = 0, [0]
+    while True:
+        frontier = [c for i in frontier if left[i] != -1 for c in (left[i], right[i])]
+        if not frontier:
+            return depth
+        depth += 1
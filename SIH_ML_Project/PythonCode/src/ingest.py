@@ -0,0 +1,199 @@
+# src/ingest.py
+"""
+Data-ingest stage for training.
+
+Reading the Excel workbook with openpyxl is the slowest step of a retrain, so the
+workbook is converted ONCE into a typed columnar cache (Arrow/Feather, uncompressed)
+keyed by the SHA-256 of the source file. Later runs memory-map the cache instead of
+re-parsing the workbook. Numeric fields are coerced with vectorized
+pd.to_numeric(errors="coerce") (same result as the old per-cell to_num).
+
+pyarrow is optional: without it, the workbook is read directly every time.
+"""
+
+import hashlib
+import os
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # optional dependency
+    pa = None
+    feather = None
+
+
+# ================================================================
+# 1. CONFIG
+# ================================================================
+# bump when the cleaning below changes, so stale caches are not reused
+INGEST_VERSION = "1"
+
+NUMERIC_FIELDS = [
+    "CGPA", "Matriculation Percentage", "Intermediate Percentage",
+    "Data Structures And Algorithm Marks", "DBMS Marks",
+    "GitHub total repositories", "GitHub commits/month",
+    "Coding practice hours/week", "Aptitude score", "Attandance",
+    "Number of backlogs", "Number of Reappears"
+]
+
+# strings pd.read_excel / pd.read_csv read as NaN by default (the default `na_values` list
+# in the pandas IO docs); the chunked openpyxl reader applies the same rule per cell
+DEFAULT_NA_VALUES = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+])
+
+
+# ================================================================
+# 2. HELPERS
+# ================================================================
+def file_sha256(path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def read_source(path) -> pd.DataFrame:
+    """Read an Excel / CSV / Parquet source file as-is."""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".xlsx", ".xls"):
+        return pd.read_excel(path)
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def iter_source_chunks(path, chunk_rows: int = 50_000):
+    """
+    Yield cleaned frames of at most chunk_rows rows without loading the whole source.
+    CSV streams through pandas' chunked reader, Parquet through pyarrow record batches and
+    .xlsx through openpyxl's read-only row iterator (first sheet, first row = header);
+    legacy .xls cannot be read incrementally, so it is loaded once and sliced.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield clean_frame(_restore_nulls(batch.to_pandas()))
+    elif suffix == ".xlsx":
+        for chunk in _iter_xlsx_rows(path, chunk_rows):
+            yield clean_frame(_restore_nulls(chunk))
+    elif suffix == ".xls":
+        df = clean_frame(read_source(path))
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+    else:
+        for chunk in pd.read_csv(path, chunksize=chunk_rows):
+            yield clean_frame(chunk)
+
+
+def _iter_xlsx_rows(path, chunk_rows: int):
+    """Raw frames of the first worksheet, chunk_rows rows at a time (openpyxl read-only mode)."""
+    from openpyxl import load_workbook
+
+    def cell(v):
+        return None if isinstance(v, str) and v in DEFAULT_NA_VALUES else v
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = [f"Unnamed: {i}" if c is None else str(c) for i, c in enumerate(next(rows, ()))]
+        width = len(header)
+        batch = []
+        for row in rows:
+            if all(v is None for v in row):
+                continue   # pd.read_excel skips blank rows too
+            batch.append([cell(v) for v in row[:width]])
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame.from_records(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch, columns=header)
+    finally:
+        wb.close()
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip header whitespace and coerce NUMERIC_FIELDS to float64 (junk / NaN -> 0.0)."""
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in NUMERIC_FIELDS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0).astype("float64")
+    return df
+
+
+def _restore_nulls(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow hands string nulls back as None; restore NaN so the frame matches read_source()."""
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def cache_path_for(source, cache_dir, digest: str) -> Path:
+    return Path(cache_dir) / f"{Path(source).stem}.{digest[:16]}.v{INGEST_VERSION}.feather"
+
+
+# ================================================================
+# 3. INGEST
+# ================================================================
+def load_training_data(source, cache_dir=None, verbose: bool = True) -> pd.DataFrame:
+    """
+    Return the cleaned training frame for `source`.
+    Warm cache: memory-map <cache_dir>/<stem>.<hash>.feather.
+    Cold cache: read the workbook, clean it, write the cache atomically.
+    """
+    if cache_dir is None:
+        cache_dir = Path(source).parent / ".cache"
+
+    if feather is None:
+        if verbose:
+            print("⚠️ pyarrow not installed: reading source without columnar cache.")
+        return clean_frame(read_source(source))
+
+    digest = file_sha256(source)
+    cache_file = cache_path_for(source, cache_dir, digest)
+
+    if cache_file.exists():
+        if verbose:
+            print(f"⚡ Using columnar cache → {cache_file}")
+        return _restore_nulls(feather.read_table(cache_file, memory_map=True).to_pandas())
+
+    df = clean_frame(read_source(source))
+
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        feather.write_feather(df, tmp, compression="uncompressed")
+        os.replace(tmp, cache_file)
+        if verbose:
+            print(f"💾 Wrote columnar cache → {cache_file}")
+    except (pa.ArrowException, OSError) as e:
+        if verbose:
+            print(f"⚠️ Could not write columnar cache ({e}); continuing without it.")
+
+    return df
+
+
+# ================================================================
+# 4. DEBUG: cold vs warm ingest time
+# ================================================================
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    source = "data/BTech_Student_DatasetFinalOk.xlsx"
+    cache_dir = tempfile.mkdtemp()
+    try:
+        for label in ("cold", "warm", "warm"):
+            t0 = time.perf_counter()
+            frame = load_training_data(source, cache_dir=cache_dir, verbose=False)
+            print(f"{label}: {(time.perf_counter() - t0) * 1e3:8.1f} ms  ({frame.shape[0]} rows)")
+    finally:
+        shutil.rmtree(cache_dir)
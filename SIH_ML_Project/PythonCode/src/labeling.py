@@ -0,0 +1,334 @@
+# src/labeling.py
+"""
+Rule-based 'Recommended Career' labeling for the B.Tech dataset.
+
+ - generate_career(row):  original row-wise rules (reference implementation)
+ - generate_careers(df):  vectorized equivalent for large exports; computes the six
+                          career score columns with NumPy column ops and picks the
+                          argmax with the same "<= 0 -> Software Engineer" fallback.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# ================================================================
+# 1. SAFE NUMERIC CONVERSION
+# ================================================================
+def to_num(x, default=0.0):
+    try:
+        if pd.isna(x):
+            return default
+        return float(x)
+    except:
+        return default
+
+
+# ================================================================
+# 2. ROW-WISE RULES (reference)
+# ================================================================
+def generate_career(row):
+    # ---- Numeric features ----
+    dsa         = to_num(row.get("Data Structures And Algorithm Marks", 0))
+    dbms        = to_num(row.get("DBMS Marks", 0))
+    cgpa        = to_num(row.get("CGPA", 0))
+    repos       = to_num(row.get("GitHub total repositories", 0))
+    commits     = to_num(row.get("GitHub commits/month", 0))
+    coding      = to_num(row.get("Coding practice hours/week", 0))
+    aptitude    = to_num(row.get("Aptitude score", 0))
+    backlogs    = to_num(row.get("Number of backlogs", 0))
+    reappears   = to_num(row.get("Number of Reappears", 0))
+    attendance  = to_num(row.get("Attandance", 0))
+
+    # ---- English proficiency (dropdown text -> numeric) ----
+    english_raw = str(row.get("English proficiency", "Fair")).strip().lower()
+    english_map = {
+        "poor": 40,
+        "fair": 60,
+        "good": 80,
+        "excellent": 95,
+    }
+    english = english_map.get(english_raw, 60)   # default to "Fair"
+
+    # ---- Text features ----
+    # "Experience with frameworks" can be comma/semicolon separated
+    frameworks_text = str(row.get("Experience with frameworks", "")).lower()
+    frameworks = [
+        f.strip()
+        for f in frameworks_text.replace(",", ";").split(";")
+        if f.strip()
+    ]
+    prog_prof = str(row.get("Programming proficiency", "")).lower()
+
+    # ---- Score container ----
+    scores = {
+        "AI/ML Engineer": 0,
+        "Software Engineer": 0,
+        "Web Developer": 0,
+        "Data Analyst": 0,
+        "DevOps Engineer": 0,
+        "Cyber Security Engineer": 0,
+    }
+
+    # ---------- COMMON SIGNALS ----------
+    if cgpa >= 8.0:
+        for r in scores:
+            scores[r] += 1
+    if cgpa >= 8.5:
+        for r in scores:
+            scores[r] += 1
+
+    if backlogs > 0 or reappears > 0:
+        for r in scores:
+            scores[r] -= 1
+    if backlogs >= 3 or reappears >= 3:
+        for r in scores:
+            scores[r] -= 1
+    if attendance < 70:
+        for r in scores:
+            scores[r] -= 1
+
+    if english >= 70:
+        for r in scores:
+            scores[r] += 1
+    if aptitude >= 70:
+        for r in scores:
+            scores[r] += 1
+
+    # ---------- AI / ML Engineer ----------
+    if dsa >= 80:
+        scores["AI/ML Engineer"] += 1
+    if "python" in frameworks:
+        scores["AI/ML Engineer"] += 1
+    if any(f in frameworks for f in ["numpy", "pandas", "tensorflow", "pytorch", "sklearn"]):
+        scores["AI/ML Engineer"] += 2
+    if coding >= 8:
+        scores["AI/ML Engineer"] += 1
+    if aptitude >= 85 and cgpa >= 8.5 and dsa >= 85:
+        scores["AI/ML Engineer"] += 2
+
+    # ---------- Software Engineer ----------
+    if dsa >= 75:
+        scores["Software Engineer"] += 2
+    if coding >= 10:
+        scores["Software Engineer"] += 2
+    if repos >= 2:
+        scores["Software Engineer"] += 1
+    if commits >= 4:
+        scores["Software Engineer"] += 1
+    if any(lang in frameworks for lang in ["java", "c++", "c#", "golang"]):
+        scores["Software Engineer"] += 1
+    if "advanced" in prog_prof or "intermediate" in prog_prof:
+        scores["Software Engineer"] += 1
+
+    # ---------- Web Developer ----------
+    if any(f in frameworks for f in [
+        "html", "css", "javascript", "react", "angular",
+        "vue", "django", "node", "next.js", "express"
+    ]):
+        scores["Web Developer"] += 2
+    if coding >= 6:
+        scores["Web Developer"] += 1
+    if repos >= 2:
+        scores["Web Developer"] += 1
+    if commits >= 4:
+        scores["Web Developer"] += 1
+
+    # ---------- Data Analyst ----------
+    if dbms >= 75:
+        scores["Data Analyst"] += 2
+    if aptitude >= 65:
+        scores["Data Analyst"] += 1
+    if any(f in frameworks for f in ["excel", "power bi", "tableau", "sql"]):
+        scores["Data Analyst"] += 2
+    if any(f in frameworks for f in ["numpy", "pandas"]):
+        scores["Data Analyst"] += 1
+    if coding >= 4:
+        scores["Data Analyst"] += 1
+
+    # ---------- DevOps Engineer ----------
+    if any(k in frameworks for k in [
+        "devops", "docker", "kubernetes", "k8s", "aws",
+        "azure", "gcp", "jenkins", "ci/cd", "cloud"
+    ]):
+        scores["DevOps Engineer"] += 3
+    if repos >= 2:
+        scores["DevOps Engineer"] += 1
+    if commits >= 5:
+        scores["DevOps Engineer"] += 1
+    if aptitude >= 70:
+        scores["DevOps Engineer"] += 1
+
+    # ---------- Cyber Security Engineer ----------
+    if any(k in frameworks for k in [
+        "security", "cyber", "network", "penetration testing",
+        "ethical hacking", "kali"
+    ]):
+        scores["Cyber Security Engineer"] += 3
+    if "security" in prog_prof or "cyber" in prog_prof:
+        scores["Cyber Security Engineer"] += 2
+    if aptitude >= 70:
+        scores["Cyber Security Engineer"] += 1
+
+    # ---------- FINAL SELECTION ----------
+    best_role = max(scores, key=scores.get)
+    best_score = scores[best_role]
+
+    if best_score <= 0:
+        return "Software Engineer"  # very weak signals: safe default
+
+    return best_role
+
+
+# ================================================================
+# 3. VECTORIZED RULES
+# ================================================================
+# bump when the rules change, so cached label columns (train_model.py) are not reused
+LABELING_VERSION = "1"
+
+CAREERS = [
+    "AI/ML Engineer",
+    "Software Engineer",
+    "Web Developer",
+    "Data Analyst",
+    "DevOps Engineer",
+    "Cyber Security Engineer",
+]
+DEFAULT_CAREER = "Software Engineer"
+
+ENGLISH_MAP = {
+    "poor": 40,
+    "fair": 60,
+    "good": 80,
+    "excellent": 95,
+}
+
+# keyword groups matched against the tokenized "Experience with frameworks" list
+FRAMEWORK_GROUPS = {
+    "python": ["python"],
+    "ml_libs": ["numpy", "pandas", "tensorflow", "pytorch", "sklearn"],
+    "sw_langs": ["java", "c++", "c#", "golang"],
+    "web": ["html", "css", "javascript", "react", "angular",
+            "vue", "django", "node", "next.js", "express"],
+    "analytics": ["excel", "power bi", "tableau", "sql"],
+    "data_libs": ["numpy", "pandas"],
+    "devops": ["devops", "docker", "kubernetes", "k8s", "aws",
+               "azure", "gcp", "jenkins", "ci/cd", "cloud"],
+    "security": ["security", "cyber", "network", "penetration testing",
+                 "ethical hacking", "kali"],
+}
+
+
+def _numeric_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Vectorized to_num over a column (missing column / NaN / junk -> 0.0)."""
+    if col not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+
+
+def _text_column(df: pd.DataFrame, col: str, default: str) -> pd.Series:
+    """str(value) per row, like row.get(col, default) followed by str()."""
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[col].astype(str)
+
+
+def tokenize_frameworks(text: str) -> list:
+    """'MERN, MEAN; React' -> ['mern', 'mean', 'react'] (comma/semicolon separated)."""
+    return [f.strip() for f in str(text).lower().replace(",", ";").split(";") if f.strip()]
+
+
+def framework_multi_hot(frameworks: pd.Series):
+    """
+    Tokenize each DISTINCT frameworks string once and build a multi-hot matrix.
+    Returns (codes, vocab, matrix) where matrix[codes] is the per-row multi-hot.
+    """
+    codes, uniques = pd.factorize(frameworks, sort=False)
+    token_lists = [tokenize_frameworks(u) for u in uniques]
+
+    vocab = {}
+    for tokens in token_lists:
+        for t in tokens:
+            vocab.setdefault(t, len(vocab))
+
+    matrix = np.zeros((len(uniques), len(vocab)), dtype=bool)
+    for i, tokens in enumerate(token_lists):
+        matrix[i, [vocab[t] for t in tokens]] = True
+
+    return codes, vocab, matrix
+
+
+def generate_careers(df: pd.DataFrame) -> pd.Series:
+    """Vectorized generate_career over a whole DataFrame (same labels, same index)."""
+    n = len(df)
+
+    # ---- Numeric features ----
+    dsa        = _numeric_column(df, "Data Structures And Algorithm Marks")
+    dbms       = _numeric_column(df, "DBMS Marks")
+    cgpa       = _numeric_column(df, "CGPA")
+    repos      = _numeric_column(df, "GitHub total repositories")
+    commits    = _numeric_column(df, "GitHub commits/month")
+    coding     = _numeric_column(df, "Coding practice hours/week")
+    aptitude   = _numeric_column(df, "Aptitude score")
+    backlogs   = _numeric_column(df, "Number of backlogs")
+    reappears  = _numeric_column(df, "Number of Reappears")
+    attendance = _numeric_column(df, "Attandance")
+
+    # ---- English proficiency ----
+    english = (
+        _text_column(df, "English proficiency", "Fair").str.strip().str.lower()
+        .map(ENGLISH_MAP).fillna(60).to_numpy(dtype=np.float64)
+    )
+
+    # ---- Text features ----
+    codes, vocab, matrix = framework_multi_hot(_text_column(df, "Experience with frameworks", ""))
+    has = {}
+    for group, keywords in FRAMEWORK_GROUPS.items():
+        cols = [vocab[k] for k in keywords if k in vocab]
+        per_unique = matrix[:, cols].any(axis=1) if cols else np.zeros(len(matrix), dtype=bool)
+        has[group] = per_unique[codes] if n else np.zeros(0, dtype=bool)
+
+    prog_prof = _text_column(df, "Programming proficiency", "").str.lower()
+    prog_sw = (prog_prof.str.contains("advanced", regex=False)
+               | prog_prof.str.contains("intermediate", regex=False)).to_numpy()
+    prog_sec = (prog_prof.str.contains("security", regex=False)
+                | prog_prof.str.contains("cyber", regex=False)).to_numpy()
+
+    def pts(mask, value=1):
+        return np.where(mask, value, 0).astype(np.int32)
+
+    # ---------- COMMON SIGNALS ----------
+    common = (
+        pts(cgpa >= 8.0) + pts(cgpa >= 8.5)
+        - pts((backlogs > 0) | (reappears > 0))
+        - pts((backlogs >= 3) | (reappears >= 3))
+        - pts(attendance < 70)
+        + pts(english >= 70) + pts(aptitude >= 70)
+    )
+
+    scores = np.empty((n, len(CAREERS)), dtype=np.int32)
+
+    # ---------- AI / ML Engineer ----------
+    scores[:, 0] = (pts(dsa >= 80) + pts(has["python"]) + pts(has["ml_libs"], 2) + pts(coding >= 8)
+                    + pts((aptitude >= 85) & (cgpa >= 8.5) & (dsa >= 85), 2))
+    # ---------- Software Engineer ----------
+    scores[:, 1] = (pts(dsa >= 75, 2) + pts(coding >= 10, 2) + pts(repos >= 2) + pts(commits >= 4)
+                    + pts(has["sw_langs"]) + pts(prog_sw))
+    # ---------- Web Developer ----------
+    scores[:, 2] = (pts(has["web"], 2) + pts(coding >= 6) + pts(repos >= 2) + pts(commits >= 4))
+    # ---------- Data Analyst ----------
+    scores[:, 3] = (pts(dbms >= 75, 2) + pts(aptitude >= 65) + pts(has["analytics"], 2)
+                    + pts(has["data_libs"]) + pts(coding >= 4))
+    # ---------- DevOps Engineer ----------
+    scores[:, 4] = (pts(has["devops"], 3) + pts(repos >= 2) + pts(commits >= 5) + pts(aptitude >= 70))
+    # ---------- Cyber Security Engineer ----------
+    scores[:, 5] = (pts(has["security"], 3) + pts(prog_sec, 2) + pts(aptitude >= 70))
+
+    scores += common[:, None]
+
+    # ---------- FINAL SELECTION ----------
+    best = scores.argmax(axis=1)  # first max wins, same as max(dict, key=...)
+    labels = np.asarray(CAREERS, dtype=object)[best]
+    labels[scores[np.arange(n), best] <= 0] = DEFAULT_CAREER
+
+    return pd.Series(labels, index=df.index, name="Recommended Career")
@@ -0,0 +1,234 @@
+# src/metrics.py
+"""
+Dependency-free Prometheus-style metrics + per-stage timers for the prediction path.
+
+    with stage("encode", store.version):
+        X = row_encoder.encode(row)
+
+records the block's duration in the `career_stage_seconds{stage="encode",version="..."}`
+histogram and, when a request is being profiled (see profile()), in that request's
+breakdown. The version label keeps timings of two models apart after a hot reload.
+
+render() returns everything in the Prometheus text exposition format (served on
+/metrics by the API). Collectors registered with add_collector() add gauges that are
+computed at scrape time (cache hit rate, active model version, ...).
+
+METRICS_ENABLED=0 turns recording off: counters/histograms return immediately and
+stage() hands back a shared no-op context manager unless a profile is active, so the
+hot path pays one flag check per call.
+
+Metrics live in the process that recorded them; with INFERENCE_WORKERS > 0 the
+per-stage timings happen inside the worker processes (src/workers.py) and only the
+request-level metrics of the API process are exported.
+"""
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+ENABLED = os.getenv("METRICS_ENABLED", "1") != "0"
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+# -------------------------------------------------------------
+# EXPOSITION HELPERS
+# -------------------------------------------------------------
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# -------------------------------------------------------------
+# METRIC TYPES
+# -------------------------------------------------------------
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if not ENABLED:
+            return
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}   # label values -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        if not ENABLED:
+            return
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[i] += 1
+            series[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(k, list(v)) for k, v in sorted(self._series.items())]
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), series[:-1]):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+# -------------------------------------------------------------
+# REGISTRY
+# -------------------------------------------------------------
+_metrics = []
+_collectors = []
+
+
+def counter(name: str, help: str, labelnames: tuple = ()) -> Counter:
+    metric = Counter(name, help, labelnames)
+    _metrics.append(metric)
+    return metric
+
+
+def histogram(name: str, help: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+    metric = Histogram(name, help, labelnames, buckets)
+    _metrics.append(metric)
+    return metric
+
+
+def add_collector(fn) -> None:
+    """fn() -> list of (name, type, help, [(labels dict, value), ...]) computed at scrape time."""
+    _collectors.append(fn)
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    for fn in _collectors:
+        for name, kind, help, samples in fn():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------------------------------------------
+# PREDICTION-PATH METRICS
+# -------------------------------------------------------------
+REQUESTS = counter("career_requests_total", "HTTP requests by endpoint and status code.", ("endpoint", "status"))
+REQUEST_SECONDS = histogram("career_request_seconds", "End-to-end request latency.", ("endpoint",))
+STAGE_SECONDS = histogram("career_stage_seconds", "Time spent per prediction stage and model version.",
+                          ("stage", "version"))
+BATCH_SIZE = histogram("career_batch_size", "Rows per model call (micro-batches and /predict/batch).",
+                       ("source",), buckets=SIZE_BUCKETS)
+
+
+# -------------------------------------------------------------
+# STAGE TIMERS + REQUEST PROFILING
+# -------------------------------------------------------------
+_profile = ContextVar("career_profile", default=None)
+
+
+class _StageTimer:
+    __slots__ = ("name", "version", "t0")
+
+    def __init__(self, name: str, version: str = ""):
+        self.name = name
+        self.version = version
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.t0
+        STAGE_SECONDS.observe(elapsed, stage=self.name, version=self.version)
+        breakdown = _profile.get()
+        if breakdown is not None:
+            breakdown[self.name] = breakdown.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopTimer()
+
+
+def stage(name: str, version: str = ""):
+    """Context manager timing one prediction stage of model `version` (no-op when metrics and profiling are off)."""
+    if ENABLED or _profile.get() is not None:
+        return _StageTimer(name, version)
+    return _NOOP
+
+
+@contextmanager
+def profile():
+    """Collect {stage: seconds} for every stage() run inside this block (same thread/context)."""
+    breakdown = {}
+    token = _profile.set(breakdown)
+    try:
+        yield breakdown
+    finally:
+        _profile.reset(token)
+
+
+def server_timing(breakdown: dict) -> str:
+    """Format a profile as a Server-Timing header value (durations in ms)."""
+    return ", ".join(f"{name};dur={seconds * 1e3:.3f}" for name, seconds in breakdown.items())
+
+
+def _reset_locks_after_fork() -> None:
+    for metric in _metrics:
+        metric._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
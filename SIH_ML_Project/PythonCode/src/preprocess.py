@@ -2,9 +2,13 @@
 """
 Preprocessing for the B.Tech Career Guidance dataset.
 This version correctly maps frontend clean field names to raw dataset column names.
+Also provides RowEncoder: a compiled dict -> feature-vector fast path for single requests.
 """
 
+import math
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 
 # -------------------------------------------------------------
@@ -67,6 +71,173 @@ def preprocess_input(data: dict) -> pd.DataFrame:
     return df
 
 
+def preprocess_many(rows: list) -> pd.DataFrame:
+    """Convert a list of API JSON dicts → one DataFrame (input order kept) → ready for model."""
+
+    df = pd.DataFrame(rows)
+
+    if "Name" in df.columns:
+        df = df.drop(columns=["Name"])
+
+    df = rename_to_raw_columns(df)
+
+    for raw_col in COLUMN_MAP.values():
+        if raw_col not in df.columns:
+            df[raw_col] = 0
+
+    df = df.fillna(0)
+
+    return df.reset_index(drop=True)
+
+
+# -------------------------------------------------------------
+# 4. COMPILED ROW ENCODER (dict -> feature vector, no pandas)
+# -------------------------------------------------------------
+RAW_TO_CLEAN = {raw: clean for clean, raw in COLUMN_MAP.items()}
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _onehot_hits(lookup: dict):
+    def hits(value):
+        col = lookup.get(value)
+        return () if col is None else (col,)
+    return hits
+
+
+def _block_hits(transformer, j: int, offset: int):
+    def hits(value):
+        return [offset + c for c in transformer.row_hits(j, value)]
+    return hits
+
+
+class RowEncoder:
+    """
+    Compiled version of a fitted ColumnTransformer for ONE normalized row.
+
+    Built once from the pipeline's 'pre' step:
+      - StandardScaler / passthrough columns -> precomputed mean + scale arrays
+      - OneHotEncoder columns               -> {category: output column} dict per field
+      - custom encoders with row_hits()     -> their own per-value column lookup (src/encoders.py)
+    encode() maps a cleaned-key dict (output of normalize_input_any) straight to the
+    same 1 x n_features matrix pre.transform(preprocess_input(...)) would produce,
+    bit-for-bit, including sparse vs dense output.
+
+    Only StandardScaler, plain OneHotEncoder (no drop / infrequent categories),
+    row_hits() encoders, passthrough and drop are supported; anything else raises ValueError so callers
+    can fall back to the pandas path.
+    """
+
+    def __init__(self, pre):
+        if not hasattr(pre, "transformers_"):
+            raise ValueError("RowEncoder needs a fitted ColumnTransformer.")
+
+        num_keys, num_cols, means, scales = [], [], [], []
+        cat_fields = []  # (clean key, value -> list of output columns set to 1.0)
+        offset = 0
+
+        for _, transformer, cols in pre.transformers_:
+            cols = [cols] if isinstance(cols, str) else list(cols)
+            if transformer == "drop" or not cols:
+                continue
+
+            if transformer == "passthrough":
+                num_keys.extend(RAW_TO_CLEAN.get(c, c) for c in cols)
+                num_cols.extend(range(offset, offset + len(cols)))
+                means.append(np.zeros(len(cols)))
+                scales.append(np.ones(len(cols)))
+                offset += len(cols)
+
+            elif type(transformer).__name__ == "StandardScaler":
+                n = len(cols)
+                num_keys.extend(RAW_TO_CLEAN.get(c, c) for c in cols)
+                num_cols.extend(range(offset, offset + n))
+                means.append(transformer.mean_ if transformer.with_mean else np.zeros(n))
+                scales.append(transformer.scale_ if transformer.with_std else np.ones(n))
+                offset += n
+
+            elif type(transformer).__name__ == "OneHotEncoder":
+                if getattr(transformer, "drop_idx_", None) is not None or \
+                        getattr(transformer, "_infrequent_enabled", False):
+                    raise ValueError("RowEncoder: OneHotEncoder with drop/infrequent categories is not supported.")
+                if transformer.handle_unknown != "ignore":
+                    raise ValueError("RowEncoder: OneHotEncoder must use handle_unknown='ignore'.")
+                for col, cats in zip(cols, transformer.categories_):
+                    lookup = {}
+                    for j, cat in enumerate(cats):
+                        # NaN never reaches the encoder (missing -> 0, like preprocess_input's fillna)
+                        if not _is_missing(cat):
+                            lookup[cat] = offset + j
+                    cat_fields.append((RAW_TO_CLEAN.get(col, col), _onehot_hits(lookup)))
+                    offset += len(cats)
+
+            elif hasattr(transformer, "row_hits"):
+                for j, col in enumerate(cols):
+                    cat_fields.append((RAW_TO_CLEAN.get(col, col), _block_hits(transformer, j, offset)))
+                offset += len(transformer.get_feature_names_out(cols))
+
+            else:
+                raise ValueError(f"RowEncoder: unsupported transformer {type(transformer).__name__}.")
+
+        self.n_features = offset
+        self.sparse_output = bool(getattr(pre, "sparse_output_", False))
+        self.num_keys = tuple(num_keys)
+        self.num_cols = np.asarray(num_cols, dtype=np.int32)
+        self.mean = np.concatenate(means) if means else np.zeros(0)
+        self.scale = np.concatenate(scales) if scales else np.ones(0)
+        self.cat_fields = tuple(cat_fields)
+
+    def _entries(self, row: dict):
+        """Sorted (column indices, values) of the non-zero outputs for one row."""
+        x = np.empty(len(self.num_keys), dtype=np.float64)
+        for i, key in enumerate(self.num_keys):
+            value = row.get(key, 0)
+            x[i] = 0.0 if _is_missing(value) else float(value)
+        x -= self.mean
+        x /= self.scale
+
+        hits = []
+        for key, field_hits in self.cat_fields:
+            value = row.get(key, 0)
+            hits.extend(field_hits(0 if _is_missing(value) else value))
+
+        nz = x != 0
+        indices = np.concatenate([self.num_cols[nz], np.asarray(hits, dtype=np.int32)])
+        data = np.concatenate([x[nz], np.ones(len(hits))])
+        order = np.argsort(indices, kind="stable")
+        return indices[order], data[order]
+
+    def encode(self, row: dict):
+        """Cleaned-key dict -> 1 x n_features (scipy CSR or ndarray, matching the ColumnTransformer)."""
+        return self.encode_many([row])
+
+    def encode_many(self, rows: list):
+        """List of cleaned-key dicts -> len(rows) x n_features, one CSR/ndarray for the whole batch."""
+        entries = [self._entries(row) for row in rows]
+
+        if not self.sparse_output:
+            out = np.zeros((len(rows), self.n_features), dtype=np.float64)
+            for i, (indices, data) in enumerate(entries):
+                out[i, indices] = data
+            return out
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in entries])
+        indices = np.concatenate([e[0] for e in entries]) if entries else np.zeros(0, dtype=np.int32)
+        data = np.concatenate([e[1] for e in entries]) if entries else np.zeros(0)
+        return sparse.csr_matrix((data, indices.astype(np.int32), indptr), shape=(len(rows), self.n_features))
+
+
+def build_row_encoder(pre):
+    """RowEncoder for a fitted ColumnTransformer, or None if it uses unsupported transformers."""
+    try:
+        return RowEncoder(pre)
+    except ValueError:
+        return None
+
+
 # -------------------------------------------------------------
 # DEBUG
 # -------------------------------------------------------------
@@ -0,0 +1,198 @@
+# src/registry.py
+"""
+Versioned model registry + zero-downtime reload.
+
+Layout under the model root (models/ by default, see src/artifacts.py):
+    versions/<version>/career_model.pkl, label_mapping.pkl, shap_explainer.pkl,
+                       bundle.json, model.ubj, manifest.json
+    CURRENT                      -> name of the version the API should serve
+
+publish_version() writes a complete version directory under a temporary name, renames
+it into place and only then rewrites CURRENT (atomic os.replace), so a reader can never
+see a half-written pickle.
+
+reload_model() builds a fresh ArtifactStore for a version, verifies the manifest hashes,
+loads + warms it up OFF the request path and then swaps the process-wide reference.
+In-flight requests keep the store they already grabbed; cached responses are dropped.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.artifacts import (
+    ArtifactStore, open_store, swap_store, get_store, read_current_version, resolve_model_dir,
+    CURRENT_FILE, MANIFEST_FILE, MODEL_FILE, VERSIONS_DIR
+)
+from src.cache import get_prediction_cache
+from src.ingest import file_sha256
+
+
+# -------------------------------------------------------------
+# PUBLISH
+# -------------------------------------------------------------
+def _write_current(root: Path, version: str) -> None:
+    tmp = root / f".{CURRENT_FILE}.tmp"
+    tmp.write_text(version + "\n", encoding="utf-8")
+    os.replace(tmp, root / CURRENT_FILE)
+
+
+def publish_version(staging_dir, root=None, metrics: dict = None, params: dict = None,
+                    feature_index=None, activate: bool = True) -> str:
+    """
+    Move the artifact files in `staging_dir` into a new version directory and
+    (optionally) make it CURRENT. Returns the version name.
+    """
+    root = resolve_model_dir(root)
+    staging_dir = Path(staging_dir)
+    versions = root / VERSIONS_DIR
+    versions.mkdir(parents=True, exist_ok=True)
+
+    files = sorted(p for p in staging_dir.iterdir() if p.is_file())
+    hashes = {p.name: file_sha256(p) for p in files}
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    version = f"{stamp}-{hashes.get(MODEL_FILE, 'nomodel')[:8]}"
+
+    manifest = {
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "files": hashes,
+        "metrics": metrics or {},
+        "params": params or {},
+    }
+    if feature_index is not None:
+        manifest["feature_index"] = {"names": list(feature_index.names), "sources": list(feature_index.sources)}
+
+    with open(staging_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+    # same filesystem -> rename is atomic; the version appears complete or not at all
+    tmp_dir = versions / f".tmp-{version}"
+    shutil.copytree(staging_dir, tmp_dir)
+    os.replace(tmp_dir, versions / version)
+
+    if activate:
+        _write_current(root, version)
+    return version
+
+
+def list_versions(root=None) -> list:
+    versions = resolve_model_dir(root) / VERSIONS_DIR
+    if not versions.exists():
+        return []
+    return sorted(p.name for p in versions.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+
+def activate_version(version: str, root=None) -> None:
+    """Point CURRENT at an existing version (rollback / roll forward)."""
+    root = resolve_model_dir(root)
+    if not (root / VERSIONS_DIR / version / MANIFEST_FILE).exists():
+        raise FileNotFoundError(f"❌ Unknown model version '{version}'.")
+    _write_current(root, version)
+
+
+def verify_store(store: ArtifactStore) -> None:
+    """Check every file listed in the manifest against its recorded SHA-256."""
+    if not store.manifest:
+        return
+    for name, digest in store.manifest.get("files", {}).items():
+        path = store.path(name)
+        if not path.exists() or file_sha256(path) != digest:
+            raise RuntimeError(f"❌ Model version '{store.version}': {name} is missing or corrupt.")
+
+
+# -------------------------------------------------------------
+# RELOAD
+# -------------------------------------------------------------
+_reload_lock = threading.Lock()
+
+
+def reload_model(version: str = None, root=None) -> ArtifactStore:
+    """
+    Load `version` (default: CURRENT) fully, then atomically make it the active store.
+    No-op if that version is already active. Raises (and keeps the old model) on failure.
+    """
+    with _reload_lock:
+        target = version or read_current_version(root)
+        active = get_store()
+        if target is not None and target == active.version:
+            return active
+
+        store = open_store(root, target)
+        verify_store(store)
+        store.warm_up()
+        _smoke_test(store)
+
+        swap_store(store)
+        get_prediction_cache().invalidate()
+        print(f"✅ Now serving model version {store.version}")
+        return store
+
+
+def _smoke_test(store: ArtifactStore) -> None:
+    """
+    Run one prediction on the new store so the first real request pays no warm-up cost.
+
+    Runs with nthread=1: InferencePool forks its workers from this process right after the
+    swap, and an OpenMP thread team left behind here can deadlock libgomp in children that
+    use more than one thread (INFERENCE_THREADS_PER_WORKER > 1).
+    """
+    from src.predict import normalize_input_any
+    from src.preprocess import preprocess_input
+
+    row = normalize_input_any({})
+    if store.row_encoder is not None:
+        X = store.row_encoder.encode(row)
+    else:
+        X = store.preprocessor.transform(preprocess_input(row))
+
+    # the store is not published yet, so nobody else sees the temporary thread settings
+    classifier = store.classifier
+    booster = classifier.get_booster()
+    n_jobs = classifier.n_jobs
+    nthread = json.loads(booster.save_config())["learner"]["generic_param"]["nthread"]
+    classifier.n_jobs = 1
+    booster.set_param({"nthread": 1})
+    try:
+        classifier.predict_proba(X)
+    finally:
+        classifier.n_jobs = n_jobs
+        booster.set_param({"nthread": nthread})
+
+
+class ModelWatcher(threading.Thread):
+    """Polls models/CURRENT and reloads in the background when it changes."""
+
+    def __init__(self, root=None, interval: float = 5.0):
+        super().__init__(name="model-watcher", daemon=True)
+        self.root = root
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                current = read_current_version(self.root)
+                if current is not None and current != get_store().version:
+                    reload_model(current, self.root)
+            except Exception as e:  # keep serving the old model
+                print(f"⚠️ Model reload failed: {e}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+if __name__ == "__main__":
+    root = resolve_model_dir()
+    print(f"Model root: {root}")
+    print(f"CURRENT:    {read_current_version(root)}")
+    for v in list_versions(root):
+        print(f" - {v}")
+    t0 = time.perf_counter()
+    reload_model()
+    print(f"reload: {(time.perf_counter() - t0) * 1e3:.0f} ms")
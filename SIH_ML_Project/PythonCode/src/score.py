@@ -0,0 +1,198 @@
+# src/score.py
+"""
+Bulk offline scoring: a whole cohort file in, one prediction row per student out.
+
+    python -m src.score cohort.xlsx -o scored.parquet
+    python -m src.score cohort.csv -o scored.csv --chunk-rows 5000 --top-k 5 --workers 4
+
+Input: CSV, Excel (.xlsx) or Parquet, with either the raw Excel headers
+("Matriculation Percentage") or the cleaned API keys ("Matriculation_Percentage"); both are
+mapped through COLUMN_MAP, and missing fields get the same defaults as the API
+(normalize_input_any). Extra columns (Name, Recommended Career, ...) are ignored for scoring;
+--keep copies some of them into the output (default: Name, if present).
+
+The file is read in fixed-size chunks (ingest.iter_source_chunks) and every chunk goes through
+the same vectorized path as /predict/batch (predict._predict_normalized_batch: one
+predict_proba + one SHAP call per chunk). Results are appended to the output as each chunk
+finishes, so memory is bounded by chunk_rows x (chunks in flight), not by the file size.
+
+Output columns (CSV or Parquet, by the output suffix):
+    row, <kept columns>, prediction, confidence, prob_<career> ...,
+    top1_feature, top1_impact, ... top<k>_feature, top<k>_impact
+
+--workers N scores chunks on a fork-after-load process pool (src/workers.py); at most 2N
+chunks are in flight and output order always follows input order.
+"""
+
+import argparse
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import get_store, set_model_dir
+from src.ingest import clean_frame, iter_source_chunks
+from src.predict import COLUMN_MAP, normalize_input_any, _predict_normalized_batch
+
+DEFAULT_CHUNK_ROWS = 5000
+DEFAULT_KEEP = ("Name",)
+
+
+# ================================================================
+# 1. ONE CHUNK
+# ================================================================
+def score_records(records: list, top_k: int = 7, aggregate: bool = False) -> dict:
+    """Score a list of raw/cleaned-key dicts; returns the output columns (name -> list)."""
+    store = get_store()
+    normalized = [normalize_input_any(r) for r in records]
+    results = _predict_normalized_batch(store, normalized, top_k, aggregate)
+
+    classes = list(store.label_encoder.classes_)
+    columns = {
+        "prediction": [r["prediction"] for r in results],
+        "confidence": [r["confidence"] for r in results],
+    }
+    for label in classes:
+        columns[f"prob_{label}"] = [r["probabilities"][label] for r in results]
+    for k in range(top_k):
+        explanations = [r["top_explanations"][k] if k < len(r["top_explanations"]) else None for r in results]
+        columns[f"top{k + 1}_feature"] = [e["feature"] if e else None for e in explanations]
+        columns[f"top{k + 1}_impact"] = [e["impact"] if e else np.nan for e in explanations]
+    return columns
+
+
+def _prepare(chunk: pd.DataFrame):
+    """Cleaned-key headers -> raw headers (COLUMN_MAP), numeric fields coerced like training input."""
+    chunk = clean_frame(chunk.rename(columns=COLUMN_MAP))
+    fields = [c for c in COLUMN_MAP.values() if c in chunk.columns]
+    return chunk[fields].to_dict(orient="records")
+
+
+# ================================================================
+# 2. STREAMING OUTPUT
+# ================================================================
+class _CsvSink:
+    def __init__(self, path):
+        self.path = path
+        self.header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self.path, mode="w" if self.header else "a", header=self.header, index=False)
+        self.header = False
+
+    def close(self) -> None:
+        pass
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            # later chunks follow the first chunk's schema (e.g. an all-empty Name chunk)
+            table = pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_sink(path):
+    return _ParquetSink(path) if Path(path).suffix.lower() == ".parquet" else _CsvSink(path)
+
+
+# ================================================================
+# 3. WHOLE FILE
+# ================================================================
+def score_file(input_path, output_path, chunk_rows: int = DEFAULT_CHUNK_ROWS, top_k: int = 7,
+               aggregate: bool = False, workers: int = 0, keep=None, verbose: bool = True) -> dict:
+    """
+    Score every row of input_path into output_path (see module docstring).
+    Returns {"rows", "seconds", "rows_per_second"}.
+    """
+    from src.workers import InferencePool
+
+    keep = DEFAULT_KEEP if keep is None else tuple(keep)
+    pool = InferencePool(workers).start() if workers > 0 else None
+    sink = open_sink(output_path)
+    pending = deque()   # (output prefix frame, Future or finished columns), in input order
+    rows = 0
+    t0 = time.perf_counter()
+
+    def flush_one():
+        nonlocal rows
+        prefix, result = pending.popleft()
+        columns = result.result() if pool is not None else result
+        sink.write(pd.concat([prefix, pd.DataFrame(columns)], axis=1))
+        rows += len(prefix)
+        if verbose:
+            elapsed = time.perf_counter() - t0
+            print(f"⏱  {rows} rows scored ({rows / elapsed:,.0f} rows/s)", flush=True)
+
+    try:
+        start = 0
+        for chunk in iter_source_chunks(input_path, chunk_rows):
+            prefix = pd.DataFrame({"row": np.arange(start, start + len(chunk))})
+            for col in keep:
+                if col in chunk.columns:
+                    prefix[col] = chunk[col].to_numpy()
+            start += len(chunk)
+
+            records = _prepare(chunk)
+            if pool is not None:
+                pending.append((prefix, pool.submit(score_records, records, top_k, aggregate)))
+            else:
+                pending.append((prefix, score_records(records, top_k, aggregate)))
+            while len(pending) > 2 * max(workers, 0):
+                flush_one()
+        while pending:
+            flush_one()
+    finally:
+        sink.close()
+        if pool is not None:
+            pool.shutdown()
+
+    seconds = time.perf_counter() - t0
+    stats = {"rows": rows, "seconds": seconds, "rows_per_second": rows / seconds if seconds else 0.0}
+    if verbose:
+        print(f"✅ Scored {rows} rows in {seconds:.1f} s ({stats['rows_per_second']:,.0f} rows/s) → {output_path}")
+    return stats
+
+
+# ================================================================
+# 4. CLI
+# ================================================================
+def main(argv=None) -> dict:
+    p = argparse.ArgumentParser(description="Score a cohort file (CSV / Excel / Parquet) with the career model.")
+    p.add_argument("input", help="cohort file: raw Excel headers or cleaned API keys")
+    p.add_argument("-o", "--output", required=True, help="output .csv or .parquet")
+    p.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    p.add_argument("--top-k", type=int, default=7, help="explanations per row")
+    p.add_argument("--aggregate", action="store_true", help="explanations per raw field instead of per column")
+    p.add_argument("--workers", type=int, default=0, help="worker processes (0 = in-process)")
+    p.add_argument("--keep", nargs="*", help=f"input columns copied to the output (default: {' '.join(DEFAULT_KEEP)})")
+    p.add_argument("--model-dir", help="model root or version directory (default: CAREER_MODEL_DIR / models)")
+    p.add_argument("--quiet", action="store_true")
+    args = p.parse_args(argv)
+
+    if args.model_dir:
+        set_model_dir(args.model_dir)
+    return score_file(args.input, args.output, chunk_rows=args.chunk_rows, top_k=args.top_k,
+                      aggregate=args.aggregate, workers=args.workers, keep=args.keep, verbose=not args.quiet)
+
+
+if __name__ == "__main__":
+    # run through the importable module so pool workers unpickle src.score.score_records
+    from src.score import main as _main
+    _main()
@@ -3,323 +3,589 @@
 Train model for AI-Enhanced Career Guidance using B.Tech dataset.
 Automatically generates 'Recommended Career' target labels using rule-based logic.
 Uses ALL columns (except Name) as model features.
-Saves: career_model.pkl, label_mapping.pkl, shap_explainer.pkl
+Publishes a new model version (career_model.pkl, label_mapping.pkl, shap_explainer.pkl,
+the pickle-free inference bundle bundle.json + model.ubj (src/bundle.py)
++ manifest.json with hashes, feature index and metrics) to the registry in models/.
+
+Importable: nothing runs at import time.
+
+    from src.train_model import TrainConfig, train
+    result = train(TrainConfig(xgb_params={"max_depth": 4}, publish=False))
+
+Every stage (ingest, label, split, encode, fit, evaluate, export) is a separate, timed
+function. Stage outputs are cached so a re-run that only changes XGBoost settings
+skips straight to fit:
+    ingest  -> Feather cache keyed by the source file hash (src/ingest.py)
+    label   -> Feather label column keyed by source hash + LABELING_VERSION
+    encode  -> fitted preprocessor + matrices kept in-process, keyed by data + encoding settings
+
+CLI (from PythonCode/ or src/):
+    python -m src.train_model --max-depth 4 --n-jobs 4 --tree-method hist --no-publish
+    python -m src.train_model --fast          # hist + early stopping, see TrainConfig.fast
+    python -m src.train_model --config train_config.json    # e.g. best params from src/tune.py
+    python -m src.train_model --data big.csv --chunk-rows 50000  # out-of-core, see src/train_stream.py
+    python train_model.py
 """
 
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 import joblib
-from pathlib import Path
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import OneHotEncoder, StandardScaler, LabelEncoder
-from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import LabelEncoder
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import classification_report, confusion_matrix
-import xgboost as xgb
-import shap
 import warnings
 warnings.filterwarnings("ignore")
 
+# Run as a script from src/: make the project root importable so custom transformers
+# are pickled as src.encoders.* (the path the API unpickles them from)
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# ================================================================
-# 1. CONFIG
-# ================================================================
-DATA_PATH = "../data/BTech_Student_DatasetFinalOk.xlsx"
-MODEL_OUTPUT = "../models/career_model.pkl"
-LABEL_OUTPUT = "../models/label_mapping.pkl"
-SHAP_OUTPUT = "../models/shap_explainer.pkl"
-EXPORT_WITH_LABELS = "../data/BTech_Student_Dataset_with_labels.csv"
+from src.artifacts import PROJECT_ROOT, MODEL_FILE, LABEL_FILE, SHAP_FILE
+from src.bundle import export_bundle
+from src.explain import FeatureIndex
+from src.ingest import load_training_data, read_source, clean_frame, file_sha256, INGEST_VERSION
+from src.labeling import generate_careers, LABELING_VERSION
+from src.encoders import build_preprocessor
+from src.registry import publish_version
 
 
 # ================================================================
-# 2. LOAD DATA
+# 1. CONFIG
 # ================================================================
-print("🔄 Loading dataset...")
-df = pd.read_excel(DATA_PATH)
-df.columns = [c.strip() for c in df.columns]
-
-print(f"Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
-
-if "Name" in df.columns:
-    df = df.drop(columns=["Name"])
-    print("🗑 Removed 'Name' column")
+TARGET = "Recommended Career"
+
+DEFAULT_DATA_PATH = str(PROJECT_ROOT / "data" / "BTech_Student_DatasetFinalOk.xlsx")
+LABELED_CSV = str(PROJECT_ROOT / "data" / "BTech_Student_Dataset_with_labels.csv")
+AUTO = "auto"
+
+
+def labeled_csv_path(data_path) -> str:
+    """
+    Default labeled-CSV output for a source: the shipped data/BTech_Student_Dataset_with_labels.csv
+    for the shipped workbook, <source stem>_with_labels.csv next to any other source (so training
+    on another file never overwrites the shipped dataset).
+    """
+    source = Path(data_path)
+    if source.resolve() == Path(DEFAULT_DATA_PATH).resolve():
+        return LABELED_CSV
+    return str(source.with_name(f"{source.stem}_with_labels.csv"))
+
+DEFAULT_XGB_PARAMS = {
+    "n_estimators": 250,
+    "max_depth": 6,
+    "learning_rate": 0.05,
+    "subsample": 0.9,
+    "colsample_bytree": 0.9,
+    "eval_metric": "mlogloss",
+}
+
+
+@dataclass
+class TrainConfig:
+    """Everything a training run depends on. Paths default to the project layout (CWD-independent)."""
+
+    data_path: str = DEFAULT_DATA_PATH
+    cache_dir: Optional[str] = str(PROJECT_ROOT / "data" / ".cache")   # None: no on-disk stage caches
+    models_dir: str = str(PROJECT_ROOT / "models")                    # registry root: versions/<v>/ + CURRENT
+    # labeled CSV output: "auto" = labeled_csv_path(data_path), None = not written
+    export_csv: Optional[str] = AUTO
+
+    # "Experience with frameworks": multi-hot over comma/semicolon tokens ("onehot" = legacy raw-string one-hot)
+    frameworks_encoding: str = "multihot"
+    frameworks_max_tokens: Optional[int] = 32
+    frameworks_min_count: int = 5
+
+    # Free-text "History of Reappear/Backlogs": "capped" one-hot, "hash" buckets, or legacy "onehot".
+    # The fitted encoder is pickled inside career_model.pkl, so predict.py applies the same encoding.
+    text_encoding: str = "capped"
+    text_min_frequency: int = 5
+    text_max_categories: Optional[int] = None
+    text_n_buckets: int = 64
+
+    xgb_params: dict = field(default_factory=dict)    # overrides on top of DEFAULT_XGB_PARAMS
+    n_jobs: Optional[int] = None                      # None: XGBoost default (all cores)
+    tree_method: Optional[str] = None                 # None: XGBoost default ("auto"); e.g. "hist"
+    max_bin: Optional[int] = None                     # histogram bins per feature (hist only; XGBoost default 256)
+    # Early stopping: hold out validation_size of the training split as eval set and stop once
+    # mlogloss has not improved for this many rounds; the booster is then cut to the best round
+    early_stopping_rounds: Optional[int] = None
+    validation_size: float = 0.1
+    seed: int = 42
+    test_size: float = 0.2
+    # Out-of-core mode (src/train_stream.py): stream the source in chunks of this many rows
+    # and train from an XGBoost external-memory DMatrix; None = load everything in memory
+    chunk_rows: Optional[int] = None
+
+    publish: bool = True            # write a new registry version
+    activate: bool = True           # ... and point models/CURRENT at it
+    shap_explainer: bool = True     # also pickle a shap.TreeExplainer (optional SHAP backend)
+    inference_bundle: bool = True   # also write bundle.json + model.ubj (pickle-free serving)
+    verbose: bool = True
+
+    def model_params(self) -> dict:
+        params = {**DEFAULT_XGB_PARAMS, **self.xgb_params, "random_state": self.seed}
+        if self.n_jobs is not None:
+            params["n_jobs"] = self.n_jobs
+        if self.tree_method is not None:
+            params["tree_method"] = self.tree_method
+        if self.max_bin is not None:
+            params["max_bin"] = self.max_bin
+        if self.early_stopping_rounds is not None:
+            params["early_stopping_rounds"] = self.early_stopping_rounds
+        return params
+
+    @classmethod
+    def fast(cls, **overrides) -> "TrainConfig":
+        """
+        Histogram training on every core with early stopping. n_estimators stays an upper
+        bound (250 by default), so a fast model never has more trees than the default one.
+        """
+        settings = {
+            "tree_method": "hist",
+            "max_bin": 256,
+            "n_jobs": os.cpu_count(),
+            "early_stopping_rounds": 25,
+        }
+        settings.update(overrides)
+        return cls(**settings)
+
+    @classmethod
+    def load(cls, path, **overrides) -> "TrainConfig":
+        """Config from a JSON file of field values (e.g. written by src/tune.py); unknown keys are ignored."""
+        with open(path) as f:
+            data = json.load(f)
+        names = {f.name for f in fields(cls)}
+        settings = {k: v for k, v in data.items() if k in names}
+        settings.update(overrides)
+        return cls(**settings)
+
+    def save(self, path, only=None, **extra) -> None:
+        """Write the config (or just the `only` fields) as JSON; extra keys are stored alongside."""
+        data = asdict(self)
+        if only is not None:
+            data = {k: data[k] for k in only}
+        data.update(extra)
+        tmp = Path(str(path) + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2, default=str))
+        os.replace(tmp, path)
+
+    def labeled_csv(self) -> Optional[str]:
+        """Resolved export_csv: where this run writes its labeled CSV, or None."""
+        if self.export_csv == AUTO:
+            return labeled_csv_path(self.data_path)
+        return self.export_csv or None
+
+    def encoding_params(self) -> dict:
+        return {
+            "frameworks_encoding": self.frameworks_encoding,
+            "frameworks_max_tokens": self.frameworks_max_tokens,
+            "frameworks_min_count": self.frameworks_min_count,
+            "text_encoding": self.text_encoding,
+            "text_min_frequency": self.text_min_frequency,
+            "text_max_categories": self.text_max_categories,
+            "text_n_buckets": self.text_n_buckets,
+        }
+
+
+@dataclass
+class TrainResult:
+    pipeline: Pipeline
+    label_encoder: LabelEncoder
+    metrics: dict
+    version: Optional[str] = None
+    timings: dict = field(default_factory=dict)   # stage -> seconds
 
 
 # ================================================================
-# 3. SAFE NUMERIC CONVERSION
+# 2. STAGE TIMING + CACHE HELPERS
 # ================================================================
-def to_num(x, default=0.0):
-    try:
-        if pd.isna(x):
-            return default
-        return float(x)
-    except:
-        return default
+@contextmanager
+def _timed(name: str, timings: dict, verbose: bool = True):
+    t0 = time.perf_counter()
+    yield
+    timings[name] = time.perf_counter() - t0
+    if verbose:
+        print(f"⏱  {name}: {timings[name]:.2f} s")
 
 
-# Convert all numeric-like fields properly
-NUMERIC_FIELDS = [
-    "CGPA", "Matriculation Percentage", "Intermediate Percentage",
-    "Data Structures And Algorithm Marks", "DBMS Marks",
-    "GitHub total repositories", "GitHub commits/month",
-    "Coding practice hours/week", "Aptitude score", "Attandance",
-    "Number of backlogs", "Number of Reappears"
-]
+@lru_cache(maxsize=8)
+def _digest(path: str, mtime_ns: int, size: int) -> str:
+    return file_sha256(path)
 
-for col in NUMERIC_FIELDS:
-    if col in df.columns:
-        df[col] = df[col].apply(to_num)
 
+def source_digest(path) -> str:
+    """SHA-256 of the training source (memoized per path + mtime + size)."""
+    st = os.stat(path)
+    return _digest(str(path), st.st_mtime_ns, st.st_size)
 
-# ================================================================
-# 4. GENERATE TARGET LABEL (Recommended Career)
-# ================================================================
-def generate_career(row):
-    # ---- Numeric features ----
-    dsa         = to_num(row.get("Data Structures And Algorithm Marks", 0))
-    dbms        = to_num(row.get("DBMS Marks", 0))
-    cgpa        = to_num(row.get("CGPA", 0))
-    repos       = to_num(row.get("GitHub total repositories", 0))
-    commits     = to_num(row.get("GitHub commits/month", 0))
-    coding      = to_num(row.get("Coding practice hours/week", 0))
-    aptitude    = to_num(row.get("Aptitude score", 0))
-    backlogs    = to_num(row.get("Number of backlogs", 0))
-    reappears   = to_num(row.get("Number of Reappears", 0))
-    attendance  = to_num(row.get("Attandance", 0))
-
-    # ---- English proficiency (dropdown text -> numeric) ----
-    english_raw = str(row.get("English proficiency", "Fair")).strip().lower()
-    english_map = {
-        "poor": 40,
-        "fair": 60,
-        "good": 80,
-        "excellent": 95,
-    }
-    english = english_map.get(english_raw, 60)   # default to "Fair"
-
-    # ---- Text features ----
-    # "Experience with frameworks" can be comma/semicolon separated
-    frameworks_text = str(row.get("Experience with frameworks", "")).lower()
-    frameworks = [
-        f.strip()
-        for f in frameworks_text.replace(",", ";").split(";")
-        if f.strip()
-    ]
-    prog_prof = str(row.get("Programming proficiency", "")).lower()
-
-    # ---- Score container ----
-    scores = {
-        "AI/ML Engineer": 0,
-        "Software Engineer": 0,
-        "Web Developer": 0,
-        "Data Analyst": 0,
-        "DevOps Engineer": 0,
-        "Cyber Security Engineer": 0,
-    }
 
-    # ---------- COMMON SIGNALS ----------
-    if cgpa >= 8.0:
-        for r in scores:
-            scores[r] += 1
-    if cgpa >= 8.5:
-        for r in scores:
-            scores[r] += 1
-
-    if backlogs > 0 or reappears > 0:
-        for r in scores:
-            scores[r] -= 1
-    if backlogs >= 3 or reappears >= 3:
-        for r in scores:
-            scores[r] -= 1
-    if attendance < 70:
-        for r in scores:
-            scores[r] -= 1
-
-    if english >= 70:
-        for r in scores:
-            scores[r] += 1
-    if aptitude >= 70:
-        for r in scores:
-            scores[r] += 1
-
-    # ---------- AI / ML Engineer ----------
-    if dsa >= 80:
-        scores["AI/ML Engineer"] += 1
-    if "python" in frameworks:
-        scores["AI/ML Engineer"] += 1
-    if any(f in frameworks for f in ["numpy", "pandas", "tensorflow", "pytorch", "sklearn"]):
-        scores["AI/ML Engineer"] += 2
-    if coding >= 8:
-        scores["AI/ML Engineer"] += 1
-    if aptitude >= 85 and cgpa >= 8.5 and dsa >= 85:
-        scores["AI/ML Engineer"] += 2
-
-    # ---------- Software Engineer ----------
-    if dsa >= 75:
-        scores["Software Engineer"] += 2
-    if coding >= 10:
-        scores["Software Engineer"] += 2
-    if repos >= 2:
-        scores["Software Engineer"] += 1
-    if commits >= 4:
-        scores["Software Engineer"] += 1
-    if any(lang in frameworks for lang in ["java", "c++", "c#", "golang"]):
-        scores["Software Engineer"] += 1
-    if "advanced" in prog_prof or "intermediate" in prog_prof:
-        scores["Software Engineer"] += 1
-
-    # ---------- Web Developer ----------
-    if any(f in frameworks for f in [
-        "html", "css", "javascript", "react", "angular",
-        "vue", "django", "node", "next.js", "express"
-    ]):
-        scores["Web Developer"] += 2
-    if coding >= 6:
-        scores["Web Developer"] += 1
-    if repos >= 2:
-        scores["Web Developer"] += 1
-    if commits >= 4:
-        scores["Web Developer"] += 1
-
-    # ---------- Data Analyst ----------
-    if dbms >= 75:
-        scores["Data Analyst"] += 2
-    if aptitude >= 65:
-        scores["Data Analyst"] += 1
-    if any(f in frameworks for f in ["excel", "power bi", "tableau", "sql"]):
-        scores["Data Analyst"] += 2
-    if any(f in frameworks for f in ["numpy", "pandas"]):
-        scores["Data Analyst"] += 1
-    if coding >= 4:
-        scores["Data Analyst"] += 1
-
-    # ---------- DevOps Engineer ----------
-    if any(k in frameworks for k in [
-        "devops", "docker", "kubernetes", "k8s", "aws",
-        "azure", "gcp", "jenkins", "ci/cd", "cloud"
-    ]):
-        scores["DevOps Engineer"] += 3
-    if repos >= 2:
-        scores["DevOps Engineer"] += 1
-    if commits >= 5:
-        scores["DevOps Engineer"] += 1
-    if aptitude >= 70:
-        scores["DevOps Engineer"] += 1
-
-    # ---------- Cyber Security Engineer ----------
-    if any(k in frameworks for k in [
-        "security", "cyber", "network", "penetration testing",
-        "ethical hacking", "kali"
-    ]):
-        scores["Cyber Security Engineer"] += 3
-    if "security" in prog_prof or "cyber" in prog_prof:
-        scores["Cyber Security Engineer"] += 2
-    if aptitude >= 70:
-        scores["Cyber Security Engineer"] += 1
-
-    # ---------- FINAL SELECTION ----------
-    best_role = max(scores, key=scores.get)
-    best_score = scores[best_role]
-
-    if best_score <= 0:
-        return "Software Engineer"  # very weak signals: safe default
-
-    return best_role
-
-
-df["Recommended Career"] = df.apply(generate_career, axis=1)
-print("📌 Career labels distribution:\n", df["Recommended Career"].value_counts())
+def _label_cache_path(config: TrainConfig, digest: str) -> Optional[Path]:
+    if config.cache_dir is None:
+        return None
+    stem = Path(config.data_path).stem
+    return Path(config.cache_dir) / f"{stem}.{digest[:16]}.v{INGEST_VERSION}.labels.l{LABELING_VERSION}.feather"
 
 
-# ================================================================
-# 5. FEATURE SELECTION
-# ================================================================
-y = df["Recommended Career"]
-X = df.drop(columns=["Recommended Career"])
-
-numeric_cols = [c for c in X.columns if pd.api.types.is_numeric_dtype(X[c])]
-categorical_cols = [c for c in X.columns if c not in numeric_cols]
-
-print(f"📊 Numeric columns: {len(numeric_cols)}")
-print(f"📦 Categorical columns: {len(categorical_cols)}")
+# fitted preprocessors for recent (data, split, encoding) combinations, for sweeps in one process
+_ENCODE_CACHE = {}
+_ENCODE_CACHE_SIZE = 2
 
 
 # ================================================================
-# 6. LABEL ENCODER
+# 3. STAGES
 # ================================================================
-label_encoder = LabelEncoder()
-y_encoded = label_encoder.fit_transform(y)
-print("🏷 Classes:", label_encoder.classes_)
-
-
-# ================================================================
-# 7. PREPROCESSING + MODEL
-# ================================================================
-preprocessor = ColumnTransformer([
-    ("num", StandardScaler(), numeric_cols),
-    ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_cols)
-])
-
-model = xgb.XGBClassifier(
-    n_estimators=250,
-    max_depth=6,
-    learning_rate=0.05,
-    subsample=0.9,
-    colsample_bytree=0.9,
-    eval_metric="mlogloss",
-    random_state=42
-)
-
-pipeline = Pipeline([
-    ("pre", preprocessor),
-    ("clf", model)
-])
-
-
-# ================================================================
-# 8. TRAIN / TEST SPLIT
-# ================================================================
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y_encoded, test_size=0.2, stratify=y_encoded, random_state=42
-)
-
-print(f"📘 Training samples = {X_train.shape[0]}")
-print(f"📙 Test samples = {X_test.shape[0]}")
+def ingest(config: TrainConfig) -> pd.DataFrame:
+    """Load the cleaned training frame (columnar cache, see src/ingest.py) without 'Name'."""
+    if config.verbose:
+        print("🔄 Loading dataset...")
+    # Excel is parsed once into a typed columnar cache (data/.cache); numeric fields
+    # are coerced there with vectorized pd.to_numeric (see src/ingest.py).
+    # cache_dir=None: read + clean the source directly, nothing is written
+    if config.cache_dir is None:
+        df = clean_frame(read_source(config.data_path))
+    else:
+        df = load_training_data(config.data_path, cache_dir=config.cache_dir, verbose=config.verbose)
+    if config.verbose:
+        print(f"Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+
+    if "Name" in df.columns:
+        df = df.drop(columns=["Name"])
+        if config.verbose:
+            print("🗑 Removed 'Name' column")
+    return df
+
+
+def label(df: pd.DataFrame, config: TrainConfig) -> pd.DataFrame:
+    """Add the rule-based target column (src/labeling.py); cached per source file + rule version."""
+    cache_file = _label_cache_path(config, source_digest(config.data_path))
+
+    labels = None
+    if cache_file is not None and cache_file.exists():
+        cached = pd.read_feather(cache_file)
+        if len(cached) == len(df):
+            labels = cached[TARGET].to_numpy()
+            if config.verbose:
+                print(f"⚡ Using cached labels → {cache_file}")
+
+    if labels is None:
+        # Rules live in src/labeling.py: generate_careers is the vectorized version of generate_career
+        labels = generate_careers(df).to_numpy()
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_file.with_suffix(".tmp")
+                pd.DataFrame({TARGET: labels}).to_feather(tmp)
+                os.replace(tmp, cache_file)
+            except (ImportError, OSError) as e:
+                if config.verbose:
+                    print(f"⚠️ Could not cache labels ({e}); continuing without it.")
+
+    df = df.copy()
+    df[TARGET] = labels
+    if config.verbose:
+        print("📌 Career labels distribution:\n", df[TARGET].value_counts())
+    return df
+
+
+def split(df: pd.DataFrame, config: TrainConfig):
+    """Feature/target split, label encoding and stratified train/test split."""
+    y = df[TARGET]
+    X = df.drop(columns=[TARGET])
+
+    label_encoder = LabelEncoder()
+    y_encoded = label_encoder.fit_transform(y)
+    if config.verbose:
+        print("🏷 Classes:", label_encoder.classes_)
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y_encoded, test_size=config.test_size, stratify=y_encoded, random_state=config.seed
+    )
+    if config.verbose:
+        print(f"📘 Training samples = {X_train.shape[0]}")
+        print(f"📙 Test samples = {X_test.shape[0]}")
+    return X_train, X_test, y_train, y_test, label_encoder
+
+
+def feature_columns(X: pd.DataFrame):
+    numeric_cols = [c for c in X.columns if pd.api.types.is_numeric_dtype(X[c])]
+    categorical_cols = [c for c in X.columns if c not in numeric_cols]
+    return numeric_cols, categorical_cols
+
+
+def encode(X_train: pd.DataFrame, X_test: pd.DataFrame, config: TrainConfig, cache_key=None):
+    """
+    Fit the ColumnTransformer on the training rows; returns (preprocessor, Xt_train, Xt_test).
+    With a cache_key, the result is reused by later runs with the same data + encoding settings.
+    """
+    if cache_key is not None:
+        cache_key = (cache_key, json.dumps(config.encoding_params(), sort_keys=True))
+        if cache_key in _ENCODE_CACHE:
+            if config.verbose:
+                print("⚡ Reusing fitted preprocessor + encoded matrices")
+            return _ENCODE_CACHE[cache_key]
+
+    numeric_cols, categorical_cols = feature_columns(X_train)
+    if config.verbose:
+        print(f"📊 Numeric columns: {len(numeric_cols)}")
+        print(f"📦 Categorical columns: {len(categorical_cols)}")
+
+    preprocessor = build_preprocessor(numeric_cols, categorical_cols, **config.encoding_params())
+    Xt_train = preprocessor.fit_transform(X_train)
+    Xt_test = preprocessor.transform(X_test)
+
+    result = (preprocessor, Xt_train, Xt_test)
+    if cache_key is not None:
+        while len(_ENCODE_CACHE) >= _ENCODE_CACHE_SIZE:
+            _ENCODE_CACHE.pop(next(iter(_ENCODE_CACHE)))
+        _ENCODE_CACHE[cache_key] = result
+    return result
+
+
+def fit(Xt_train, y_train, config: TrainConfig):
+    """
+    Fit the XGBoost classifier on the encoded training matrix; returns (model, info).
+    With early stopping, the booster is truncated to the best round so every inference
+    path (predict_proba, native SHAP, exported trees) only walks the trees it needs.
+    """
+    import xgboost as xgb
+
+    model = xgb.XGBClassifier(**config.model_params())
+    if config.verbose:
+        print("🚀 Training model...")
+
+    if config.early_stopping_rounds is None:
+        model.fit(Xt_train, y_train)
+        return model, {"n_rounds": model.get_booster().num_boosted_rounds()}
+
+    fit_idx, val_idx = train_test_split(
+        np.arange(Xt_train.shape[0]), test_size=config.validation_size,
+        stratify=y_train, random_state=config.seed
+    )
+    model.fit(Xt_train[fit_idx], y_train[fit_idx],
+              eval_set=[(Xt_train[val_idx], y_train[val_idx])], verbose=False)
+
+    booster = model.get_booster()
+    info = {
+        "best_iteration": int(model.best_iteration),
+        "best_score": float(model.best_score),
+        "rounds_trained": booster.num_boosted_rounds(),
+        "n_validation": int(len(val_idx)),
+    }
+    model._Booster = booster[: info["best_iteration"] + 1]
+    info["n_rounds"] = model.get_booster().num_boosted_rounds()
+    if config.verbose:
+        print(f"⏹  Early stopping: best round {info['best_iteration']} "
+              f"(mlogloss {info['best_score']:.4f}), kept {info['n_rounds']} of {info['rounds_trained']} rounds")
+    return model, info
+
+
+def evaluate(model, Xt_test, y_test, verbose: bool = True) -> dict:
+    return score_predictions(y_test, model.predict(Xt_test), verbose)
+
+
+def score_predictions(y_test, preds, verbose: bool = True) -> dict:
+    if verbose:
+        print("\n📊 Classification Report:\n", classification_report(y_test, preds))
+        print("\n🔢 Confusion Matrix:\n", confusion_matrix(y_test, preds))
+    return {
+        "accuracy": float(np.mean(preds == y_test)),
+        "classification_report": classification_report(y_test, preds, output_dict=True),
+        "n_test": int(len(y_test)),
+    }
 
 
-# ================================================================
-# 9. TRAIN MODEL
-# ================================================================
-print("🚀 Training model...")
-pipeline.fit(X_train, y_train)
-print("🎉 Training complete!")
+def export(pipeline: Pipeline, label_encoder: LabelEncoder, labeled: pd.DataFrame,
+           metrics: dict, config: TrainConfig) -> Optional[str]:
+    """Publish a registry version (+ optional SHAP explainer / inference bundle) and write the labeled CSV."""
+    version = None
+    if config.publish:
+        # Artifacts are staged in a temp dir and published as one immutable version;
+        # running API workers pick it up via /admin/reload or the CURRENT-file watcher.
+        params = {
+            "model": {k: v for k, v in pipeline.named_steps["clf"].get_params().items() if v is not None},
+            **config.encoding_params(),
+            "seed": config.seed,
+            "classes": list(label_encoder.classes_),
+        }
+        with tempfile.TemporaryDirectory() as staging:
+            joblib.dump(pipeline, Path(staging) / MODEL_FILE)
+            joblib.dump(label_encoder, Path(staging) / LABEL_FILE)
+            if config.inference_bundle:
+                export_bundle(pipeline, label_encoder, staging)
+
+            if config.shap_explainer:
+                import shap
+                if config.verbose:
+                    print("🔍 Training SHAP explainer...")
+                explainer = shap.TreeExplainer(pipeline.named_steps["clf"])
+                joblib.dump(explainer, Path(staging) / SHAP_FILE)
+
+            version = publish_version(
+                staging, root=config.models_dir, metrics=metrics, params=params,
+                feature_index=FeatureIndex.from_pipeline(pipeline), activate=config.activate
+            )
+        if config.verbose:
+            print(f"💾 Published model version {version} → {config.models_dir}/versions/{version}")
+
+    export_csv = config.labeled_csv()
+    if export_csv and labeled is not None:   # None: streamed runs write it chunk by chunk
+        labeled.to_csv(export_csv, index=False)
+        if config.verbose:
+            print(f"📄 Exported labeled dataset → {export_csv}")
+    return version
 
 
 # ================================================================
-# 10. EVALUATE
+# 4. FULL RUN
 # ================================================================
-preds = pipeline.predict(X_test)
-print("\n📊 Classification Report:\n", classification_report(y_test, preds))
-print("\n🔢 Confusion Matrix:\n", confusion_matrix(y_test, preds))
+def train(config: TrainConfig = None) -> TrainResult:
+    """Run every stage in order; returns the fitted pipeline, metrics, version and stage timings."""
+    config = config or TrainConfig()
+    if config.chunk_rows:
+        from src.train_stream import train_streaming
+        return train_streaming(config)
+    timings = {}
+    v = config.verbose
+
+    with _timed("ingest", timings, v):
+        df = ingest(config)
+    with _timed("label", timings, v):
+        labeled = label(df, config)
+    with _timed("split", timings, v):
+        X_train, X_test, y_train, y_test, label_encoder = split(labeled, config)
+    with _timed("encode", timings, v):
+        data_key = (source_digest(config.data_path), LABELING_VERSION, config.seed, config.test_size)
+        preprocessor, Xt_train, Xt_test = encode(X_train, X_test, config, cache_key=data_key)
+    with _timed("fit", timings, v):
+        model, fit_info = fit(Xt_train, y_train, config)
+    if v:
+        print(f"🎉 Training complete! ({timings['fit']:.1f} s)")
+
+    # the preprocessor and classifier are already fitted; the Pipeline just chains them
+    pipeline = Pipeline([("pre", preprocessor), ("clf", model)])
+
+    with _timed("evaluate", timings, v):
+        metrics = evaluate(model, Xt_test, y_test, verbose=v)
+    metrics.update({
+        "fit_seconds": round(timings["fit"], 3),
+        "n_train": int(X_train.shape[0]),
+        **fit_info,
+        "stage_seconds": {k: round(s, 3) for k, s in timings.items()},
+    })
+
+    with _timed("export", timings, v):
+        version = export(pipeline, label_encoder, labeled, metrics, config)
+
+    if v:
+        print("\n✅ Training pipeline completed successfully!")
+    return TrainResult(pipeline, label_encoder, metrics, version, timings)
 
 
 # ================================================================
-# 11. SAVE ARTIFACTS
+# 5. CLI
 # ================================================================
-Path("../models").mkdir(exist_ok=True)
-
-joblib.dump(pipeline, MODEL_OUTPUT)
-print(f"💾 Saved model → {MODEL_OUTPUT}")
-
-joblib.dump(label_encoder, LABEL_OUTPUT)
-print(f"💾 Saved label encoder → {LABEL_OUTPUT}")
-
-print("🔍 Training SHAP explainer...")
-explainer = shap.TreeExplainer(pipeline.named_steps["clf"])
-joblib.dump(explainer, SHAP_OUTPUT)
-print(f"💾 Saved SHAP explainer → {SHAP_OUTPUT}")
-
-df.to_csv(EXPORT_WITH_LABELS, index=False)
-print(f"📄 Exported labeled dataset → {EXPORT_WITH_LABELS}")
-
-print("\n✅ Training pipeline completed successfully!")
+def parse_args(argv=None) -> TrainConfig:
+    # --config (e.g. the output of `python -m src.tune`) supplies the defaults; flags override it
+    pre = argparse.ArgumentParser(add_help=False)
+    pre.add_argument("--config")
+    config_path = pre.parse_known_args(argv)[0].config
+    defaults = TrainConfig.load(config_path) if config_path else TrainConfig()
+
+    p = argparse.ArgumentParser(description="Train and publish the career recommendation model.")
+    p.add_argument("--config", help="JSON file of TrainConfig fields used as defaults")
+    p.add_argument("--data", default=defaults.data_path, help="training workbook / CSV / Parquet")
+    p.add_argument("--models-dir", default=defaults.models_dir, help="model registry root")
+    p.add_argument("--cache-dir", default=defaults.cache_dir, help="stage cache directory ('' disables)")
+    p.add_argument("--export-csv", default=defaults.export_csv,
+                   help="labeled CSV output ('' skips; default: <data stem>_with_labels.csv next to --data, "
+                        "data/BTech_Student_Dataset_with_labels.csv for the shipped workbook)")
+    p.add_argument("--n-estimators", type=int)
+    p.add_argument("--max-depth", type=int)
+    p.add_argument("--learning-rate", type=float)
+    p.add_argument("--subsample", type=float)
+    p.add_argument("--colsample-bytree", type=float)
+    p.add_argument("--n-jobs", type=int, default=defaults.n_jobs)
+    p.add_argument("--tree-method", default=defaults.tree_method)
+    p.add_argument("--max-bin", type=int, default=defaults.max_bin)
+    p.add_argument("--early-stopping-rounds", type=int, default=defaults.early_stopping_rounds)
+    p.add_argument("--validation-size", type=float, default=defaults.validation_size)
+    p.add_argument("--fast", action="store_true",
+                   help="hist + all cores + early stopping (see TrainConfig.fast); explicit flags still win")
+    p.add_argument("--chunk-rows", type=int, default=defaults.chunk_rows,
+                   help="out-of-core: stream CSV/Parquet input in chunks of this many rows")
+    p.add_argument("--seed", type=int, default=defaults.seed)
+    p.add_argument("--test-size", type=float, default=defaults.test_size)
+    p.add_argument("--frameworks-encoding", default=defaults.frameworks_encoding, choices=["multihot", "onehot"])
+    p.add_argument("--text-encoding", default=defaults.text_encoding, choices=["capped", "hash", "onehot"])
+    p.add_argument("--no-publish", action="store_true", help="train + evaluate only")
+    p.add_argument("--no-activate", action="store_true", help="publish without switching models/CURRENT")
+    p.add_argument("--no-shap", action="store_true", help="skip pickling the shap.TreeExplainer")
+    p.add_argument("--no-bundle", action="store_true", help="skip the pickle-free inference bundle")
+    p.add_argument("--quiet", action="store_true")
+    args = p.parse_args(argv)
+
+    xgb_params = {k: getattr(args, k) for k in
+                  ("n_estimators", "max_depth", "learning_rate", "subsample", "colsample_bytree")
+                  if getattr(args, k) is not None}
+    settings = dict(
+        data_path=args.data,
+        cache_dir=args.cache_dir or None,
+        models_dir=args.models_dir,
+        export_csv=args.export_csv or None,
+        frameworks_encoding=args.frameworks_encoding,
+        frameworks_max_tokens=defaults.frameworks_max_tokens,
+        frameworks_min_count=defaults.frameworks_min_count,
+        text_encoding=args.text_encoding,
+        text_min_frequency=defaults.text_min_frequency,
+        text_max_categories=defaults.text_max_categories,
+        text_n_buckets=defaults.text_n_buckets,
+        xgb_params={**defaults.xgb_params, **xgb_params},
+        n_jobs=args.n_jobs,
+        tree_method=args.tree_method,
+        max_bin=args.max_bin,
+        early_stopping_rounds=args.early_stopping_rounds,
+        validation_size=args.validation_size,
+        seed=args.seed,
+        test_size=args.test_size,
+        chunk_rows=args.chunk_rows,
+        publish=defaults.publish and not args.no_publish,
+        activate=defaults.activate and not args.no_activate,
+        shap_explainer=defaults.shap_explainer and not args.no_shap,
+        inference_bundle=defaults.inference_bundle and not args.no_bundle,
+        verbose=defaults.verbose and not args.quiet,
+    )
+    if not args.fast:
+        return TrainConfig(**settings)
+
+    # --fast fills in whatever was not given explicitly
+    preset = TrainConfig.fast()
+    for name in ("n_jobs", "tree_method", "max_bin", "early_stopping_rounds"):
+        if settings[name] is None:
+            settings[name] = getattr(preset, name)
+    return TrainConfig(**settings)
+
+
+def main(argv=None) -> TrainResult:
+    config = parse_args(argv)
+    result = train(config)
+    if config.verbose:
+        print("🧾 Config:", json.dumps(asdict(config), default=str))
+    return result
+
+
+if __name__ == "__main__":
+    main()
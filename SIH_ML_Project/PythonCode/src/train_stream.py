@@ -0,0 +1,284 @@
+# src/train_stream.py
+"""
+Out-of-core training for exports that do not fit in memory.
+
+    python -m src.train_model --data national.csv --chunk-rows 50000 --tree-method hist
+    train(TrainConfig(data_path="national.parquet", chunk_rows=50_000))
+
+The source (CSV / Parquet, see ingest.iter_source_chunks) is read chunk by chunk, three times:
+
+    pass 1  label each chunk with generate_careers (same rules as in-memory training) and
+            fit the encoders from streamed statistics: StandardScaler.partial_fit (running
+            mean / variance), per-column category counts for the OneHotEncoder and
+            FrameworkMultiHot / TextBucketEncoder.partial_fit (token / text counts)
+    pass 2  an xgboost.DataIter feeds the encoded training chunks into an external-memory
+            DMatrix (pages cached on disk under <cache_dir>/xgb-pages-*)
+    pass 3  predict the test rows chunk by chunk for the report
+
+Peak memory is bounded by one chunk (raw + encoded) plus XGBoost's working set, not by the
+dataset size. Train/test assignment is a seeded per-row coin flip (test_size), so the split
+is random but not stratified. Early stopping is not available in this mode.
+
+The result is the same Pipeline("pre", "clf") artifact as train_model.train(), published
+through the same export stage; the labeled CSV is appended chunk by chunk.
+"""
+
+import os
+import shutil
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler
+
+from src.encoders import build_preprocessor
+from src.ingest import iter_source_chunks
+from src.labeling import generate_careers
+from src.train_model import (
+    TARGET, TrainConfig, TrainResult, _timed, export, feature_columns, score_predictions,
+)
+
+_MISSING = object()   # NaN stand-in for category counting (NaN != NaN as a dict key)
+
+
+# ================================================================
+# 1. CHUNK STREAM
+# ================================================================
+def _conform(chunk: pd.DataFrame, numeric_cols: list, categorical_cols: list) -> pd.DataFrame:
+    """Pin every chunk to the first chunk's schema (a CSV chunk can infer other dtypes)."""
+    chunk = chunk.copy()
+    for col in numeric_cols:
+        if not pd.api.types.is_numeric_dtype(chunk[col]):
+            chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+    for col in categorical_cols:
+        if chunk[col].dtype != object:
+            chunk[col] = chunk[col].astype(object).where(chunk[col].notna(), np.nan)
+    return chunk
+
+
+class _Stream:
+    """Re-iterable (X, labels, is_test) chunks of the source; schema fixed by the first chunk."""
+
+    def __init__(self, config: TrainConfig):
+        self.config = config
+        self.numeric_cols = self.categorical_cols = None
+
+    def __iter__(self):
+        for i, chunk in enumerate(iter_source_chunks(self.config.data_path, self.config.chunk_rows)):
+            chunk = chunk.drop(columns=["Name", TARGET], errors="ignore")
+            if self.numeric_cols is None:
+                self.numeric_cols, self.categorical_cols = feature_columns(chunk)
+            X = _conform(chunk, self.numeric_cols, self.categorical_cols)
+            labels = generate_careers(X).to_numpy()
+            is_test = np.random.default_rng([self.config.seed, i]).random(len(X)) < self.config.test_size
+            yield X, labels, is_test
+
+
+# ================================================================
+# 2. PASS 1: STREAMED ENCODER STATISTICS
+# ================================================================
+def fit_preprocessor(stream: _Stream, config: TrainConfig):
+    """Returns (fitted ColumnTransformer, LabelEncoder, n_train, n_rows)."""
+    scaler = None
+    category_counts = None
+    row_encoders = None
+    label_counts = Counter()      # all rows, so evaluation never meets an unseen label
+    train_labels = set()
+    template = None
+    n_train = n_rows = 0
+    csv_header = True
+    export_csv = config.labeled_csv()
+
+    for X, labels, is_test in stream:
+        if scaler is None:
+            pre = build_preprocessor(stream.numeric_cols, stream.categorical_cols, **config.encoding_params())
+            scaler = StandardScaler()
+            category_counts = {c: Counter() for c in _columns(pre, "cat")}
+            row_encoders = {name: (enc, cols) for name, enc, cols in pre.transformers if name in ("fw", "txt")}
+
+        if export_csv:
+            X.assign(**{TARGET: labels}).to_csv(export_csv, mode="w" if csv_header else "a",
+                                                header=csv_header, index=False)
+            csv_header = False
+
+        label_counts.update(labels)
+        train = X[~is_test]
+        n_rows += len(X)
+        n_train += len(train)
+        if train.empty:
+            continue
+        if template is None:
+            template = train.head(1000)
+
+        train_labels.update(labels[~is_test])
+        if stream.numeric_cols:
+            scaler.partial_fit(train[stream.numeric_cols])
+        for col, counts in category_counts.items():
+            values = train[col]
+            counts.update(values[values.notna()])
+            counts[_MISSING] += int(values.isna().sum())
+        for enc, cols in row_encoders.values():
+            enc.partial_fit(train[cols])
+
+    if template is None:
+        raise ValueError(f"No training rows in {config.data_path}")
+
+    categories = []
+    for col, counts in category_counts.items():
+        cats = sorted((v for v in counts if v is not _MISSING), key=str)
+        if counts[_MISSING]:
+            cats.append(np.nan)   # OneHotEncoder keeps NaN as the last category
+        categories.append(cats)
+    onehot = OneHotEncoder(categories=categories, handle_unknown="ignore").fit(template[list(category_counts)])
+
+    fitted = {"num": scaler, "cat": onehot, **{name: enc for name, (enc, _) in row_encoders.items()}}
+    label_encoder = LabelEncoder().fit(sorted(label_counts))
+    test_only = sorted(set(label_counts) - train_labels)
+    if test_only and config.verbose:
+        print(f"⚠️ Classes only in the test rows (never predicted): {test_only}")
+    return _assemble(pre, fitted, template), label_encoder, n_train, n_rows
+
+
+def _columns(pre, name: str) -> list:
+    return next(cols for n, _, cols in pre.transformers if n == name)
+
+
+def _assemble(pre, fitted: dict, template: pd.DataFrame):
+    """
+    ColumnTransformer has no partial_fit: fit the layout on a small template, then swap in
+    the stream-fitted transformers and recompute the fitted attributes that depend on their
+    output widths (output_indices_, sparse_output_), the way ColumnTransformer.fit does.
+    """
+    pre.fit(template)
+    pre.transformers_ = [(name, fitted.get(name, trans), cols) for name, trans, cols in pre.transformers_]
+
+    blocks, output_indices, start = [], {}, 0
+    for name, trans, cols in pre.transformers_:
+        if isinstance(trans, str) or not len(cols):
+            width = len(cols) if trans == "passthrough" else 0
+        else:
+            blocks.append(trans.transform(template[cols]))
+            width = blocks[-1].shape[1]
+        output_indices[name] = slice(start, start + width)
+        start += width
+    output_indices.setdefault("remainder", slice(0, 0))
+    pre.output_indices_ = output_indices
+
+    # same density rule as ColumnTransformer.fit_transform, on the template's blocks
+    if any(sparse.issparse(b) for b in blocks):
+        nnz = sum(b.nnz if sparse.issparse(b) else b.size for b in blocks)
+        total = sum(b.shape[0] * b.shape[1] for b in blocks)
+        pre.sparse_output_ = nnz / total < pre.sparse_threshold
+    else:
+        pre.sparse_output_ = False
+    return pre
+
+
+# ================================================================
+# 3. PASS 2: EXTERNAL-MEMORY DMATRIX
+# ================================================================
+def _make_iterator(stream: _Stream, pre, label_encoder: LabelEncoder, cache_prefix: str):
+    import xgboost as xgb
+
+    class ChunkIter(xgb.DataIter):
+        def __init__(self):
+            self._chunks = None
+            super().__init__(cache_prefix=cache_prefix)
+
+        def reset(self):
+            self._chunks = None
+
+        def next(self, input_data):
+            if self._chunks is None:
+                self._chunks = iter(stream)
+            for X, labels, is_test in self._chunks:
+                if is_test.all():
+                    continue
+                train = ~is_test
+                input_data(data=pre.transform(X[train]), label=label_encoder.transform(labels[train]))
+                return 1
+            return 0
+
+    return ChunkIter()
+
+
+def _native_params(config: TrainConfig, n_classes: int) -> tuple:
+    """sklearn-style TrainConfig params -> (xgb.train params, num_boost_round)."""
+    params = dict(config.model_params())
+    rounds = params.pop("n_estimators")
+    params.pop("early_stopping_rounds", None)
+    params["seed"] = params.pop("random_state")
+    if "n_jobs" in params:
+        params["nthread"] = params.pop("n_jobs")
+    params.update(objective="multi:softprob", num_class=n_classes)
+    return params, rounds
+
+
+# ================================================================
+# 4. FULL STREAMED RUN
+# ================================================================
+def train_streaming(config: TrainConfig) -> TrainResult:
+    import xgboost as xgb
+
+    timings = {}
+    v = config.verbose
+    stream = _Stream(config)
+    if v:
+        print(f"🌊 Streaming {config.data_path} in chunks of {config.chunk_rows} rows")
+        if config.early_stopping_rounds is not None:
+            print("⚠️ early_stopping_rounds is ignored in out-of-core mode.")
+
+    with _timed("ingest+label+encoder stats", timings, v):
+        pre, label_encoder, n_train, n_rows = fit_preprocessor(stream, config)
+    if v:
+        print(f"📘 {n_rows} rows streamed, {n_train} for training")
+        print("🏷 Classes:", label_encoder.classes_)
+
+    if config.cache_dir:
+        os.makedirs(config.cache_dir, exist_ok=True)
+    page_dir = tempfile.mkdtemp(prefix="xgb-pages-", dir=config.cache_dir)
+    try:
+        with _timed("external-memory DMatrix", timings, v):
+            it = _make_iterator(stream, pre, label_encoder, os.path.join(page_dir, "train"))
+            dtrain = xgb.DMatrix(it, missing=np.nan)
+        params, rounds = _native_params(config, len(label_encoder.classes_))
+        if v:
+            print("🚀 Training model...")
+        with _timed("fit", timings, v):
+            booster = xgb.train(params, dtrain, num_boost_round=rounds)
+        del dtrain, it
+    finally:
+        shutil.rmtree(page_dir, ignore_errors=True)
+
+    # wrap the booster in the same sklearn estimator the in-memory path pickles
+    # (the attributes XGBClassifier.fit sets besides its params); objective/num_class as
+    # trained, so get_params() and the manifest describe the multi-class booster
+    model = xgb.XGBClassifier(**config.model_params(), objective=params["objective"], num_class=params["num_class"])
+    model._Booster = booster
+    model.n_classes_ = len(label_encoder.classes_)
+    model.classes_ = np.arange(model.n_classes_)
+    pipeline = Pipeline([("pre", pre), ("clf", model)])
+
+    with _timed("evaluate", timings, v):
+        y_true, y_pred = [], []
+        for X, labels, is_test in stream:
+            if is_test.any():
+                y_true.append(label_encoder.transform(labels[is_test]))
+                y_pred.append(model.predict(pre.transform(X[is_test])))
+        metrics = score_predictions(np.concatenate(y_true), np.concatenate(y_pred), verbose=v)
+    metrics.update({
+        "fit_seconds": round(timings["fit"], 3),
+        "n_train": n_train,
+        "n_rounds": booster.num_boosted_rounds(),
+        "chunk_rows": config.chunk_rows,
+        "stage_seconds": {k: round(s, 3) for k, s in timings.items()},
+    })
+
+    with _timed("export", timings, v):
+        version = export(pipeline, label_encoder, None, metrics, config)
+    if v and config.labeled_csv():
+        print(f"📄 Exported labeled dataset → {config.labeled_csv()}")
+    return TrainResult(pipeline, label_encoder, metrics, version, timings)
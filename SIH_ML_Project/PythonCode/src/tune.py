@@ -0,0 +1,329 @@
+# src/tune.py
+"""
+Hyperparameter search for the career model (XGBoost settings only).
+
+    python -m src.tune --method halving --candidates 27 --folds 5 --budget 900 --n-jobs 4
+    python -m src.train_model --config train_config.json
+
+Search runs on the training split only (the test split of train_model.py stays unseen),
+scored by mean validation mlogloss over stratified K folds.
+
+    random   n candidates sampled from SEARCH_SPACE, each fitted on every fold
+    halving  successive halving with n_estimators as the resource: all candidates start
+             with few trees, the best 1/eta move on with eta x more trees
+
+Preprocessing is done once per fold, not once per candidate: the ColumnTransformer is fitted
+on each fold's training rows and the transformed sparse matrices are dumped with joblib
+into <cache_dir>/folds/<key>/ (key = data hash + labeling version + split + encoding
+settings). Every (candidate, fold) task runs in a joblib/loky worker process that
+memory-maps its fold from there (once per process), so no candidate re-fits the
+scaler / one-hot encoders and nothing large is pickled per task.
+
+--budget is wall-clock seconds: no new work starts after it, running tasks are abandoned,
+and the best fully evaluated candidate wins. The best parameters are written as a
+TrainConfig JSON (--out) that train_model.py reads with --config, together with every
+encoding setting and the data / split the folds were built from, so that run trains the
+encoding that was tuned.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import joblib
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.metrics import log_loss
+from sklearn.model_selection import StratifiedKFold
+
+from src.artifacts import PROJECT_ROOT
+from src.encoders import build_preprocessor
+from src.labeling import LABELING_VERSION
+from src.train_model import (
+    TrainConfig, ingest, label, split, feature_columns, source_digest,
+)
+
+DEFAULT_OUT = PROJECT_ROOT / "train_config.json"
+
+# TrainConfig fields written to --out besides the encoding settings: the model settings that
+# were tuned or held fixed, and the data / split the folds were cut from. Machine-local fields
+# (cache and models dirs, publish, verbose) are left to the training run.
+SAVED_FIELDS = ["xgb_params", "tree_method", "max_bin", "n_jobs", "early_stopping_rounds", "seed",
+                "data_path", "test_size", "validation_size"]
+
+# name -> ("choice", values) | ("uniform", lo, hi) | ("loguniform", lo, hi) | ("int", lo, hi)
+SEARCH_SPACE = {
+    "n_estimators": ("choice", [100, 250, 400, 600]),
+    "max_depth": ("int", 3, 8),
+    "learning_rate": ("loguniform", 0.02, 0.3),
+    "subsample": ("uniform", 0.6, 1.0),
+    "colsample_bytree": ("uniform", 0.4, 1.0),
+    "min_child_weight": ("choice", [1, 2, 4, 8]),
+    "reg_lambda": ("loguniform", 0.1, 10.0),
+}
+
+
+@dataclass
+class Trial:
+    params: dict
+    n_estimators: int
+    logloss: float
+    accuracy: float
+    seconds: float          # summed fit time over folds
+    rung: int = 0
+
+
+@dataclass
+class TuneResult:
+    best_params: dict
+    best_logloss: float
+    best_accuracy: float
+    trials: list = field(default_factory=list)
+    elapsed: float = 0.0
+    stopped_by_budget: bool = False
+
+
+# ================================================================
+# 1. SAMPLING
+# ================================================================
+def sample_params(rng: np.random.Generator, space: dict = None) -> dict:
+    params = {}
+    for name, spec in (space or SEARCH_SPACE).items():
+        kind = spec[0]
+        if kind == "choice":
+            value = spec[1][int(rng.integers(len(spec[1])))]
+        elif kind == "int":
+            value = int(rng.integers(spec[1], spec[2] + 1))
+        elif kind == "loguniform":
+            value = float(math.exp(rng.uniform(math.log(spec[1]), math.log(spec[2]))))
+        else:
+            value = float(rng.uniform(spec[1], spec[2]))
+        params[name] = round(value, 5) if isinstance(value, float) else value
+    return params
+
+
+# ================================================================
+# 2. FOLD CACHE
+# ================================================================
+def _fold_key(config: TrainConfig, n_folds: int) -> str:
+    parts = [source_digest(config.data_path), LABELING_VERSION, config.seed, config.test_size, n_folds,
+             json.dumps(config.encoding_params(), sort_keys=True)]
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def prepare_folds(config: TrainConfig, n_folds: int = 5) -> list:
+    """
+    Fit the ColumnTransformer once per stratified fold and dump (Xt_fit, y_fit, Xt_val, y_val).
+    Returns the fold file paths; existing files for the same key are reused.
+    """
+    fold_dir = Path(config.cache_dir or tempfile.gettempdir()) / "folds" / _fold_key(config, n_folds)
+    paths = [fold_dir / f"fold{i}.joblib" for i in range(n_folds)]
+    if all(p.exists() for p in paths):
+        if config.verbose:
+            print(f"⚡ Using cached folds → {fold_dir}")
+        return paths
+
+    df = label(ingest(config), config)
+    X_train, _, y_train, _, _ = split(df, config)
+    numeric_cols, categorical_cols = feature_columns(X_train)
+    folds = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=config.seed)
+
+    fold_dir.mkdir(parents=True, exist_ok=True)
+    for path, (fit_idx, val_idx) in zip(paths, folds.split(X_train, y_train)):
+        pre = build_preprocessor(numeric_cols, categorical_cols, **config.encoding_params())
+        Xt_fit = pre.fit_transform(X_train.iloc[fit_idx])
+        Xt_val = pre.transform(X_train.iloc[val_idx])
+        tmp = path.with_suffix(".tmp")
+        joblib.dump((Xt_fit, y_train[fit_idx], Xt_val, y_train[val_idx]), tmp)
+        os.replace(tmp, path)
+    if config.verbose:
+        print(f"💾 Cached {n_folds} preprocessed folds → {fold_dir}")
+    return paths
+
+
+@lru_cache(maxsize=16)
+def _load_fold(path: str):
+    # one memory-mapped copy per worker process, shared by every candidate it evaluates
+    return joblib.load(path, mmap_mode="r")
+
+
+# ================================================================
+# 3. ONE (CANDIDATE, FOLD) TASK
+# ================================================================
+def _evaluate(params: dict, fold_path: str, n_classes: int):
+    import xgboost as xgb
+
+    Xt_fit, y_fit, Xt_val, y_val = _load_fold(fold_path)
+    t0 = time.perf_counter()
+    model = xgb.XGBClassifier(**params)
+    model.fit(Xt_fit, y_fit)
+    seconds = time.perf_counter() - t0
+    proba = model.predict_proba(Xt_val)
+    loss = log_loss(y_val, proba, labels=np.arange(n_classes))
+    accuracy = float(np.mean(proba.argmax(axis=1) == y_val))
+    return loss, accuracy, seconds
+
+
+# ================================================================
+# 4. SEARCH
+# ================================================================
+class _Search:
+    def __init__(self, config: TrainConfig, fold_paths: list, n_classes: int, n_jobs: int, budget: Optional[float]):
+        self.config = config
+        self.fold_paths = [str(p) for p in fold_paths]
+        self.n_classes = n_classes
+        self.n_jobs = n_jobs
+        self.deadline = time.perf_counter() + budget if budget else None
+        self.out_of_budget = False
+        # split the thread budget between the parallel fold fits
+        cores = config.n_jobs or os.cpu_count() or 1
+        self.threads = max(1, cores // n_jobs)
+        self.trials = []
+
+    def base_params(self) -> dict:
+        params = self.config.model_params()
+        params.pop("early_stopping_rounds", None)   # folds have no separate eval set
+        params["n_jobs"] = self.threads
+        return params
+
+    def run(self, candidates: list, rung: int = 0) -> list:
+        """Evaluate candidates (dicts incl. n_estimators) on every fold; returns the completed Trials."""
+        if self.out_of_budget:
+            return []
+        tasks = [(c, i) for c in range(len(candidates)) for i in range(len(self.fold_paths))]
+        results = {}
+        parallel = Parallel(n_jobs=self.n_jobs, backend="loky", return_as="generator")
+        outputs = parallel(
+            delayed(_evaluate)({**self.base_params(), **candidates[c]}, self.fold_paths[i], self.n_classes)
+            for c, i in tasks
+        )
+        for (c, _), out in zip(tasks, outputs):
+            results.setdefault(c, []).append(out)
+            if self.deadline and time.perf_counter() > self.deadline:
+                self.out_of_budget = True
+                break
+
+        done = []
+        for c, outs in results.items():
+            if len(outs) < len(self.fold_paths):
+                continue
+            losses, accs, secs = zip(*outs)
+            trial = Trial(candidates[c], candidates[c]["n_estimators"], float(np.mean(losses)),
+                          float(np.mean(accs)), float(np.sum(secs)), rung)
+            done.append(trial)
+            if self.config.verbose:
+                print(f"  rung {rung}  logloss={trial.logloss:.4f}  acc={trial.accuracy:.4f}  {trial.params}")
+        self.trials.extend(done)
+        return done
+
+
+def random_search(search: _Search, rng, n_candidates: int) -> None:
+    candidates = [sample_params(rng) for _ in range(n_candidates)]
+    # one batch per n_jobs candidates so the budget is checked between batches too
+    for start in range(0, n_candidates, search.n_jobs):
+        search.run(candidates[start:start + search.n_jobs])
+        if search.out_of_budget:
+            break
+
+
+def successive_halving(search: _Search, rng, n_candidates: int, eta: int = 3,
+                       max_estimators: int = 600, min_estimators: int = 50) -> None:
+    rungs = max(1, int(math.log(max_estimators / min_estimators, eta)) + 1)
+    candidates = [sample_params(rng) for _ in range(n_candidates)]
+    for c in candidates:
+        c.pop("n_estimators", None)
+
+    for rung in range(rungs):
+        n_estimators = int(max_estimators / eta ** (rungs - 1 - rung))
+        trials = search.run([{**c, "n_estimators": n_estimators} for c in candidates], rung)
+        if search.out_of_budget or len(trials) <= 1:
+            break
+        keep = max(1, len(trials) // eta)
+        survivors = sorted(trials, key=lambda t: t.logloss)[:keep]
+        candidates = [{k: v for k, v in t.params.items() if k != "n_estimators"} for t in survivors]
+
+
+def tune(config: TrainConfig = None, method: str = "halving", n_candidates: int = 27, n_folds: int = 5,
+         budget: Optional[float] = None, n_jobs: int = None, eta: int = 3) -> TuneResult:
+    """Search XGBoost parameters by stratified CV on the training split; returns the best parameters."""
+    config = config or TrainConfig()
+    t0 = time.perf_counter()
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    fold_paths = prepare_folds(config, n_folds)
+    n_classes = int(max(int(np.max(_load_fold(str(p))[1])) for p in fold_paths)) + 1
+    remaining = None if budget is None else max(0.0, budget - (time.perf_counter() - t0))
+    search = _Search(config, fold_paths, n_classes, n_jobs, remaining)
+    rng = np.random.default_rng(config.seed)
+
+    if config.verbose:
+        print(f"🔎 {method} search: {n_candidates} candidates × {n_folds} folds on {n_jobs} worker(s)"
+              + (f", budget {budget:.0f} s" if budget else ""))
+    if method == "random":
+        random_search(search, rng, n_candidates)
+    elif method == "halving":
+        successive_halving(search, rng, n_candidates, eta=eta)
+    else:
+        raise ValueError(f"Unknown search method: {method!r} (expected 'random' or 'halving')")
+
+    if not search.trials:
+        raise RuntimeError("No candidate finished within the budget; raise --budget or lower --candidates.")
+    # every trial is a full CV evaluation of (params, n_estimators), so a low rung can win:
+    # on small data the extra trees of the later rungs often just overfit
+    best = min(search.trials, key=lambda t: t.logloss)
+    return TuneResult(best.params, best.logloss, best.accuracy, search.trials,
+                      time.perf_counter() - t0, search.out_of_budget)
+
+
+# ================================================================
+# 5. CLI
+# ================================================================
+def main(argv=None) -> TuneResult:
+    p = argparse.ArgumentParser(description="Hyperparameter search for the career model.")
+    p.add_argument("--config", help="TrainConfig JSON to start from (data path, encodings, tree_method ...)")
+    p.add_argument("--method", default="halving", choices=["halving", "random"])
+    p.add_argument("--candidates", type=int, default=27)
+    p.add_argument("--folds", type=int, default=5)
+    p.add_argument("--eta", type=int, default=3, help="halving: keep 1/eta per rung, eta x more trees")
+    p.add_argument("--budget", type=float, help="wall-clock seconds")
+    p.add_argument("--n-jobs", type=int, help="parallel fold fits (default: all cores)")
+    p.add_argument("--out", default=str(DEFAULT_OUT), help="TrainConfig JSON with the best parameters")
+    p.add_argument("--train", action="store_true", help="train + publish with the best parameters afterwards")
+    p.add_argument("--quiet", action="store_true")
+    args = p.parse_args(argv)
+
+    config = TrainConfig.load(args.config) if args.config else TrainConfig()
+    config.verbose = not args.quiet
+    result = tune(config, args.method, args.candidates, args.folds, args.budget, args.n_jobs, args.eta)
+
+    tuned = TrainConfig.load(args.config) if args.config else TrainConfig()
+    tuned.xgb_params = {**tuned.xgb_params, **result.best_params}
+    tuned.save(args.out, only=[*SAVED_FIELDS, *tuned.encoding_params()],
+               tuning={"method": args.method, "folds": args.folds, "cv_logloss": round(result.best_logloss, 5),
+                       "cv_accuracy": round(result.best_accuracy, 5), "trials": len(result.trials),
+                       "elapsed_seconds": round(result.elapsed, 1), "stopped_by_budget": result.stopped_by_budget})
+
+    print(f"🏆 Best (cv logloss {result.best_logloss:.4f}, acc {result.best_accuracy:.4f}): {result.best_params}")
+    print(f"⏱  {len(result.trials)} trials in {result.elapsed:.1f} s"
+          + (" (stopped by budget)" if result.stopped_by_budget else ""))
+    print(f"💾 Wrote {args.out}  →  python -m src.train_model --config {args.out}")
+
+    if args.train:
+        from src.train_model import train
+        tuned.verbose = config.verbose
+        train(tuned)
+    return result
+
+
+if __name__ == "__main__":
+    # run through the importable module so loky workers unpickle src.tune._evaluate, not __main__'s copy
+    from src.tune import main as _main
+    _main()
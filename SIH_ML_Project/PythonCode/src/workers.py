@@ -0,0 +1,151 @@
+# src/workers.py
+"""
+Multi-core inference: a pool of worker processes that share ONE loaded model.
+
+The parent loads every artifact (ArtifactStore.warm_up), freezes the GC so the
+loaded objects are never touched by collection, and then forks the workers.
+Each worker sees the model through copy-on-write pages instead of unpickling its
+own copy, so N workers cost roughly one model plus N small interpreters.
+
+Settings (env vars):
+    INFERENCE_WORKERS             worker processes; 0 = run inference in-process   (default: 0)
+    INFERENCE_THREADS_PER_WORKER  BLAS/OpenMP threads inside each worker           (default: 1)
+
+Needs the "fork" start method (Linux / macOS); from_env() returns None elsewhere.
+When the registry swaps the model (src/registry.py), the next call forks a fresh pool
+from the new store and retires the old one after its in-flight work finishes.
+"""
+
+import gc
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from src.artifacts import get_store
+
+
+# -------------------------------------------------------------
+# WORKER SIDE
+# -------------------------------------------------------------
+def _init_worker(threads: int, started) -> None:
+    # one core per worker: OpenMP (XGBoost) and BLAS must not oversubscribe
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(threads)
+    classifier = get_store().classifier
+    classifier.set_params(n_jobs=threads)
+    classifier.get_booster().set_param({"nthread": threads})
+    started.put(os.getpid())   # report in, so the parent knows every worker's pid
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+# -------------------------------------------------------------
+# POOL
+# -------------------------------------------------------------
+class InferencePool:
+    """
+    Fork-after-load process pool.
+
+        pool = InferencePool(4).start()
+        results = pool.run(predict_many, rows)           # one task on one worker
+        future = pool.submit(predict_many, rows)         # same, without waiting
+        results = pool.map_batches(predict_many, rows)   # split across all workers
+        pool.shutdown()
+
+    `fn` must be a module-level function (it is pickled by reference).
+    """
+
+    def __init__(self, n_workers: int, threads_per_worker: int = 1):
+        if "fork" not in mp.get_all_start_methods():
+            raise RuntimeError("InferencePool needs the 'fork' start method.")
+        self.n_workers = max(1, int(n_workers))
+        self.threads_per_worker = max(1, int(threads_per_worker))
+        self._executor = None
+        self._store = None
+        self._pids = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        n_workers = int(os.getenv("INFERENCE_WORKERS", "0"))
+        if n_workers <= 0 or "fork" not in mp.get_all_start_methods():
+            return None
+        return cls(n_workers, int(os.getenv("INFERENCE_THREADS_PER_WORKER", "1")))
+
+    # ---------------- lifecycle ----------------
+    def _fork(self, store):
+        """New executor for `store` with every worker forked and initialized; sets self._pids."""
+        store.warm_up()
+        gc.collect()
+        gc.freeze()   # keep the GC from writing to (and un-sharing) the model's pages
+        ctx = mp.get_context("fork")
+        started = ctx.SimpleQueue()
+        executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker, started)
+        )
+        # fork every worker now, while the parent is quiet, not on the first request
+        wait([executor.submit(_ping) for _ in range(self.n_workers)])
+        gc.unfreeze()
+        self._pids = sorted(started.get() for _ in range(self.n_workers))
+        started.close()
+        return executor
+
+    def start(self) -> "InferencePool":
+        with self._lock:
+            if self._executor is None:
+                self._store = get_store()
+                self._executor = self._fork(self._store)
+        return self
+
+    def _current_executor(self):
+        store = get_store()
+        with self._lock:
+            if self._executor is None:
+                self._store = store
+                self._executor = self._fork(store)
+            elif store is not self._store:
+                # model was hot-swapped: fork a new pool, let the old one drain
+                old = self._executor
+                self._store = store
+                self._executor = self._fork(store)
+                threading.Thread(target=old.shutdown, kwargs={"wait": True}, daemon=True).start()
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; with wait=True, in-flight tasks finish first."""
+        with self._lock:
+            executor, self._executor, self._store, self._pids = self._executor, None, None, []
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # ---------------- work ----------------
+    def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on one worker and return its result."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) on the pool; returns a concurrent.futures.Future."""
+        return self._current_executor().submit(fn, *args, **kwargs)
+
+    def map_batches(self, fn, items: list, **kwargs) -> list:
+        """Split `items` into one chunk per worker, run fn(chunk, **kwargs) in parallel, concatenate."""
+        if not items:
+            return []
+        executor = self._current_executor()
+        size = -(-len(items) // self.n_workers)
+        futures = [executor.submit(fn, items[i:i + size], **kwargs) for i in range(0, len(items), size)]
+        out = []
+        for f in futures:
+            out.extend(f.result())
+        return out
+
+    def pids(self) -> list:
+        """Pids of the current pool's workers, as reported by each worker at start-up."""
+        return list(self._pids)
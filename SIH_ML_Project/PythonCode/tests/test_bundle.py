@@ -0,0 +1,60 @@
+# tests/test_bundle.py
+"""
+Pickle-free inference bundle (src/bundle.py): export_bundle -> load_bundle must score like
+the fitted Pipeline, for multi-class and binary boosters and with early stopping.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+
+from src.bundle import export_bundle, load_bundle
+from src.encoders import build_preprocessor
+from src.predict import normalize_input_any, predict_lean, preprocess_many
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+
+@pytest.fixture(scope="module")
+def sample():
+    return pd.read_csv(DATA_PATH).head(400)
+
+
+def _fit(sample: pd.DataFrame, binary: bool, early_stopping: bool):
+    labels = sample[TARGET]
+    if binary:
+        labels = labels.where(labels == labels.iloc[0], "Other")
+    label_encoder = LabelEncoder().fit(labels)
+    y = label_encoder.transform(labels)
+
+    X = sample.drop(columns=[TARGET])
+    numeric = list(X.select_dtypes(include="number").columns)
+    pre = build_preprocessor(numeric, [c for c in X.columns if c not in numeric]).fit(X)
+    Xt = pre.transform(X)
+    clf = xgb.XGBClassifier(n_estimators=60, max_depth=3, learning_rate=0.5, n_jobs=1,
+                            early_stopping_rounds=3 if early_stopping else None)
+    fit_params = {"eval_set": [(Xt[300:], y[300:])], "verbose": False} if early_stopping else {}
+    clf.fit(Xt[:300], y[:300], **fit_params)
+    if early_stopping:
+        assert clf.best_iteration + 1 < clf.get_booster().num_boosted_rounds()
+    return Pipeline([("pre", pre), ("clf", clf)]), label_encoder
+
+
+@pytest.mark.parametrize("binary, early_stopping", [(False, False), (True, False), (False, True)])
+def test_bundle_scores_like_pipeline(sample, tmp_path, binary, early_stopping):
+    pipeline, label_encoder = _fit(sample, binary, early_stopping)
+    export_bundle(pipeline, label_encoder, tmp_path)
+    model = load_bundle(tmp_path)
+
+    rows = [normalize_input_any(r) for r in sample.drop(columns=[TARGET]).to_dict(orient="records")]
+    expected = pipeline.predict_proba(preprocess_many(rows))
+    probs = model.predict_proba(rows)
+    assert probs.shape == (len(rows), len(label_encoder.classes_))
+    np.testing.assert_allclose(probs, expected, rtol=0, atol=1e-6)
+
+    predicted = [r["prediction"] for r in predict_lean(rows, model=model)]
+    assert predicted == list(label_encoder.inverse_transform(expected.argmax(axis=1)))
@@ -0,0 +1,69 @@
+# tests/test_explain.py
+"""
+SHAP backends in src/explain.py: XGBoost native pred_contribs vs shap.TreeExplainer,
+on a tiny pipeline fitted here (the shipped models/ carry no shap_explainer.pkl).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+
+from src.encoders import build_preprocessor
+from src.explain import compute_contributions, get_shap_explanations_batch
+
+pytest.importorskip("shap")
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+ATOL = 1e-4  # both backends work in float32 margin space
+
+
+def _fit_tiny_pipeline(df: pd.DataFrame, y) -> Pipeline:
+    X = df.drop(columns=[TARGET])
+    numeric = list(X.select_dtypes(include="number").columns)
+    categorical = [c for c in X.columns if c not in numeric]
+    pipeline = Pipeline([
+        ("pre", build_preprocessor(numeric, categorical)),
+        ("clf", xgb.XGBClassifier(n_estimators=8, max_depth=3, n_jobs=1)),
+    ])
+    return pipeline.fit(X, y)
+
+
+@pytest.fixture(scope="module")
+def sample():
+    return pd.read_csv(DATA_PATH).head(300)
+
+
+@pytest.mark.parametrize("binary", [True, False])
+def test_native_matches_shap_backend(sample, binary):
+    labels = sample[TARGET]
+    if binary:
+        labels = labels.where(labels == labels.iloc[0], "Other")
+    y = LabelEncoder().fit_transform(labels)
+
+    pipeline = _fit_tiny_pipeline(sample, y)
+    X = pipeline.named_steps["pre"].transform(sample.drop(columns=[TARGET]))
+
+    native = compute_contributions(pipeline, X, backend="native")
+    reference = compute_contributions(pipeline, X, backend="shap")
+
+    assert native.shape == reference.shape
+    assert native.shape[1:] == X.shape
+    np.testing.assert_allclose(native, reference, atol=ATOL)
+
+
+def test_shap_backend_uses_given_pipeline(sample):
+    y = LabelEncoder().fit_transform(sample[TARGET])
+    pipeline = _fit_tiny_pipeline(sample, y)
+    X = pipeline.named_steps["pre"].transform(sample.drop(columns=[TARGET]).head(5))
+    predicted = pipeline.named_steps["clf"].predict(X)
+
+    native = get_shap_explanations_batch(pipeline, X, predicted, backend="native")
+    reference = get_shap_explanations_batch(pipeline, X, predicted, backend="shap")
+
+    for a, b in zip(native, reference):
+        assert [e["feature"] for e in a] == [e["feature"] for e in b]
+        np.testing.assert_allclose([e["impact"] for e in a], [e["impact"] for e in b], atol=ATOL)
@@ -0,0 +1,61 @@
+# tests/test_labeling.py
+"""
+Vectorized generate_careers must label every row exactly like the row-wise reference
+generate_career, on the shipped labeled CSV and on edge rows (missing frameworks, all-zero
+scores, semicolon-separated framework tokens).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.labeling import generate_career, generate_careers
+
+CSV_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+SCORE_COLS = [
+    "CGPA", "Data Structures And Algorithm Marks", "DBMS Marks", "Number of backlogs",
+    "Number of Reappears", "GitHub total repositories", "GitHub commits/month",
+    "Coding practice hours/week", "Aptitude score", "Attandance",
+]
+
+
+@pytest.fixture(scope="module")
+def shipped():
+    return pd.read_csv(CSV_PATH).drop(columns=[TARGET])
+
+
+def _rowwise(df: pd.DataFrame) -> list:
+    return [generate_career(r) for _, r in df.iterrows()]
+
+
+def test_matches_rowwise_on_shipped_csv(shipped):
+    assert generate_careers(shipped).tolist() == _rowwise(shipped)
+
+
+def test_matches_stored_labels():
+    df = pd.read_csv(CSV_PATH)
+    assert generate_careers(df.drop(columns=[TARGET])).tolist() == df[TARGET].tolist()
+
+
+def test_matches_rowwise_on_edge_rows(shipped):
+    base = shipped.iloc[0].to_dict()
+    zero = base | {c: 0 for c in SCORE_COLS}   # all-zero scores: the frameworks decide
+    rows = [
+        base | {"Experience with frameworks": np.nan},
+        base | {"Experience with frameworks": np.nan, "English proficiency": np.nan,
+                "Programming proficiency": np.nan},
+        zero | {"Experience with frameworks": np.nan},
+        zero | {"Experience with frameworks": ""},
+        zero | {"Experience with frameworks": "TensorFlow; PyTorch;scikit-learn"},
+        zero | {"Experience with frameworks": " Docker ;Kubernetes, ; AWS "},
+        zero | {"Experience with frameworks": "react;;node.js", "English proficiency": " EXCELLENT "},
+        zero | {"Experience with frameworks": "Pandas;Power BI"},
+        zero | {"Experience with frameworks": "Kali; ethical hacking"},
+        base | {"CGPA": "n/a", "Aptitude score": None},
+    ]
+    edge = pd.DataFrame(rows)
+    labels = generate_careers(edge).tolist()
+    assert labels == _rowwise(edge)
+    assert len(set(labels)) >= 5   # the edge rows reach most of the career rules
@@ -0,0 +1,77 @@
+# tests/test_missing_fields.py
+"""
+Train/serve parity for fields a request leaves out: after normalize_input_any, a missing
+field must encode exactly like a NaN in the training frame, on every serving path
+(pipeline 'pre' step, compiled RowEncoder, pickle-free LeanModel).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from src.bundle import LeanModel, compile_spec
+from src.encoders import build_preprocessor
+from src.predict import COLUMN_MAP, normalize_input_any, preprocess_many
+from src.preprocess import RowEncoder
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return pd.read_csv(DATA_PATH).drop(columns=[TARGET]).head(400)
+
+
+def _fit(frame: pd.DataFrame, **encoding):
+    numeric = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+    categorical = [c for c in frame.columns if c not in numeric]
+    return build_preprocessor(numeric, categorical, **encoding).fit(frame)
+
+
+def _dense(X) -> np.ndarray:
+    return X.toarray() if sparse.issparse(X) else np.asarray(X)
+
+
+def _serving_encodings(pre, request: dict) -> dict:
+    row = normalize_input_any(request)
+    lean = LeanModel(compile_spec(pre, classes=[]), booster=None)
+    return {
+        "pipeline": _dense(pre.transform(preprocess_many([row]))),
+        "row_encoder": _dense(RowEncoder(pre).encode(row)),
+        "lean_model": _dense(lean.encode_many([row])),
+    }
+
+
+@pytest.mark.parametrize("raw_field, encoding", [
+    ("Experience with frameworks", {}),
+    ("History of Reappear/Backlogs", {"text_encoding": "capped", "text_min_frequency": 2}),
+    ("History of Reappear/Backlogs", {"text_encoding": "hash", "text_n_buckets": 16}),
+])
+def test_missing_field_encodes_like_training_nan(frame, raw_field, encoding):
+    pre = _fit(frame, **encoding)
+
+    # a row that has the field in training, with the field blanked out
+    i = int(np.flatnonzero(frame[raw_field].notna())[0])
+    training_row = frame.iloc[[i]].copy()
+    training_row[raw_field] = np.nan
+    expected = _dense(pre.transform(training_row))
+
+    clean_field = next(c for c, r in COLUMN_MAP.items() if r == raw_field)
+    request = {c: frame.iloc[i][r] for c, r in COLUMN_MAP.items() if c != clean_field}
+
+    for path, encoded in _serving_encodings(pre, request).items():
+        np.testing.assert_array_equal(encoded, expected, err_msg=f"{path}: missing {raw_field}")
+
+
+@pytest.mark.parametrize("encoding", [{"text_encoding": "capped"}, {"text_encoding": "hash"}])
+def test_missing_text_sets_no_text_column(frame, encoding):
+    pre = _fit(frame, **encoding)
+    txt = pre.named_transformers_["txt"]
+    request = {c: frame.iloc[0][r] for c, r in COLUMN_MAP.items() if c != "History_of_Reappear_Backlogs"}
+
+    start = pre.output_indices_["txt"].start
+    width = len(txt.get_feature_names_out())
+    for path, encoded in _serving_encodings(pre, request).items():
+        assert not encoded[0, start:start + width].any(), f"{path}: missing text hit a text column"
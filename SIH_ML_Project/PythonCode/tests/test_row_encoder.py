@@ -0,0 +1,63 @@
+# tests/test_row_encoder.py
+"""
+RowEncoder (src/preprocess.py) must encode every row of the labeled CSV bit-for-bit like
+pipeline.named_steps["pre"].transform(preprocess_many(rows)): same CSR structure, same
+float64 bits. Covers the shipped pipeline and a multihot / capped pipeline fitted here.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from src.artifacts import get_store
+from src.encoders import build_preprocessor
+from src.predict import normalize_input_any
+from src.preprocess import build_row_encoder, preprocess_many
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return pd.read_csv(DATA_PATH).drop(columns=[TARGET])
+
+
+def _shipped(frame):
+    return get_store().preprocessor
+
+
+def _multihot_capped(frame):
+    X = frame.drop(columns=["Name"], errors="ignore")
+    numeric = list(X.select_dtypes(include="number").columns)
+    categorical = [c for c in X.columns if c not in numeric]
+    return build_preprocessor(numeric, categorical, frameworks_encoding="multihot",
+                              text_encoding="capped").fit(X)
+
+
+def _assert_same_csr(actual, expected):
+    expected = sparse.csr_matrix(expected)   # a fitted pipeline may emit dense output
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(actual.indptr, expected.indptr)
+    np.testing.assert_array_equal(actual.indices, expected.indices)
+    assert actual.data.dtype == expected.data.dtype
+    assert actual.data.tobytes() == expected.data.tobytes()
+
+
+@pytest.mark.parametrize("make_pre", [_shipped, _multihot_capped])
+def test_encode_many_matches_pipeline_on_labeled_csv(frame, make_pre):
+    pre = make_pre(frame)
+    encoder = build_row_encoder(pre)
+    assert encoder is not None
+
+    rows = [normalize_input_any(r) for r in frame.to_dict(orient="records")]
+    assert len(rows) == 2500
+    # one DataFrame for all rows: a 1-row frame with an all-NaN categorical column
+    # cannot go through the legacy OneHotEncoder
+    expected = pre.transform(preprocess_many(rows))
+
+    _assert_same_csr(encoder.encode_many(rows), expected)
+    expected = sparse.csr_matrix(expected)
+    for i in range(0, len(rows), 97):
+        _assert_same_csr(encoder.encode(rows[i]), expected[i])
@@ -0,0 +1,82 @@
+# tests/test_scorers.py
+"""
+PREDICT_SCORER=auto (Booster.inplace_predict) and PREDICT_SCORER=numpy (FlatForest) must
+return what XGBClassifier.predict_proba returns, including with early stopping
+(best_iteration); FlatForest within 1e-6 on the whole encoded labeled CSV.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+from scipy import sparse
+from sklearn.preprocessing import LabelEncoder
+
+from src.artifacts import get_store
+from src.encoders import build_preprocessor
+from src.forest import build_forest
+from src.predict import _inplace_proba
+
+DATA_PATH = "data/BTech_Student_Dataset_with_labels.csv"
+TARGET = "Recommended Career"
+
+
+@pytest.fixture(scope="module")
+def encoded():
+    df = pd.read_csv(DATA_PATH).head(400)
+    X = df.drop(columns=[TARGET])
+    numeric = list(X.select_dtypes(include="number").columns)
+    pre = build_preprocessor(numeric, [c for c in X.columns if c not in numeric])
+    return sparse.csr_matrix(pre.fit_transform(X)), df[TARGET]   # CSR, as served
+
+
+@pytest.mark.parametrize("binary", [True, False])
+@pytest.mark.parametrize("early_stopping", [True, False])
+def test_inplace_matches_predict_proba(encoded, binary, early_stopping):
+    X, labels = encoded
+    if binary:
+        labels = labels.where(labels == labels.iloc[0], "Other")
+    y = LabelEncoder().fit_transform(labels)
+
+    clf = xgb.XGBClassifier(n_estimators=30, max_depth=3, n_jobs=1,
+                            early_stopping_rounds=2 if early_stopping else None)
+    fit_params = {"eval_set": [(X[300:], y[300:])], "verbose": False} if early_stopping else {}
+    clf.fit(X[:300], y[:300], **fit_params)
+
+    np.testing.assert_allclose(_inplace_proba(clf, X), clf.predict_proba(X), atol=1e-7)
+
+
+@pytest.fixture(scope="module")
+def shipped_encoded():
+    store = get_store()
+    df = pd.read_csv(DATA_PATH).drop(columns=[TARGET, "Name"], errors="ignore")
+    return store.classifier, store.preprocessor.transform(df).tocsr()
+
+
+def test_forest_matches_shipped_classifier(shipped_encoded):
+    clf, X = shipped_encoded
+    forest = build_forest(clf.get_booster())
+    assert forest is not None
+    expected = clf.predict_proba(X)
+    np.testing.assert_allclose(forest.predict_proba(X), expected, rtol=0, atol=1e-6)
+
+
+def test_forest_stops_at_best_iteration(encoded):
+    X, labels = encoded
+    y = LabelEncoder().fit_transform(labels)
+    clf = xgb.XGBClassifier(n_estimators=200, max_depth=4, learning_rate=0.5, n_jobs=1,
+                            early_stopping_rounds=3)
+    clf.fit(X[:300], y[:300], eval_set=[(X[300:], y[300:])], verbose=False)
+    assert clf.best_iteration + 1 < clf.get_booster().num_boosted_rounds()   # truncated
+
+    forest = build_forest(clf.get_booster())
+    np.testing.assert_allclose(forest.predict_proba(X), clf.predict_proba(X), rtol=0, atol=1e-6)
+
+
+def test_unsupported_forest_is_reported(encoded, capsys):
+    X, labels = encoded
+    y = (labels == labels.iloc[0]).astype(int)
+    clf = xgb.XGBClassifier(n_estimators=5, max_depth=3, n_jobs=1).fit(X, y)   # binary:logistic
+
+    assert build_forest(clf.get_booster()) is None
+    assert "PREDICT_SCORER=numpy falls back" in capsys.readouterr().out